@@ -639,7 +639,9 @@ def main() -> None:
         # Initialize Maven Central client if requested
         package_metadata_client = None
         if args.maven_central_lookup or args.resolve_dependencies or args.extended_csv:
-            package_metadata_client = PackageMetadataClient(verbose=args.verbose)
+            package_metadata_client = PackageMetadataClient(
+                verbose=args.verbose, cache_dir=cache_dir
+            )
             log_msg = "Package metadata client initialized"
             _log_to_file(log_msg, log_file)
             if args.verbose:
@@ -1035,17 +1037,15 @@ def main() -> None:
             if args.verbose:
                 print(log_msg, file=sys.stderr)
             
-            output = formatter.format(
-                order,
-                components,
-                has_circular,
-                statistics,
-                args.include_metadata,
-                graph.graph if args.format == "csv" else None,
-                pom_downloader,
-                package_metadata_client,
-                dependency_resolver,
-            )
+            format_args = (order, components, has_circular, statistics, args.include_metadata)
+            if args.format == "csv":
+                # Only the CSV formatter takes the graph, POM and metadata arguments
+                format_args += (
+                    graph.graph,
+                    pom_downloader,
+                    package_metadata_client,
+                    dependency_resolver,
+                )
 
             # Write output: to output directory if -o set, else stdout
             if args.output:
@@ -1057,7 +1057,11 @@ def main() -> None:
                 if args.verbose:
                     print(log_msg, file=sys.stderr)
                 with open(output_path, "w", encoding="utf-8") as file:
-                    file.write(output)
+                    if args.format == "json":
+                        # Serialize straight into the file rather than via one big string
+                        formatter.format_to_stream(file, *format_args)
+                    else:
+                        file.write(formatter.format(*format_args))
                 log_msg = f"Output written successfully: {output_path}"
                 _log_to_file(log_msg, log_file)
                 if args.verbose:
@@ -1065,7 +1069,11 @@ def main() -> None:
             else:
                 log_msg = "Writing output to stdout"
                 _log_to_file(log_msg, log_file)
-                print(output)
+                if args.format == "json":
+                    formatter.format_to_stream(sys.stdout, *format_args)
+                    print()
+                else:
+                    print(formatter.format(*format_args))
 
         # Resolve dependencies and create extended CSV if requested
         # This happens AFTER compile-order.csv is created
@@ -1297,6 +1305,11 @@ def main() -> None:
                 if args.verbose:
                     print(log_msg, file=sys.stderr)
 
+        if package_downloader:
+            package_downloader.close()
+        if npm_downloader:
+            npm_downloader.close()
+
         # Log completion
         log_msg = "Processing completed successfully"
         _log_to_file(log_msg, log_file)
@@ -153,11 +153,13 @@ class DependencyResolver:
         """
         self.verbose = verbose
         self._last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
         try:
             self._rate_limit_delay = float(os.environ.get("SBOM_RATE_LIMIT_MVNREPO_SEC", "0.5"))
         except (TypeError, ValueError):
             self._rate_limit_delay = self.RATE_LIMIT_DELAY
         self._cache: Dict[str, List[Tuple[str, str, str]]] = {}
+        self._metadata_cache: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
         self._visited: Set[str] = set()
         self.extended_csv_path = extended_csv_path
         self._extended_csv_file = None
@@ -320,12 +322,17 @@ class DependencyResolver:
         """
         Enforce rate limiting between requests.
         Uses SBOM_RATE_LIMIT_MVNREPO_SEC env var if set (default 0.5).
+
+        Safe to call from several threads: each caller reserves the next request
+        slot under a lock and sleeps outside it, so concurrent lookups sharing one
+        resolver stay spaced by the configured delay.
         """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self._rate_limit_delay:
-            time.sleep(self._rate_limit_delay - time_since_last)
-        self._last_request_time = time.time()
+        with self._rate_limit_lock:
+            current_time = time.time()
+            wait = max(0.0, self._last_request_time + self._rate_limit_delay - current_time)
+            self._last_request_time = current_time + wait
+        if wait > 0:
+            time.sleep(wait)
 
     def _get_dependencies_page_url(
         self, group: str, artifact: str, version: str
@@ -419,6 +426,10 @@ class DependencyResolver:
         Returns:
             Tuple of (license_type, homepage_url), both may be None
         """
+        cache_key = f"{group}:{artifact}:{version}"
+        if cache_key in self._metadata_cache:
+            return self._metadata_cache[cache_key]
+
         url = f"{self.BASE_URL}/{group}/{artifact}/{version}"
         if self.verbose:
             print(
@@ -488,6 +499,7 @@ class DependencyResolver:
                     file=sys.stderr,
                 )
 
+            self._metadata_cache[cache_key] = (license_type, homepage_url)
             return license_type, homepage_url
         except Exception as exc:  # pylint: disable=broad-exception-caught
             if self.verbose:
@@ -9,6 +9,7 @@ import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -24,6 +25,10 @@ from sbom_compile_order.output import extract_repo_url
 # Allow CSV fields larger than default 128KB (e.g. long PURLs, dependency lists in SBOMs)
 csv.field_size_limit(sys.maxsize)
 
+# Repository URLs that get a .git suffix: github.com, gitlab.com and any other
+# host or path mentioning "git", or bitbucket.org; one case-insensitive scan
+_GIT_REPO_URL_HINT_RE = re.compile(r"git|bitbucket\.org", re.IGNORECASE)
+
 
 def _generate_cache_key(component: Component) -> str:
     """
@@ -35,16 +40,7 @@ def _generate_cache_key(component: Component) -> str:
     Returns:
         Cache key string suitable for filename
     """
-    identifier = component.get_identifier()
-    # Remove query parameters (everything after ?)
-    if "?" in identifier:
-        identifier = identifier.split("?")[0]
-    # Remove URL fragments (everything after #)
-    if "#" in identifier:
-        identifier = identifier.split("#")[0]
-    # Replace problematic characters for filename
-    cache_key = identifier.replace("/", "_").replace(":", "_").replace("@", "_")
-    return cache_key
+    return component.get_cache_key()
 
 
 def _check_file_on_disk(
@@ -80,10 +76,14 @@ def _check_file_on_disk(
     return None
 
 
+@lru_cache(maxsize=4096)
 def _normalize_npm_repo_url(url: str) -> str:
     """
     Normalize npm repository URL by removing git+ prefixes and converting to https://.
 
+    Results are memoized, like extract_repo_url's, since many packages share a
+    repository URL (monorepos, scoped package families).
+
     Handles formats like:
     - git+https://github.com/user/repo.git -> https://github.com/user/repo.git
     - git+ssh://git@github.com/user/repo.git -> https://github.com/user/repo.git
@@ -133,13 +133,12 @@ def _normalize_npm_repo_url(url: str) -> str:
             url = f"https://{url}"
 
     # Remove .git suffix if present (we'll add it back if needed for git clone)
-    if url.endswith(".git"):
-        url = url[:-4]
+    url = url.removesuffix(".git")
 
     # Add .git back for git clone compatibility
     if url and not url.endswith(".git"):
         # Only add .git if it looks like a git repository URL
-        if any(host in url.lower() for host in ["github.com", "gitlab.com", "bitbucket.org", "git"]):
+        if _GIT_REPO_URL_HINT_RE.search(url):
             url = f"{url}.git"
 
     return url
@@ -203,6 +202,72 @@ def _log_to_file(message: str, log_file: Path) -> None:
         print(f"Warning: Failed to write to log file {log_file}: {exc}", file=sys.stderr)
 
 
+def _prefetch_npm_metadata(
+    rows: List[List[str]],
+    metadata_client: PackageMetadataClient,
+    existing_enhanced_rows: Dict[str, List[str]],
+    incremental_update: bool,
+) -> int:
+    """
+    Warm the npm metadata cache for every npm row that will need a registry lookup.
+
+    Rows whose metadata is reused from an incremental update are skipped.
+
+    Returns:
+        Number of npm packages fetched successfully
+    """
+    components = []
+    for row in rows:
+        if len(row) < 5 or extract_package_type(row[4]) != "npm":
+            continue
+        existing_row_data = existing_enhanced_rows.get(f"{row[1]}:{row[2]}:{row[3]}")
+        if incremental_update and existing_row_data and len(existing_row_data) > 13:
+            continue
+        group_id_col = row[1]
+        artifact = row[2]
+        if ":" in group_id_col:
+            artifact = group_id_col.split(":", 1)[1] or row[2]
+        components.append(Component({"name": artifact, "version": row[3], "purl": row[4]}))
+    if not components:
+        return 0
+    return metadata_client.prefetch_npm_metadata(components)
+
+
+def _prefetch_maven_artifacts(rows: List[List[str]], package_downloader) -> int:
+    """
+    Download the JAR of every Maven row before the rows are processed.
+
+    download_packages resolves the batch with one Maven run (when Maven is
+    enabled) and fetches the rest concurrently over pooled connections, so
+    rows find their JAR in the cache instead of downloading it one at a time.
+
+    Returns:
+        Number of JARs available in the cache afterwards
+    """
+    items = []
+    for row in rows:
+        if len(row) < 5 or extract_package_type(row[4]) != "maven":
+            continue
+        group, _, artifact = row[1].partition(":")
+        artifact = artifact or row[2]
+        if not group or not artifact or not row[3]:
+            continue
+        component = Component(
+            {
+                "bom-ref": f"{group}:{artifact}:{row[3]}",
+                "group": group,
+                "name": artifact,
+                "version": row[3],
+                "purl": row[4],
+            }
+        )
+        items.append((component, "jar"))
+    if not items:
+        return 0
+    results = package_downloader.download_packages(items)
+    return sum(1 for filename, _ in results.values() if filename)
+
+
 def _process_one_row(
     idx: int,
     row: List[str],
@@ -345,7 +410,7 @@ def _process_one_row(
     if is_maven and comp.group and comp.name and comp.version:
         # First check if CSV says it was downloaded
         if existing_downloaded_status.lower() == "yes" and existing_file_location:
-            relative_path = existing_file_location.lstrip("./")
+            relative_path = existing_file_location.removeprefix("./")
             existing_file_path = compile_order_csv_path.parent / relative_path
             if existing_file_path.exists():
                 pom_filename = existing_file_path.name
@@ -375,7 +440,7 @@ def _process_one_row(
     if is_maven and comp.group and comp.name and comp.version:
         # First check if CSV says it was downloaded
         if existing_jar_downloaded_status.lower() == "yes" and existing_jar_file_location:
-            relative_path = existing_jar_file_location.lstrip("./")
+            relative_path = existing_jar_file_location.removeprefix("./")
             existing_jar_file_path = compile_order_csv_path.parent / relative_path
             if existing_jar_file_path.exists():
                 jar_filename = existing_jar_file_path.name
@@ -632,6 +697,24 @@ def create_enhanced_csv(
     if verbose:
         print(f"[INFO] {log_msg}", file=sys.stderr)
 
+    if metadata_client:
+        prefetched = _prefetch_npm_metadata(
+            rows, metadata_client, existing_enhanced_rows, incremental_update
+        )
+        if prefetched:
+            log_msg = f"Prefetched npm registry metadata for {prefetched} packages"
+            _log_to_file(log_msg, log_file)
+            if verbose:
+                print(f"[INFO] {log_msg}", file=sys.stderr)
+
+    if package_downloader:
+        prefetched = _prefetch_maven_artifacts(rows, package_downloader)
+        if prefetched:
+            log_msg = f"Prefetched {prefetched} JARs before processing rows"
+            _log_to_file(log_msg, log_file)
+            if verbose:
+                print(f"[INFO] {log_msg}", file=sys.stderr)
+
     # Write enhanced CSV incrementally (row by row) so it can be tailed
     # Open file and keep it open for incremental writing
     if incremental_update:
@@ -824,7 +907,6 @@ def create_enhanced_csv(
                     jar_url_maven = build_maven_central_url_from_purl(comp.purl, file_type="jar")
                 elif comp.group and comp.name and comp.version:
                     # Fallback: build URLs from coordinates if PURL not available
-                    from sbom_compile_order.parser import build_maven_central_url
                     pom_url_maven = build_maven_central_url(comp.group, comp.name, comp.version, "pom")
                     jar_url_maven = build_maven_central_url(comp.group, comp.name, comp.version, "jar")
     
@@ -863,7 +945,7 @@ def create_enhanced_csv(
                     and existing_downloaded_status.lower() == "yes"
                     and existing_file_location
                 ):
-                    relative_path = existing_file_location.lstrip("./")
+                    relative_path = existing_file_location.removeprefix("./")
                     existing_file_path = compile_order_csv_path.parent / relative_path
                     if existing_file_path.exists():
                         pom_filename = existing_file_path.name
@@ -909,7 +991,7 @@ def create_enhanced_csv(
                     and existing_jar_downloaded_status.lower() == "yes"
                     and existing_jar_file_location
                 ):
-                    relative_path = existing_jar_file_location.lstrip("./")
+                    relative_path = existing_jar_file_location.removeprefix("./")
                     existing_jar_file_path = compile_order_csv_path.parent / relative_path
                     if existing_jar_file_path.exists():
                         jar_filename = existing_jar_file_path.name
@@ -1208,7 +1290,14 @@ def create_enhanced_csv(
         pom_lock = threading.Lock()
         log_lock = threading.Lock()
         metadata_clients = (
-            [PackageMetadataClient(verbose=verbose) for _ in range(max_workers)]
+            [
+                PackageMetadataClient(
+                    verbose=verbose,
+                    cache_dir=metadata_client.cache_dir,
+                    npm_client=metadata_client.npm_client,
+                )
+                for _ in range(max_workers)
+            ]
             if metadata_client
             else [None] * max_workers
         )
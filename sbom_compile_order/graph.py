@@ -18,6 +18,10 @@ class DependencyGraph:
         """Initialize an empty dependency graph."""
         self.graph = nx.DiGraph()
         self.components: Dict[str, Component] = {}
+        # Cycles each node takes part in, raw and formatted for CSV output;
+        # enumerated once on first use and reset whenever the graph changes
+        self._cycles_by_node: Optional[Dict[str, List[List[str]]]] = None
+        self._cycle_strings_by_node: Dict[str, str] = {}
 
     def add_component(self, component: Component) -> None:
         """
@@ -29,6 +33,7 @@ class DependencyGraph:
         identifier = component.get_identifier()
         self.components[identifier] = component
         self.graph.add_node(identifier)
+        self._cycles_by_node = None
 
     def add_dependency(self, component_ref: str, dependency_ref: str) -> None:
         """
@@ -48,6 +53,7 @@ class DependencyGraph:
         # So we reverse: component depends on dependency means
         # dependency must come before component in compilation order
         self.graph.add_edge(dependency_ref, component_ref)
+        self._cycles_by_node = None
 
     def build_from_parser(
         self, components: Dict[str, Component], dependencies: Dict[str, List[str]]
@@ -185,17 +191,7 @@ class DependencyGraph:
         """
         if component_ref not in self.graph:
             return []
-
-        try:
-            # Get all simple cycles in the graph
-            all_cycles = list(nx.simple_cycles(self.graph))
-            # Filter to only cycles that include this component
-            component_cycles = [
-                cycle for cycle in all_cycles if component_ref in cycle
-            ]
-            return component_cycles
-        except Exception:  # pylint: disable=broad-exception-caught
-            return []
+        return list(self._index_cycles().get(component_ref, []))
 
     def format_cycles_for_component(self, component_ref: str) -> str:
         """
@@ -207,21 +203,46 @@ class DependencyGraph:
         Returns:
             String representation of cycles, or empty string if no cycles
         """
-        cycles = self.get_cycles_for_component(component_ref)
-        if not cycles:
+        if component_ref not in self.graph:
             return ""
+        self._index_cycles()
+        return self._cycle_strings_by_node.get(component_ref, "")
+
+    def _index_cycles(self) -> Dict[str, List[List[str]]]:
+        """
+        Enumerate the graph's cycles once and index them by node.
+
+        Each cycle is also rendered once as "comp1->comp2->comp3->comp1", and the
+        renderings joined with "; " per node, so per-component lookups are a
+        single dict access.
 
-        # Format cycles as: "cycle1_component1->cycle1_component2->...; cycle2_component1->..."
-        cycle_strings = []
-        for cycle in cycles:
-            # Create a cycle string: comp1->comp2->comp3->comp1
-            cycle_str = "->".join(cycle)
-            # Close the cycle by adding the first component at the end
-            if len(cycle) > 1:
-                cycle_str += f"->{cycle[0]}"
-            cycle_strings.append(cycle_str)
-
-        return "; ".join(cycle_strings)
+        Returns:
+            Mapping of node to the cycles it takes part in (nodes outside any
+            cycle are absent)
+        """
+        if self._cycles_by_node is not None:
+            return self._cycles_by_node
+
+        cycles_by_node: Dict[str, List[List[str]]] = {}
+        cycle_strings: Dict[str, List[str]] = {}
+        try:
+            for cycle in nx.simple_cycles(self.graph):
+                # Create a cycle string: comp1->comp2->comp3->comp1
+                cycle_str = "->".join(cycle)
+                # Close the cycle by adding the first component at the end
+                if len(cycle) > 1:
+                    cycle_str += f"->{cycle[0]}"
+                for node in cycle:
+                    cycles_by_node.setdefault(node, []).append(cycle)
+                    cycle_strings.setdefault(node, []).append(cycle_str)
+        except Exception:  # pylint: disable=broad-exception-caught
+            cycles_by_node, cycle_strings = {}, {}
+
+        self._cycles_by_node = cycles_by_node
+        self._cycle_strings_by_node = {
+            node: "; ".join(strings) for node, strings in cycle_strings.items()
+        }
+        return cycles_by_node
 
     def get_statistics(self) -> Dict:
         """
@@ -6,13 +6,18 @@ including homepage URLs and license information.
 """
 
 import json
-import time
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, Optional, Tuple
 from urllib.parse import quote
 from urllib.request import Request, urlopen
 
 from sbom_compile_order import __version__
-from sbom_compile_order.parser import Component
+from sbom_compile_order.parser import Component, extract_package_type
+from sbom_compile_order.rate_limiter import LeakyBucket, retry_with_backoff
+from sbom_compile_order.response_cache import SQLiteResponseCache
 
 
 class MavenCentralClient:
@@ -23,28 +28,99 @@ class MavenCentralClient:
     """
 
     BASE_URL = "https://search.maven.org/solrsearch/select"
-    RATE_LIMIT_DELAY = 0.1  # Delay between requests in seconds
+    RATE_LIMIT_PER_SEC = 10.0  # Sustained requests per second
+    RATE_LIMIT_BURST = 20  # Requests allowed back-to-back before throttling
+    CACHE_MAX_ENTRIES = 4096  # In-memory LRU bound; older entries stay in the SQLite tier
 
-    def __init__(self, verbose: bool = False) -> None:
+    def __init__(self, verbose: bool = False, cache_path: Optional[Path] = None) -> None:
         """
         Initialize the Maven Central client.
 
+        The client is picklable, so it can be passed to ProcessPoolExecutor workers.
+        Workers given the same ``cache_path`` share responses through SQLite.
+
         Args:
             verbose: Whether to print verbose output
+            cache_path: Optional SQLite file for a persistent, cross-process response cache
         """
         self.verbose = verbose
-        self._last_request_time = 0.0
-        self._cache: Dict[str, Dict] = {}
+        self.rate_limiter = LeakyBucket(self.RATE_LIMIT_PER_SEC, self.RATE_LIMIT_BURST)
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._persistent_cache = SQLiteResponseCache(cache_path) if cache_path else None
+
+    def __getstate__(self) -> Dict:
+        """Pickle without the cache lock, which is per-process."""
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore pickled state with a fresh cache lock."""
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def is_maven_candidate(component: Component) -> bool:
+        """
+        Cheap check for whether a component could be on Maven Central.
+
+        Lets callers skip npm, PyPI, etc. components before calling
+        get_package_info at all.
+
+        Args:
+            component: Component to check
+
+        Returns:
+            True if the PURL type is maven, or (without a PURL type) the
+            component has both a group and a name
+        """
+        package_type = extract_package_type(component.purl)
+        if package_type:
+            return package_type.lower() == "maven"
+        # No PURL: fall back to coordinates (groups like "junit" have no dot)
+        return bool(component.group and component.name)
 
     def _rate_limit(self) -> None:
         """
         Enforce rate limiting between requests.
+
+        Uses a per-client leaky bucket so Maven Central throttling is independent
+        of the npm registry budget.
         """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - time_since_last)
-        self._last_request_time = time.time()
+        self.rate_limiter.acquire()
+
+    def _cache_get(self, cache_key: str) -> Optional[Dict]:
+        """
+        Look up a response in the in-memory LRU cache, marking it recently used.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Cached response, or None if not cached
+        """
+        with self._cache_lock:
+            data = self._cache.get(cache_key)
+            if data is not None:
+                self._cache.move_to_end(cache_key)
+            return data
+
+    def _cache_put(self, cache_key: str, data: Dict) -> None:
+        """
+        Store a response in the in-memory LRU cache, evicting the oldest entries.
+
+        Args:
+            cache_key: Cache key
+            data: Response to store
+        """
+        # Metadata lookups run on several threads; the lock keeps insertion,
+        # reordering and eviction from interleaving
+        with self._cache_lock:
+            self._cache[cache_key] = data
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
 
     def _make_request(self, query: str, use_gav_core: bool = False) -> Optional[Dict]:
         """
@@ -61,8 +137,14 @@ class MavenCentralClient:
             JSON response as dictionary, or None if request fails
         """
         cache_key = f"{query}:{use_gav_core}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        if self._persistent_cache is not None:
+            cached = self._persistent_cache.get(cache_key)
+            if cached is not None:
+                self._cache_put(cache_key, cached)
+                return cached
 
         self._rate_limit()
 
@@ -78,18 +160,24 @@ class MavenCentralClient:
             if self.verbose:
                 print(
                     f"[DEBUG] Querying Maven Central API: {query}",
-                    file=__import__("sys").stderr,
+                    file=sys.stderr,
                 )
 
-            with urlopen(request, timeout=10) as response:
-                data = json.loads(response.read().decode("utf-8"))
-                self._cache[cache_key] = data
-                return data
+            def _fetch() -> Dict:
+                with urlopen(request, timeout=10) as response:
+                    return json.loads(response.read().decode("utf-8"))
+
+            # Retry transient failures (5xx, 429, connection resets) with backoff
+            data = retry_with_backoff(_fetch, self.rate_limiter)
+            self._cache_put(cache_key, data)
+            if self._persistent_cache is not None:
+                self._persistent_cache.set(cache_key, data)
+            return data
         except Exception as exc:  # pylint: disable=broad-exception-caught
             if self.verbose:
                 print(
                     f"Warning: Failed to query Maven Central for {query}: {exc}",
-                    file=__import__("sys").stderr,
+                    file=sys.stderr,
                 )
             return None
 
@@ -170,7 +258,7 @@ class MavenCentralClient:
                 print(
                     f"[DEBUG] Maven Central API returned metadata for "
                     f"{component.group}:{component.name}:{component.version}",
-                    file=__import__("sys").stderr,
+                    file=sys.stderr,
                 )
 
             return homepage_url, license_type
@@ -178,6 +266,6 @@ class MavenCentralClient:
             if self.verbose:
                 print(
                     f"Warning: Failed to parse Maven Central response: {exc}",
-                    file=__import__("sys").stderr,
+                    file=sys.stderr,
                 )
             return None, None
@@ -8,15 +8,27 @@ import io
 import os
 import sys
 import tarfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, TextIO, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
 from sbom_compile_order import __version__
 from sbom_compile_order.npm_registry import NpmRegistryClient
 from sbom_compile_order.parser import Component
+from sbom_compile_order.rate_limiter import retry_with_backoff
+
+# Prefer a SIMD-accelerated gzip implementation when installed (pip install
+# "sbom-compile-order[fast]"); both are drop-in replacements for stdlib gzip.
+try:
+    from isal import igzip as _gzip
+except ImportError:
+    try:
+        from zlib_ng import gzip_ng as _gzip
+    except ImportError:
+        import gzip as _gzip
 
 
 class NpmPackageDownloader:
@@ -37,11 +49,17 @@ class NpmPackageDownloader:
         self.npm_cache_dir.mkdir(parents=True, exist_ok=True)
         self.log_file = self.cache_dir / "sbom-compile-order.log"
         self.npm_client = NpmRegistryClient(verbose=verbose)
+        self._log_lock = threading.Lock()
+        self._log_fh: Optional[TextIO] = None
+        self._ensure_log_file()
 
     def _log(self, message: str) -> None:
         """
         Log a message to both stderr (if verbose) and log file.
 
+        The log file handle is opened once and kept line-buffered, so each
+        message costs a single write instead of stat/mkdir/open/close calls.
+
         Args:
             message: Message to log
         """
@@ -49,24 +67,31 @@ class NpmPackageDownloader:
         log_entry = f"{timestamp} {message}"
         if self.verbose:
             print(log_entry, file=sys.stderr)
-        log_path = self._ensure_log_file()
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(f"{log_entry}\n")
+        with self._log_lock:
+            if self._log_fh is None:
+                self._log_fh = open(self.log_file, "a", encoding="utf-8", buffering=1)
+            self._log_fh.write(f"{log_entry}\n")
 
     def _ensure_log_file(self) -> Path:
         """
-        Ensure the downloader has a log file path and that the file exists.
+        Ensure the log file's directory and the file itself exist.
+
+        Called once from ``__init__``; ``_log`` relies on it having run.
 
         Returns:
             Path to the log file.
         """
-        if not hasattr(self, "log_file") or not self.log_file:
-            self.log_file = self.cache_dir / "sbom-compile-order.log"
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
-        if not self.log_file.exists():
-            self.log_file.touch()
+        self.log_file.touch(exist_ok=True)
         return self.log_file
 
+    def close(self) -> None:
+        """Close the log file handle. Later log calls transparently reopen it."""
+        with self._log_lock:
+            if self._log_fh is not None:
+                self._log_fh.close()
+                self._log_fh = None
+
     def _get_tarball_url(self, component: Component) -> Optional[str]:
         """
         Get the tarball URL for an npm package from the registry.
@@ -94,6 +119,10 @@ class NpmPackageDownloader:
         """
         Validate that downloaded content is a valid tarball.
 
+        Only the gzip magic bytes and the first tar header are checked; walking
+        every member would decompress the whole archive just to cache it, and a
+        corrupt body surfaces later when the tarball is actually extracted.
+
         Args:
             tarball_content: Tarball file content as bytes
 
@@ -110,14 +139,20 @@ class NpmPackageDownloader:
         if tarball_content[:2] != b"\x1f\x8b":
             return False, f"Invalid gzip magic bytes: {tarball_content[:2]}"
 
-        # Try to open as tarfile to validate structure
+        # Try to open as tarfile to validate structure. Decompression goes through
+        # the fastest available gzip backend and tarfile reads it as a plain stream.
         try:
-            with tarfile.open(fileobj=io.BytesIO(tarball_content), mode="r:gz") as tar:
-                # Test that we can read the file list (validates tar structure)
-                tar.getnames()
+            with _gzip.GzipFile(fileobj=io.BytesIO(tarball_content)) as gz_file, tarfile.open(
+                fileobj=gz_file, mode="r|"
+            ) as tar:
+                # Decoding the first header only needs the first gzip block
+                if tar.next() is None:
+                    return False, "Tarball contains no entries"
                 return True, None
         except tarfile.TarError as exc:
             return False, f"Invalid tarball structure: {exc}"
+        except (OSError, EOFError) as exc:
+            return False, f"Invalid gzip stream: {exc}"
         except Exception as exc:  # pylint: disable=broad-exception-caught
             return False, f"Error validating tarball: {exc}"
 
@@ -134,16 +169,7 @@ class NpmPackageDownloader:
         if not component.name or not component.version:
             return None, False
 
-        # Create a cache key based on component identifier
-        identifier = component.get_identifier()
-        # Remove query parameters (everything after ?)
-        if "?" in identifier:
-            identifier = identifier.split("?")[0]
-        # Remove URL fragments (everything after #)
-        if "#" in identifier:
-            identifier = identifier.split("#")[0]
-        # Replace problematic characters for filename
-        cache_key = identifier.replace("/", "_").replace(":", "_").replace("@", "_")
+        cache_key = component.get_cache_key()
         cached_tarball = self.npm_cache_dir / f"{cache_key}.tgz"
 
         # Check if already cached
@@ -159,70 +185,81 @@ class NpmPackageDownloader:
 
         self._log(f"Downloading npm package from: {tarball_url}")
 
+        # Tarballs are served by the same registry host, so share its budget
+        self.npm_client.rate_limiter.acquire()
+
         try:
             req = Request(tarball_url)
             req.add_header("User-Agent", f"sbom-compile-order/{__version__}")
 
-            with urlopen(req, timeout=60) as response:
-                if response.getcode() == 200:
-                    tarball_content = response.read()
-                    tarball_size = len(tarball_content)
-
-                    # Check if content is empty
-                    if tarball_size == 0:
-                        self._log(
-                            f"[NPM DOWNLOAD] ERROR: Downloaded empty file from npm registry: "
-                            f"{component.name}@{component.version}"
+            def _fetch() -> Tuple[int, bytes]:
+                with urlopen(req, timeout=60) as response:
+                    return response.getcode(), response.read()
+
+            # Retry transient failures (5xx, 429, connection resets) with backoff
+            status, tarball_content = retry_with_backoff(_fetch, self.npm_client.rate_limiter)
+            if status == 200:
+                tarball_size = len(tarball_content)
+
+                # Check if content is empty
+                if tarball_size == 0:
+                    self._log(
+                        f"[NPM DOWNLOAD] ERROR: Downloaded empty file from npm registry: "
+                        f"{component.name}@{component.version}"
+                    )
+                    return None, False
+
+                # Validate tarball using tarfile module
+                is_valid, validation_error = self._validate_tarball(tarball_content)
+                if is_valid:
+                    # Ensure parent directory exists
+                    cached_tarball.parent.mkdir(parents=True, exist_ok=True)
+
+                    try:
+                        self._log(f"[NPM SAVE] Writing file to: {cached_tarball}")
+                        # Write beside the cache entry and rename it into place: a
+                        # crash never leaves a truncated tarball, without an fsync
+                        part_path = cached_tarball.with_name(
+                            f"{cached_tarball.name}.{os.getpid()}.{threading.get_ident()}.part"
                         )
-                        return None, False
-
-                    # Validate tarball using tarfile module
-                    is_valid, validation_error = self._validate_tarball(tarball_content)
-                    if is_valid:
-                        # Ensure parent directory exists
-                        cached_tarball.parent.mkdir(parents=True, exist_ok=True)
-
-                        try:
-                            self._log(f"[NPM SAVE] Writing file to: {cached_tarball}")
-                            with open(cached_tarball, "wb") as f:
-                                bytes_written = f.write(tarball_content)
-                                f.flush()
-                                os.fsync(f.fileno())
-                            self._log(f"[NPM SAVE] Wrote {bytes_written} bytes to {cached_tarball}")
-
-                            # Verify file was written
-                            if cached_tarball.exists():
-                                file_size = cached_tarball.stat().st_size
-                                if file_size == tarball_size:
-                                    self._log(
-                                        f"[NPM SAVE] SUCCESS: File verified on disk: {cached_tarball} ({file_size} bytes)"
-                                    )
-                                    self._log(
-                                        f"Cached npm package from registry: {cached_tarball.name} "
-                                        f"({component.name}@{component.version})"
-                                    )
-                                    return cached_tarball.name, False
-                                else:
-                                    self._log(
-                                        f"[NPM SAVE] ERROR: File size mismatch - expected {tarball_size} bytes, "
-                                        f"got {file_size} bytes: {cached_tarball}"
-                                    )
+                        with open(part_path, "wb") as f:
+                            bytes_written = f.write(tarball_content)
+                        os.replace(part_path, cached_tarball)
+                        self._log(f"[NPM SAVE] Wrote {bytes_written} bytes to {cached_tarball}")
+
+                        # Verify file was written
+                        if cached_tarball.exists():
+                            file_size = cached_tarball.stat().st_size
+                            if file_size == tarball_size:
+                                self._log(
+                                    f"[NPM SAVE] SUCCESS: File verified on disk: {cached_tarball} ({file_size} bytes)"
+                                )
+                                self._log(
+                                    f"Cached npm package from registry: {cached_tarball.name} "
+                                    f"({component.name}@{component.version})"
+                                )
+                                return cached_tarball.name, False
                             else:
                                 self._log(
-                                    f"[NPM SAVE] ERROR: File was not written to disk: {cached_tarball}"
+                                    f"[NPM SAVE] ERROR: File size mismatch - expected {tarball_size} bytes, "
+                                    f"got {file_size} bytes: {cached_tarball}"
                                 )
-                        except Exception as write_exc:  # pylint: disable=broad-exception-caught
+                        else:
                             self._log(
-                                f"[NPM SAVE] ERROR: Failed to write file: {write_exc} "
-                                f"for {component.name}@{component.version}"
+                                f"[NPM SAVE] ERROR: File was not written to disk: {cached_tarball}"
                             )
-                            return None, False
-                    else:
+                    except Exception as write_exc:  # pylint: disable=broad-exception-caught
                         self._log(
-                            f"[NPM DOWNLOAD] ERROR: Downloaded file is not a valid tarball: {validation_error} "
-                            f"for {component.name}@{component.version} "
-                            f"(size: {tarball_size} bytes)"
+                            f"[NPM SAVE] ERROR: Failed to write file: {write_exc} "
+                            f"for {component.name}@{component.version}"
                         )
+                        return None, False
+                else:
+                    self._log(
+                        f"[NPM DOWNLOAD] ERROR: Downloaded file is not a valid tarball: {validation_error} "
+                        f"for {component.name}@{component.version} "
+                        f"(size: {tarball_size} bytes)"
+                    )
         except HTTPError as exc:
             if exc.code in [401, 403]:
                 return None, True  # Auth required
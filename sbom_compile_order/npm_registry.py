@@ -4,76 +4,671 @@ npm registry client for fetching comprehensive package metadata.
 Used to provide homepage, license, dependencies, and other metadata for npm packages.
 """
 
+import gzip
 import json
+import re
+import string
+import sys
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote
 from urllib.request import Request, urlopen
 
 from sbom_compile_order import __version__
 from sbom_compile_order.parser import Component
+from sbom_compile_order.rate_limiter import LeakyBucket, retry_with_backoff
+from sbom_compile_order.response_cache import SQLiteResponseCache
+
+# orjson parses bytes directly and is several times faster than stdlib json on
+# multi-megabyte registry documents; use it when installed. Both raise
+# subclasses of json.JSONDecodeError on malformed input.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Brotli compresses registry documents better than gzip; advertise it only when
+# it can be decoded.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+_ACCEPT_ENCODING = "gzip, br" if brotli is not None else "gzip"
+
+# ijson parses incrementally, so very large documents can be reduced to the fields
+# in use without first building every historical version as Python objects.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# urllib3 keeps registry connections alive across requests, so fetch_many's
+# workers do not each pay a fresh TCP and TLS handshake per package.
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+
+# Fields read from the top level of a registry document and from each version entry.
+# Everything else (readme, time, maintainers, scripts, ...) is dropped before caching.
+_PACKAGE_FIELDS = ("homepage", "repository", "author", "description", "keywords", "bugs")
+_VERSION_FIELDS = (
+    "name",
+    "version",
+    "homepage",
+    "repository",
+    "license",
+    "author",
+    "description",
+    "dependencies",
+    "devDependencies",
+    "peerDependencies",
+    "optionalDependencies",
+    "keywords",
+    "bugs",
+    "dist",
+)
+
+
+def _decode_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    """
+    Undo the Content-Encoding of a response body (urllib does not do this itself).
+
+    Args:
+        body: Raw response body
+        content_encoding: Value of the Content-Encoding header, if any
+
+    Returns:
+        Decoded body
+    """
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(body)
+    return body
+
+
+def _read_json_value(events: Iterator, build: bool, first: Optional[Tuple] = None) -> object:
+    """
+    Consume one JSON value from an ijson ``basic_parse`` event stream.
+
+    Args:
+        events: Event iterator positioned at the start of a value
+        build: If True, build and return the value; otherwise just skip it
+        first: First event of the value, if already taken from the iterator
+
+    Returns:
+        The value when ``build`` is True (or it is a scalar), else None
+    """
+    event, value = first or next(events)
+    if event not in ("start_map", "start_array"):
+        return value
+    builder = ijson.ObjectBuilder() if build else None
+    depth = 0
+    while True:
+        if builder is not None:
+            builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                return builder.value if builder is not None else None
+        event, value = next(events)
+
+
+def _stream_project_metadata(stream: BinaryIO) -> Dict:
+    """
+    Equivalent of ``_project_metadata`` that parses the document incrementally.
+
+    Only the retained fields are ever built, so peak memory is bounded by the
+    projected result rather than the full document.
+
+    Args:
+        stream: Binary file-like object with the (decoded) registry document
+
+    Returns:
+        Projected metadata, as ``_project_metadata`` would return
+
+    Raises:
+        ValueError: If the document is malformed or truncated
+    """
+    events = ijson.basic_parse(stream, use_float=True)
+    projected: Dict = {}
+    versions: Dict = {}
+    try:
+        if next(events)[0] != "start_map":
+            return {}
+        for event, key in events:
+            if event == "end_map":
+                break
+            if key == "versions":
+                first = next(events)
+                if first[0] != "start_map":
+                    _read_json_value(events, False, first)
+                    continue
+                for event, version in events:
+                    if event == "end_map":
+                        break
+                    first = next(events)
+                    if first[0] != "start_map":
+                        _read_json_value(events, False, first)
+                        continue
+                    manifest = {}
+                    for event, field in events:
+                        if event == "end_map":
+                            break
+                        keep = field in _VERSION_FIELDS
+                        value = _read_json_value(events, keep)
+                        if keep:
+                            manifest[field] = value
+                    versions[version] = manifest
+            elif key in _PACKAGE_FIELDS or key == "dist-tags":
+                projected[key] = _read_json_value(events, True)
+            else:
+                _read_json_value(events, False)
+    except (ijson.JSONError, StopIteration) as exc:
+        raise ValueError(f"Malformed registry document: {exc}") from exc
+    projected["dist-tags"] = projected.get("dist-tags") or {}
+    projected["versions"] = versions
+    return projected
+
+
+# Strips an optional "git+" prefix and ".git" suffix from repository URLs in one pass
+_REPO_URL_RE = re.compile(r"^(?:git\+)?(.*?)(?:\.git)?$", re.DOTALL)
+
+# Characters npm permits in package names; "/" only appears in scoped names
+_NAME_SAFE_CHARS = frozenset(string.ascii_lowercase + string.digits + "-._~@/")
+
+
+@lru_cache(maxsize=4096)
+def _encode_package_name(package_name: str) -> str:
+    """
+    Encode a package name for use as a registry URL path segment.
+
+    Valid npm names only need the scope separator escaped ("@scope%2Fname"),
+    so the general-purpose ``quote`` is reserved for unusual input.
+
+    Args:
+        package_name: Name of the npm package
+
+    Returns:
+        URL-safe path segment
+    """
+    if package_name.isascii() and _NAME_SAFE_CHARS.issuperset(package_name):
+        return package_name.replace("/", "%2F")
+    return quote(package_name, safe="@")
+
+
+def _project_version(manifest: Dict) -> Dict:
+    """
+    Reduce a single version manifest to the fields this client reads.
+
+    Args:
+        manifest: Parsed version manifest
+
+    Returns:
+        Dictionary restricted to ``_VERSION_FIELDS``
+    """
+    if not isinstance(manifest, dict):
+        return {}
+    return {key: manifest[key] for key in _VERSION_FIELDS if key in manifest}
+
+
+def _project_metadata(document: Dict) -> Dict:
+    """
+    Reduce a full registry document to the fields this client reads.
+
+    Popular packages have documents of several megabytes (every historical
+    version plus the readme); caching only the consumed fields keeps the
+    per-package footprint small.
+
+    Args:
+        document: Parsed registry document
+
+    Returns:
+        Dictionary with the same shape, restricted to the fields in use
+    """
+    if not isinstance(document, dict):
+        return {}
+    projected = {key: document[key] for key in _PACKAGE_FIELDS if key in document}
+    projected["dist-tags"] = document.get("dist-tags") or {}
+    versions = document.get("versions") or {}
+    projected["versions"] = {
+        version: _project_version(data)
+        for version, data in versions.items()
+        if isinstance(data, dict)
+    }
+    return projected
 
 
 class NpmRegistryClient:
     """Client for retrieving npm package metadata from the public registry."""
 
     BASE_URL = "https://registry.npmjs.org"
-    RATE_LIMIT_DELAY = 0.1  # seconds between requests
-
-    def __init__(self, verbose: bool = False) -> None:
+    RATE_LIMIT_PER_SEC = 30.0  # sustained requests per second
+    RATE_LIMIT_BURST = 60  # requests allowed back-to-back before throttling
+    FETCH_MANY_WORKERS = 16  # concurrent requests used by fetch_many
+    CACHE_MAX_ENTRIES = 4096  # In-memory LRU bound; older entries stay in the SQLite tier
+    CACHE_TTL_SECONDS = 24 * 60 * 60  # Persistent entries older than this are revalidated
+    # Abbreviated ("corgi") install metadata: versions carry dependencies and dist
+    # but no readme, homepage, repository or license, so it is used for
+    # dependency lookups only.
+    ABBREVIATED_ACCEPT = "application/vnd.npm.install-v1+json"
+    # Full documents larger than this (Content-Length, bytes) are parsed
+    # incrementally when ijson is installed
+    STREAM_PARSE_THRESHOLD = 2 * 1024 * 1024
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        parser: Optional[Callable[[bytes], Dict]] = None,
+        cache_path: Optional[Path] = None,
+        cache_ttl: float = CACHE_TTL_SECONDS,
+    ) -> None:
         """
         Args:
             verbose: If True, prints request activity to stderr.
+            parser: Optional callable turning a raw response body into a dict,
+                e.g. a bound method wrapping a reused ``simdjson.Parser``.
+                Defaults to orjson when installed, else the stdlib json module.
+            cache_path: Optional SQLite file for a persistent response cache shared
+                across runs and processes.
+            cache_ttl: Seconds a persistent entry is served without contacting the
+                registry; stale entries are revalidated with their ETag.
         """
         self.verbose = verbose
-        self._last_request_time = 0.0
-        self._cache: Dict[str, Dict] = {}
+        self._parse = parser or _json_loads
+        self.rate_limiter = LeakyBucket(self.RATE_LIMIT_PER_SEC, self.RATE_LIMIT_BURST)
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._persistent_cache = SQLiteResponseCache(cache_path) if cache_path else None
+        self.cache_ttl = cache_ttl
+        self._headers = {
+            "User-Agent": f"sbom-compile-order/{__version__}",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+        }
+        self._cache_lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._http = self._new_http_pool()
+
+    def __getstate__(self) -> Dict:
+        """Pickle without the lock, in-flight requests and pool, which are per-process."""
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        del state["_in_flight"]
+        del state["_http"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore pickled state with a fresh lock and connection pool."""
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+        self._in_flight = {}
+        self._http = self._new_http_pool()
+
+    def _new_http_pool(self) -> Optional["urllib3.PoolManager"]:
+        """
+        Create the keep-alive connection pool, or None when urllib3 is not installed.
+
+        Failed requests are retried by retry_with_backoff, which also slows the
+        rate limiter down on throttling, so the pool itself only follows redirects.
+        """
+        if urllib3 is None:
+            return None
+        return urllib3.PoolManager(
+            num_pools=2,
+            maxsize=self.FETCH_MANY_WORKERS,
+            retries=urllib3.Retry(total=None, connect=0, read=0, other=0, status=0, redirect=5),
+        )
+
+    @contextmanager
+    def _open_url(self, url: str, headers: Dict[str, str]) -> Iterator:
+        """
+        Open a registry URL, reusing pooled connections when urllib3 is available.
+
+        Both code paths yield an undecoded response exposing ``headers`` and
+        ``read()``, raise HTTPError for non-2xx responses (including 304) and
+        raise URLError for connection failures, so retries and callers treat
+        them alike.
+
+        Args:
+            url: Registry URL to fetch
+            headers: Request headers
+
+        Yields:
+            HTTP response object
+        """
+        if self._http is None:
+            with urlopen(Request(url, headers=headers), timeout=15) as response:
+                yield response
+            return
+
+        try:
+            response = self._http.request(
+                "GET",
+                url,
+                headers=headers,
+                timeout=urllib3.Timeout(connect=5, read=15),
+                preload_content=False,
+                # Bodies are decoded by _decode_body, as on the urlopen path
+                decode_content=False,
+            )
+        except urllib3.exceptions.HTTPError as exc:
+            raise URLError(exc) from exc
+        try:
+            if response.status >= 300:
+                # Read the (small) error body so the connection can be reused
+                response.drain_conn()
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            yield response
+        except urllib3.exceptions.HTTPError as exc:
+            raise URLError(exc) from exc
+        finally:
+            response.release_conn()
 
     def _rate_limit(self) -> None:
-        """Sleep briefly to respect rate limits."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+        """Wait on the npm registry's own leaky bucket to respect rate limits."""
+        self.rate_limiter.acquire()
 
     def _log(self, message: str) -> None:
         """Log a message if verbose mode is enabled."""
         if self.verbose:
-            print(message, file=__import__("sys").stderr)
+            print(message, file=sys.stderr)
 
     def _build_url(self, package_name: str) -> str:
         """Build the npm registry URL for a package."""
-        encoded = quote(package_name, safe="")
-        return f"{self.BASE_URL}/{encoded}"
+        return f"{self.BASE_URL}/{_encode_package_name(package_name)}"
+
+    def _fetch_package_data(self, package_name: str, abbreviated: bool = False) -> Optional[Dict]:
+        """
+        Fetch package metadata from npm registry.
+
+        Safe to call from several threads: results are cached under a lock and
+        concurrent callers asking for the same package share a single request.
+
+        Args:
+            package_name: Name of the npm package
+            abbreviated: If True, request the much smaller install metadata document
+                (dependencies and dist only). An already cached full document is
+                returned instead, since it is a superset.
+
+        Returns:
+            Package metadata dictionary restricted to the fields this client reads
+            (see ``_project_metadata``), or None if fetch fails
+        """
+        if abbreviated:
+            with self._cache_lock:
+                cached = self._cache_get(package_name)
+            if cached is not None:
+                return cached
+            return self._fetch_cached(
+                f"{package_name}#abbreviated",
+                lambda: self._download_package_data(package_name, abbreviated=True),
+            )
+        return self._fetch_cached(package_name, lambda: self._download_package_data(package_name))
+
+    def _fetch_version_data(self, package_name: str, version: str) -> Optional[Dict]:
+        """
+        Fetch the manifest of a single package version.
+
+        ``GET /<package>/<version>`` returns one version's manifest, a few KB
+        instead of a document listing every published version.
+
+        Args:
+            package_name: Name of the npm package
+            version: Exact version (or dist-tag) to fetch
+
+        Returns:
+            Version manifest restricted to the fields this client reads, or None
+            if the request fails
+        """
+        return self._fetch_cached(
+            f"{package_name}@{version}",
+            lambda: self._download_version_data(package_name, version),
+        )
+
+    def _fetch_cached(
+        self, cache_key: str, download: Callable[[], Optional[Dict]]
+    ) -> Optional[Dict]:
+        """
+        Return a cached document, or download it once on behalf of all concurrent callers.
+
+        Args:
+            cache_key: Key of the document in the in-memory cache
+            download: Callable performing the download on a cache miss
+
+        Returns:
+            Cached or downloaded document, or None if the download fails
+        """
+        with self._cache_lock:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            in_flight = self._in_flight.get(cache_key)
+            if in_flight is None:
+                in_flight = Future()
+                self._in_flight[cache_key] = in_flight
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            return in_flight.result()
+
+        payload = None
+        try:
+            payload = download()
+        finally:
+            with self._cache_lock:
+                if payload is not None:
+                    self._cache_put(cache_key, payload)
+                del self._in_flight[cache_key]
+            in_flight.set_result(payload)
+        return payload
+
+    def _cache_get(self, package_name: str) -> Optional[Dict]:
+        """
+        Look up metadata in the in-memory LRU cache, marking it recently used.
+
+        Callers must hold ``_cache_lock``.
+
+        Args:
+            package_name: Name of the npm package
+
+        Returns:
+            Cached metadata, or None if not cached
+        """
+        try:
+            data = self._cache[package_name]
+            self._cache.move_to_end(package_name)
+        except KeyError:
+            return None
+        return data
+
+    def _cache_put(self, package_name: str, data: Dict) -> None:
+        """
+        Store metadata in the in-memory LRU cache, evicting the oldest entries.
+
+        Callers must hold ``_cache_lock``.
+
+        Args:
+            package_name: Name of the npm package
+            data: Metadata to store
+        """
+        self._cache[package_name] = data
+        self._cache.move_to_end(package_name)
+        while len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    def _download_package_data(
+        self, package_name: str, abbreviated: bool = False
+    ) -> Optional[Dict]:
+        """
+        Load package metadata from the persistent cache or the registry.
+
+        Args:
+            package_name: Name of the npm package
+            abbreviated: If True, request the abbreviated install metadata document
 
-    def _fetch_package_data(self, package_name: str) -> Optional[Dict]:
+        Returns:
+            Projected package metadata, or None if the request fails
         """
-        Fetch full package metadata from npm registry.
+        return self._download(
+            f"{package_name}#abbreviated" if abbreviated else package_name,
+            self._build_url(package_name),
+            _project_metadata,
+            accept=self.ABBREVIATED_ACCEPT if abbreviated else None,
+        )
+
+    def _download_version_data(self, package_name: str, version: str) -> Optional[Dict]:
+        """
+        Load a single version manifest from the persistent cache or the registry.
 
         Args:
             package_name: Name of the npm package
+            version: Exact version (or dist-tag) to fetch
+
+        Returns:
+            Projected version manifest, or None if the request fails
+        """
+        return self._download(
+            f"{package_name}@{version}",
+            f"{self._build_url(package_name)}/{quote(version, safe='')}",
+            _project_version,
+        )
+
+    def _download(
+        self,
+        cache_key: str,
+        url: str,
+        project: Callable[[Dict], Dict],
+        accept: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """
+        Load a registry document from the persistent cache or the network.
+
+        Fresh persistent entries are returned without a request. Stale entries
+        are revalidated with ``If-None-Match``; an HTTP 304 reuses the stored
+        metadata and restarts its TTL.
+
+        Args:
+            cache_key: Key of the document in the persistent cache
+            url: Registry URL to request
+            project: Reduces the parsed document to the fields this client reads
+            accept: Optional Accept header value
 
         Returns:
-            Full package metadata dictionary, or None if fetch fails
+            Projected document, or None if the request fails
         """
-        if package_name in self._cache:
-            return self._cache[package_name]
+        entry = self._persistent_cache.get(cache_key) if self._persistent_cache else None
+        if entry is not None and time.time() - entry.get("fetched_at", 0) < self.cache_ttl:
+            return entry.get("data")
 
         self._rate_limit()
-        url = self._build_url(package_name)
-        request = Request(url)
-        request.add_header("User-Agent", f"sbom-compile-order/{__version__}")
+        headers = self._headers
+        if accept or (entry is not None and entry.get("etag")):
+            headers = dict(headers)
+            if accept:
+                headers["Accept"] = accept
+            if entry is not None and entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+
+        def _fetch() -> Tuple[Optional[str], Dict]:
+            with self._open_url(url, headers) as response:
+                stream = self._large_document_stream(response, project)
+                if stream is not None:
+                    document = _stream_project_metadata(stream)
+                else:
+                    encoding = response.headers.get("Content-Encoding")
+                    document = project(self._parse(_decode_body(response.read(), encoding)))
+                return response.headers.get("ETag"), document
 
         try:
-            with urlopen(request, timeout=15) as response:
-                payload = json.loads(response.read().decode("utf-8"))
-                self._cache[package_name] = payload
-                return payload
-        except (HTTPError, URLError, json.JSONDecodeError) as exc:
-            self._log(f"[npm] Failed to fetch metadata for {package_name}: {exc}")
+            # Retry transient failures; 429/503 also slow the shared rate limiter down
+            etag, data = retry_with_backoff(_fetch, self.rate_limiter)
+        except HTTPError as exc:
+            if exc.code == 304 and entry is not None:
+                self._log(f"[npm] Metadata for {cache_key} not modified")
+                self._store_persistent(cache_key, entry.get("data"), entry.get("etag"))
+                return entry.get("data")
+            self._log(f"[npm] Failed to fetch metadata for {cache_key}: {exc}")
             return None
+        except (OSError, EOFError, ValueError, zlib.error) as exc:
+            self._log(f"[npm] Failed to fetch metadata for {cache_key}: {exc}")
+            return None
+
+        self._store_persistent(cache_key, data, etag)
+        return data
+
+    def _large_document_stream(
+        self, response: BinaryIO, project: Callable[[Dict], Dict]
+    ) -> Optional[BinaryIO]:
+        """
+        Decide whether a response should be parsed incrementally.
+
+        Args:
+            response: Open HTTP response
+            project: Projection the caller will apply to the parsed document
+
+        Returns:
+            Decoded binary stream to parse with ijson, or None to parse in one go
+        """
+        if ijson is None or project is not _project_metadata:
+            return None
+        try:
+            content_length = int(response.headers.get("Content-Length") or 0)
+        except ValueError:
+            return None
+        if content_length <= self.STREAM_PARSE_THRESHOLD:
+            return None
+        encoding = (response.headers.get("Content-Encoding") or "").strip().lower()
+        if encoding == "gzip":
+            return gzip.GzipFile(fileobj=response)
+        if encoding in ("", "identity"):
+            return response
+        return None
+
+    def _store_persistent(self, cache_key: str, data: Optional[Dict], etag: Optional[str]) -> None:
+        """Write metadata and its ETag to the persistent cache, if one is configured."""
+        if self._persistent_cache is None or data is None:
+            return
+        self._persistent_cache.set(
+            cache_key, {"etag": etag, "fetched_at": time.time(), "data": data}
+        )
+
+    def fetch_many(
+        self, package_names: Iterable[str], max_workers: int = FETCH_MANY_WORKERS
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch metadata for many packages concurrently and populate the cache.
+
+        Requests still pass through the client's rate limiter, so concurrency
+        hides round-trip latency without exceeding the registry budget.
+
+        Args:
+            package_names: Package names to fetch (duplicates and blanks are ignored)
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dictionary mapping package name to metadata (None for failed fetches)
+        """
+        unique_names = list(dict.fromkeys(name for name in package_names if name))
+        if not unique_names:
+            return {}
+        workers = max(1, min(max_workers, len(unique_names)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique_names, executor.map(self._fetch_package_data, unique_names)))
 
     def _extract_version_data(self, metadata: Dict, version: Optional[str]) -> Optional[Dict]:
         """
@@ -86,30 +681,58 @@ class NpmRegistryClient:
         Returns:
             Version-specific data dictionary, or None if not found
         """
-        if version and version in metadata.get("versions", {}):
-            return metadata["versions"][version]
+        versions = metadata.get("versions")
+        if not versions:
+            return None
 
-        dist_tags = metadata.get("dist-tags", {})
-        latest_version = dist_tags.get("latest")
-        if latest_version and latest_version in metadata.get("versions", {}):
-            return metadata["versions"][latest_version]
+        version_data = versions.get(version) if version else None
+        if version_data is not None:
+            return version_data
 
-        return None
+        latest_version = (metadata.get("dist-tags") or {}).get("latest")
+        return versions.get(latest_version) if latest_version else None
+
+    def _resolve_version_data(
+        self, package_name: str, version: Optional[str]
+    ) -> Tuple[Dict, Optional[Dict]]:
+        """
+        Find the package-level and version-level metadata for a component.
+
+        With a version, the single-version manifest endpoint is used unless the
+        full document is already cached. Scoped packages, missing versions and
+        failed version lookups fall back to the full document.
+
+        Args:
+            package_name: Name of the npm package
+            version: Requested version, or None for latest
+
+        Returns:
+            Tuple of (package metadata, version data). For a version manifest
+            both entries are the manifest, which carries the package-level fields.
+        """
+        if version and not package_name.startswith("@"):
+            with self._cache_lock:
+                full_cached = package_name in self._cache
+            if not full_cached:
+                version_data = self._fetch_version_data(package_name, version)
+                if version_data:
+                    return version_data, version_data
+
+        metadata = self._fetch_package_data(package_name)
+        if not metadata:
+            return {}, None
+        return metadata, self._extract_version_data(metadata, version)
 
     def _normalize_repo_url(self, url: str) -> str:
         """Normalize repository URL by removing git+ prefix and .git suffix."""
         if not url:
             return ""
-        url = url.strip()
-        if url.startswith("git+"):
-            url = url[4:]
-        if url.endswith(".git"):
-            url = url[: -4]
-        return url
+        return _REPO_URL_RE.match(url.strip()).group(1)
 
     def _extract_license(self, license_value: Optional[object]) -> Optional[str]:
         """Extract license string from various license formats."""
-        if isinstance(license_value, str):
+        # Parsed JSON yields plain str/dict, so an exact type check suffices
+        if type(license_value) is str:  # pylint: disable=unidiomatic-typecheck
             return license_value.strip()
         if isinstance(license_value, dict):
             return (
@@ -133,11 +756,7 @@ class NpmRegistryClient:
         if not package_name:
             return None, None
 
-        metadata = self._fetch_package_data(package_name)
-        if not metadata:
-            return None, None
-
-        version_data = self._extract_version_data(metadata, component.version)
+        metadata, version_data = self._resolve_version_data(package_name, component.version)
         if not version_data:
             return None, None
 
@@ -183,11 +802,7 @@ class NpmRegistryClient:
         if not package_name:
             return None
 
-        metadata = self._fetch_package_data(package_name)
-        if not metadata:
-            return None
-
-        version_data = self._extract_version_data(metadata, component.version)
+        metadata, version_data = self._resolve_version_data(package_name, component.version)
         if not version_data:
             return None
 
@@ -278,24 +893,33 @@ class NpmRegistryClient:
             List of tuples (package_name, version_spec) for all dependencies.
             Includes runtime, peer, and optional dependencies (but not devDependencies).
         """
-        package_data = self.get_comprehensive_package_data(component)
+        package_name = component.name or ""
+        if not package_name:
+            return []
+
+        # Dependency lists are all in the abbreviated document, a fraction of the full size
+        metadata = self._fetch_package_data(package_name, abbreviated=True)
+        if not metadata:
+            return []
+
+        package_data = self._extract_version_data(metadata, component.version)
         if not package_data:
             return []
 
         dependencies: List[Tuple[str, str]] = []
 
         # Add runtime dependencies
-        deps = package_data.get("dependencies", {})
+        deps = package_data.get("dependencies") or {}
         for dep_name, dep_version in deps.items():
             dependencies.append((dep_name, dep_version))
 
         # Add peer dependencies
-        peer_deps = package_data.get("peerDependencies", {})
+        peer_deps = package_data.get("peerDependencies") or {}
         for dep_name, dep_version in peer_deps.items():
             dependencies.append((dep_name, dep_version))
 
         # Add optional dependencies
-        optional_deps = package_data.get("optionalDependencies", {})
+        optional_deps = package_data.get("optionalDependencies") or {}
         for dep_name, dep_version in optional_deps.items():
             dependencies.append((dep_name, dep_version))
 
@@ -10,26 +10,227 @@ import json
 import os
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
 # Allow CSV fields larger than default 128KB (e.g. long PURLs, dependency lists in SBOMs)
 csv.field_size_limit(sys.maxsize)
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 from urllib.parse import urlparse, parse_qs
 
+import networkx as nx
+
 from sbom_compile_order.package_metadata import PackageMetadataClient
 from sbom_compile_order.parser import Component, extract_package_type
 
-if TYPE_CHECKING:
-    import networkx as nx
+# orjson serializes several times faster than stdlib json; use it when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Heading emitted at the top of TextFormatter output
+_TEXT_BANNER = ("=" * 80, "Compilation Order", "=" * 80)
+
+# Threads used to look up remote metadata for CSV rows ahead of the row loop
+_LOOKUP_WORKERS = 16
+
+# Component fields emitted by JSONFormatter, in output order
+_JSON_COMPONENT_FIELDS = ("ref", "group", "name", "version", "purl", "type", "scope")
+
+# Columns written by CSVFormatter, in output order
+_CSV_HEADER = (
+    "Order",
+    "Group ID",
+    "Package Name",
+    "Version/Tag",
+    "PURL",
+    "Ref",
+    "Type",
+    "Scope",
+    "Provided URL",
+    "Repo URL",
+    "Dependencies",
+    "POM",
+    "AUTH",
+    "Homepage URL",
+    "License Type",
+    "External Dependency Count",
+    "Cyclical Dependencies",
+)
+
+# Scheme prefixes (lowercased) a git clone-able source URL can start with; anything
+# else (empty placeholders, "N/A", purls, bare paths) is rejected before parsing
+_REPO_URL_PREFIXES = ("https://", "http://", "git://", "git+", "ssh://", "file://")
+_REPO_URL_PREFIX_LEN = max(len(prefix) for prefix in _REPO_URL_PREFIXES)
+
+# Longest source URL extract_repo_url will parse; anything longer is not a real
+# repository URL and is rejected up front
+_MAX_REPO_URL_LENGTH = 2048
+
+# URLs that _split_url can split without urlparse: a valid scheme, and none of
+# query, fragment, userinfo, params, IPv6 brackets or whitespace
+_URL_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*")
+_URL_SLOW_PATH_RE = re.compile(r"[?#@;\[\]\s]")
+
+# Known git hosts, matched against the lowercased netloc in a single regex call.
+# Each alternative is a lookahead for its host anywhere in the netloc followed by
+# an empty named group, so the alternatives are tried in priority order (not by
+# position in the netloc) and Match.lastgroup names the host that matched
+_KNOWN_HOST_RE = re.compile(
+    r"(?=.*?github\.com)(?P<github>)"
+    r"|(?=.*?gitlab)(?P<gitlab>)"
+    r"|(?=.*?bitbucket\.org)(?P<bitbucket>)"
+    r"|(?=.*?(?:git-wip-us|gitbox)\.apache\.org)(?P<apache>)"
+    r"|(?=.*?git\.eclipse\.org)(?P<eclipse>)",
+    re.DOTALL,
+)
+
+# Scheme and host prefixes of the hosts extract_repo_url can slice without
+# splitting the URL, mapped to the clone URL base they normalize to
+_FAST_REPO_URL_BASES = {
+    "https://github.com/": "https://github.com/",
+    "http://github.com/": "https://github.com/",
+    "https://gitlab.com/": "https://gitlab.com/",
+    "http://gitlab.com/": "http://gitlab.com/",
+    "https://bitbucket.org/": "https://bitbucket.org/",
+    "http://bitbucket.org/": "https://bitbucket.org/",
+}
+
+# Host name fragments of known git hosting services (github, gitlab, gitea and
+# gitee all contain "git"), matched in a single scan of the lowercased netloc
+_GIT_HOSTING_RE = re.compile(r"git|bitbucket|sourceforge")
+
+# Path patterns used by extract_repo_url
+_BROWSE_VIEW_PATH_RE = re.compile(r"/(?:browse|viewvc|view|tags|trunk)/")
+_USER_REPO_PATH_RE = re.compile(r"^/([^/]+)/([^/]+)")
+_APACHE_REPO_PATH_RE = re.compile(r"^/repos/asf/([^/]+)")
+_ECLIPSE_REPO_PATH_RE = re.compile(r"^/c/([^/]+)/([^/]+\.git)")
+_GENERIC_USER_REPO_PATH_RE = re.compile(r"^/([^/]+)/([^/]+)/?$")
+
+
+def _split_url(url: str) -> Tuple[str, str, str, str]:
+    """
+    Split a URL into (scheme, netloc, path, query) as ``urlparse`` would.
+
+    Plain ``scheme://host/path`` URLs, the vast majority in SBOMs, are split
+    with ``str.partition``; anything with a query, fragment, userinfo, params
+    or other unusual characters goes through ``urlparse``.
+
+    Args:
+        url: URL to split (already stripped)
+
+    Returns:
+        Tuple of (scheme, netloc, path, query)
+    """
+    scheme, separator, rest = url.partition("://")
+    if separator and _URL_SCHEME_RE.fullmatch(scheme) and not _URL_SLOW_PATH_RE.search(url):
+        netloc, slash, path = rest.partition("/")
+        return scheme.lower(), netloc, slash + path, ""
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc, parsed.path, parsed.query
+
+
+def _user_repo_url(scheme: str, netloc: str, path: str, _query: str, force_https: bool) -> str:
+    """
+    Build the clone URL of a /<user>/<repo> style repository.
+
+    Handles e.g. https://github.com/user/repo/tree/branch,
+    https://gitlab.com/user/repo/-/tree/branch and https://bitbucket.org/user/repo/src:
+    keeps user/repo and normalizes to .git.
+
+    Args:
+        scheme: URL scheme
+        netloc: URL network location
+        path: URL path
+        _query: URL query string, accepted to match the other host handlers
+        force_https: Whether to upgrade http to https
+
+    Returns:
+        Repository URL ending in .git, or empty string if the path has no user/repo
+    """
+    match = _USER_REPO_PATH_RE.match(path)
+    if not match:
+        return ""
+    user = match.group(1)
+    repo = match.group(2).removesuffix(".git")
+    if force_https and scheme in ("http", "https"):
+        scheme = "https"
+    return f"{scheme}://{netloc}/{user}/{repo}.git"
+
+
+def _apache_repo_url(scheme: str, netloc: str, path: str, query: str) -> str:
+    """
+    Build the clone URL of an Apache Git (git-wip-us/gitbox.apache.org) repository.
+
+    Args:
+        scheme: URL scheme
+        netloc: URL network location
+        path: URL path
+        query: URL query string
+
+    Returns:
+        Repository URL ending in .git, or empty string if no repository is named
+    """
+    # Pattern: https://git-wip-us.apache.org/repos/asf?p=repo.git
+    if "p=" in query:
+        query_params = parse_qs(query)
+        repo_param = query_params.get("p", [""])[0]
+        if repo_param:
+            repo = repo_param.removesuffix(".git")
+            return f"{scheme}://{netloc}/repos/asf/{repo}.git"
+    # Pattern: https://git-wip-us.apache.org/repos/asf/repo.git
+    match = _APACHE_REPO_PATH_RE.match(path)
+    if match:
+        repo = match.group(1).removesuffix(".git")
+        return f"{scheme}://{netloc}/repos/asf/{repo}.git"
+    return ""
+
+
+def _eclipse_repo_url(scheme: str, netloc: str, path: str, _query: str) -> str:
+    """
+    Build the clone URL of an Eclipse Git (git.eclipse.org) repository.
+
+    Args:
+        scheme: URL scheme
+        netloc: URL network location
+        path: URL path
+        _query: URL query string, accepted to match the other host handlers
+
+    Returns:
+        Repository URL ending in .git, or empty string if the path names none
+    """
+    # Pattern: http://git.eclipse.org/c/{project}/{repo}.git/tree or /tree/path
+    # Extract up to and including .git
+    match = _ECLIPSE_REPO_PATH_RE.match(path)
+    if match:
+        project = match.group(1)
+        repo = match.group(2)
+        return f"{scheme}://{netloc}/c/{project}/{repo}"
+    return ""
+
 
+# Handlers for the hosts named by _KNOWN_HOST_RE's groups; each takes
+# (scheme, netloc, path, query) and returns the clone URL or ""
+_KNOWN_HOST_HANDLERS: Dict[str, Callable[[str, str, str, str], str]] = {
+    "github": partial(_user_repo_url, force_https=True),
+    "gitlab": partial(_user_repo_url, force_https=False),
+    "bitbucket": partial(_user_repo_url, force_https=True),
+    "apache": _apache_repo_url,
+    "eclipse": _eclipse_repo_url,
+}
 
+
+@lru_cache(maxsize=4096)
 def extract_repo_url(url: str) -> str:
     """
     Extract the root repository URL from a source URL.
 
     Converts various URL formats to a git clone-able repository URL.
-    Only returns URLs that are actually git repositories.
+    Only returns URLs that are actually git repositories. Results are
+    memoized, since SBOM components often share a handful of source URLs.
 
     Args:
         url: Source URL from component metadata
@@ -41,123 +242,275 @@ def extract_repo_url(url: str) -> str:
         return ""
 
     url = url.strip()
-    if not url:
+    if len(url) > _MAX_REPO_URL_LENGTH or "\x00" in url:
         return ""
+    if not url[:_REPO_URL_PREFIX_LEN].lower().startswith(_REPO_URL_PREFIXES):
+        return ""
+
+    # Fast path for plain github.com, gitlab.com and bitbucket.org URLs: slice
+    # /<user>/<repo> out directly. Anything unusual (ports, userinfo, queries,
+    # SVN paths, a missing user or repo) falls through to the full parse below
+    host_end = url.find("/", 8)
+    base = _FAST_REPO_URL_BASES.get(url[: host_end + 1]) if host_end != -1 else None
+    if base is not None and not _URL_SLOW_PATH_RE.search(url) and "/svn/" not in url.lower():
+        user_end = url.find("/", host_end + 1)
+        if user_end > host_end + 1:
+            repo_end = url.find("/", user_end + 1)
+            repo = url[user_end + 1 : repo_end] if repo_end != -1 else url[user_end + 1 :]
+            if repo:
+                user = url[host_end + 1 : user_end]
+                return f"{base}{user}/{repo.removesuffix('.git')}.git"
 
     # Parse the URL
     try:
-        parsed = urlparse(url)
+        scheme, netloc, path, query = _split_url(url)
     except Exception:  # pylint: disable=broad-exception-caught
         return ""
 
-    # Skip SVN URLs (not git clone-able)
-    if "svn" in parsed.netloc.lower() or "/svn/" in parsed.path.lower():
-        return ""
-
-    # Skip browse/view URLs that aren't git repos
-    if any(
-        path_part in parsed.path.lower()
-        for path_part in ["/browse/", "/viewvc/", "/view/", "/tags/", "/trunk/"]
-    ):
-        # Check if it's Apache SVN
-        if "apache.org" in parsed.netloc.lower():
-            return ""
-        # For other sites, try to extract repo if it looks like git
-        pass
-
-    # Handle GitHub URLs
-    if "github.com" in parsed.netloc.lower():
-        # Pattern: https://github.com/user/repo/tree/branch or /tree/master/ or .git
-        # Extract user/repo from path, handling various formats
-        match = re.match(r"^/([^/]+)/([^/]+)", parsed.path)
-        if match:
-            user = match.group(1)
-            repo = match.group(2)
-            # Remove .git suffix if present, we'll add it back
-            repo = repo.removesuffix(".git")
-            # Use https for GitHub (more reliable than http)
-            scheme = "https" if parsed.scheme in ["http", "https"] else parsed.scheme
-            return f"{scheme}://{parsed.netloc}/{user}/{repo}.git"
-        return ""
+    netloc_lower = netloc.lower()
+    path_lower = path.lower()
 
-    # Handle GitLab URLs
-    if "gitlab.com" in parsed.netloc.lower() or "gitlab" in parsed.netloc.lower():
-        # Pattern: https://gitlab.com/user/repo/-/tree/branch
-        match = re.match(r"^/([^/]+)/([^/]+)", parsed.path)
-        if match:
-            user = match.group(1)
-            repo = match.group(2)
-            repo = repo.removesuffix(".git")
-            return f"{parsed.scheme}://{parsed.netloc}/{user}/{repo}.git"
-        return ""
-
-    # Handle Bitbucket URLs
-    if "bitbucket.org" in parsed.netloc.lower():
-        # Pattern: https://bitbucket.org/user/repo/src
-        match = re.match(r"^/([^/]+)/([^/]+)", parsed.path)
-        if match:
-            user = match.group(1)
-            repo = match.group(2)
-            repo = repo.removesuffix(".git")
-            scheme = "https" if parsed.scheme in ["http", "https"] else parsed.scheme
-            return f"{scheme}://{parsed.netloc}/{user}/{repo}.git"
+    # Skip SVN URLs (not git clone-able)
+    if "svn" in netloc_lower or "/svn/" in path_lower:
         return ""
 
-    # Handle Apache Git (git-wip-us.apache.org)
-    if "git-wip-us.apache.org" in parsed.netloc.lower() or "gitbox.apache.org" in parsed.netloc.lower():
-        # Pattern: https://git-wip-us.apache.org/repos/asf?p=repo.git
-        if "p=" in parsed.query:
-            query_params = parse_qs(parsed.query)
-            repo_param = query_params.get("p", [""])[0]
-            if repo_param:
-                repo = repo_param.removesuffix(".git")
-                return f"{parsed.scheme}://{parsed.netloc}/repos/asf/{repo}.git"
-        # Pattern: https://git-wip-us.apache.org/repos/asf/repo.git
-        match = re.match(r"^/repos/asf/([^/]+)", parsed.path)
-        if match:
-            repo = match.group(1).removesuffix(".git")
-            return f"{parsed.scheme}://{parsed.netloc}/repos/asf/{repo}.git"
+    # Skip browse/view URLs that aren't git repos (Apache's are SVN); for other
+    # sites, still try to extract a repo if it looks like git
+    if "apache.org" in netloc_lower and _BROWSE_VIEW_PATH_RE.search(path_lower):
         return ""
 
-    # Handle Eclipse Git (git.eclipse.org)
-    if "git.eclipse.org" in parsed.netloc.lower():
-        # Pattern: http://git.eclipse.org/c/{project}/{repo}.git/tree or /tree/path
-        # Extract up to and including .git
-        match = re.match(r"^/c/([^/]+)/([^/]+\.git)", parsed.path)
-        if match:
-            project = match.group(1)
-            repo = match.group(2)
-            return f"{parsed.scheme}://{parsed.netloc}/c/{project}/{repo}"
-        return ""
+    # Hand GitHub, GitLab, Bitbucket, Apache Git and Eclipse Git URLs to their
+    # host-specific handler
+    host_match = _KNOWN_HOST_RE.match(netloc_lower)
+    if host_match:
+        return _KNOWN_HOST_HANDLERS[host_match.lastgroup](scheme, netloc, path, query)
 
     # Handle generic git URLs that already end in .git
     # But check if there's a path after .git (like /tree) and remove it
-    if ".git" in parsed.path:
+    if ".git" in path:
         # Find the position of .git in the path
-        git_pos = parsed.path.find(".git")
+        git_pos = path.find(".git")
         if git_pos != -1:
             # Extract everything up to and including .git
-            base_path = parsed.path[: git_pos + 4]
-            return f"{parsed.scheme}://{parsed.netloc}{base_path}"
+            base_path = path[: git_pos + 4]
+            return f"{scheme}://{netloc}{base_path}"
 
     # Handle URLs that look like git repos but don't have .git suffix
     # Check if path has typical git repo structure (user/repo)
-    match = re.match(r"^/([^/]+)/([^/]+)/?$", parsed.path)
+    match = _GENERIC_USER_REPO_PATH_RE.match(path)
     if match:
         # Only if it's a known git hosting service
-        git_hosts = ["github", "gitlab", "bitbucket", "git", "gitea", "gitee", "sourceforge"]
-        if any(host in parsed.netloc.lower() for host in git_hosts):
+        if _GIT_HOSTING_RE.search(netloc_lower):
             user = match.group(1)
             repo = match.group(2)
-            return f"{parsed.scheme}://{parsed.netloc}/{user}/{repo}.git"
+            return f"{scheme}://{netloc}/{user}/{repo}.git"
 
     # If we can't determine it's a git repo, return empty
     return ""
 
 
+def _component_keys(components: Dict[str, Component]) -> frozenset:
+    """
+    Build the set of "group:name:version" keys of the SBOM's components.
+
+    Used to tell which resolved dependencies are external to the SBOM.
+
+    Args:
+        components: Dictionary of all components
+
+    Returns:
+        Frozen set of component keys
+    """
+    return frozenset(
+        f"{c.group}:{c.name}:{c.version or ''}" for c in components.values() if c.group and c.name
+    )
+
+
+def _cycle_descriptions(graph: Optional[nx.DiGraph], has_circular: bool) -> Dict[str, str]:
+    """
+    Describe the dependency cycles each node takes part in.
+
+    Cycles are enumerated once for the whole graph, rather than once per row.
+
+    Args:
+        graph: Dependency graph
+        has_circular: Whether circular dependencies were detected
+
+    Returns:
+        Mapping of node to its cycles formatted as "a->b->a; c->d->c" (nodes
+        outside any cycle are absent)
+    """
+    if not has_circular or graph is None:
+        return {}
+    try:
+        cycles_by_node: Dict[str, List[str]] = defaultdict(list)
+        for cycle in nx.simple_cycles(graph):
+            # Format as "comp1->comp2->comp3->comp1", closing the cycle
+            cycle_str = "->".join(cycle)
+            if len(cycle) > 1:
+                cycle_str += f"->{cycle[0]}"
+            for node in cycle:
+                cycles_by_node[node].append(cycle_str)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # Cycle enumeration failed: flag every node rather than listing cycles
+        return {node: "Cycle detected (unable to list components)" for node in graph}
+    return {node: "; ".join(cycles) for node, cycles in cycles_by_node.items()}
+
+
+def _get_dep_count(graph: Optional[nx.DiGraph], comp_ref: str) -> int:
+    """
+    Count a component's dependencies (incoming edges/predecessors) in the graph.
+
+    Args:
+        graph: Optional dependency graph
+        comp_ref: Component reference identifier
+
+    Returns:
+        Number of dependencies, or 0 if the component is not in the graph
+    """
+    if graph is None or comp_ref not in graph:
+        return 0
+    # A plain adjacency-size lookup: it does not walk the graph, so cycles
+    # cannot make it fail and no error handling is needed
+    return graph.in_degree(comp_ref)
+
+
+def _lookup_remote_metadata(
+    comp: Component,
+    components: Dict[str, Component],
+    metadata_client: Optional[PackageMetadataClient],
+    dependency_resolver: Optional[object],
+    component_keys: Optional[frozenset] = None,
+) -> Tuple[str, str, int]:
+    """
+    Look up a component's homepage, license and external dependency count.
+
+    Tries the dependency resolver (mvnrepository.com) first for Maven packages,
+    then falls back to the metadata client for Maven and npm packages.
+
+    Args:
+        comp: Component to look up
+        components: Dictionary of all components
+        metadata_client: Optional package metadata client
+        dependency_resolver: Optional dependency resolver for fetching metadata
+        component_keys: Optional precomputed keys of all components
+            (see ``_component_keys``); built on demand if omitted
+
+    Returns:
+        Tuple of (homepage_url, license_type, external_dependency_count)
+    """
+    homepage_url = ""
+    license_type = ""
+    external_dependency_count = 0
+
+    package_type = extract_package_type(comp.purl) if comp.purl else None
+    is_maven = package_type == "maven"
+    is_npm = package_type == "npm"
+
+    # Try dependency resolver first (mvnrepository.com) - only for Maven packages
+    if is_maven and comp.group and comp.name and comp.version:
+        if dependency_resolver:
+            try:
+                license, homepage = dependency_resolver.get_license_and_homepage(
+                    comp.group, comp.name, comp.version
+                )
+                if homepage:
+                    homepage_url = homepage
+                if license:
+                    license_type = license
+
+                # Get external dependencies (dependencies not in original SBOM)
+                dependencies = dependency_resolver.get_dependencies(
+                    comp.group, comp.name, comp.version
+                )
+                if dependencies:
+                    # Count dependencies that are not in the original components
+                    if component_keys is None:
+                        component_keys = _component_keys(components)
+                    external_deps = [
+                        dep
+                        for dep in dependencies
+                        if f"{dep[0]}:{dep[1]}:{dep[2]}" not in component_keys
+                    ]
+                    external_dependency_count = len(external_deps)
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+    # Fall back to metadata client for both Maven and npm packages
+    if not homepage_url and metadata_client and comp.name:
+        # For npm packages, we only need name. For Maven, we need group and name.
+        if is_npm or (is_maven and comp.group):
+            try:
+                homepage, license = metadata_client.get_package_info(comp)
+                if homepage:
+                    homepage_url = homepage
+                if license and not license_type:
+                    license_type = license
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+    return homepage_url, license_type, external_dependency_count
+
+
+def _prefetch_remote_metadata(
+    order: List[str],
+    components: Dict[str, Component],
+    metadata_client: Optional[PackageMetadataClient],
+    dependency_resolver: Optional[object],
+    component_keys: Optional[frozenset] = None,
+    max_workers: int = _LOOKUP_WORKERS,
+) -> Dict[str, Tuple[str, str, int]]:
+    """
+    Look up remote metadata for every component in the order concurrently.
+
+    Each lookup is dominated by network latency, so running them on a thread
+    pool overlaps the round trips; the clients' own rate limiters still pace
+    the requests sent to each host.
+
+    Args:
+        order: List of component identifiers in compilation order
+        components: Dictionary of all components
+        metadata_client: Optional package metadata client
+        dependency_resolver: Optional dependency resolver for fetching metadata
+        component_keys: Optional precomputed keys of all components
+            (see ``_component_keys``); built on demand if omitted
+        max_workers: Maximum number of concurrent lookups
+
+    Returns:
+        Mapping of component reference to (homepage_url, license_type,
+        external_dependency_count)
+    """
+    if not metadata_client and not dependency_resolver:
+        return {}
+    if component_keys is None:
+        component_keys = _component_keys(components)
+    # Components that differ only in ref or scope share coordinates: look each
+    # distinct (purl, group, name, version) up once
+    refs_by_coordinates: Dict[Tuple[str, str, str, str], List[str]] = defaultdict(list)
+    for comp_ref in dict.fromkeys(order):
+        comp = components.get(comp_ref)
+        if comp is not None:
+            refs_by_coordinates[(comp.purl, comp.group, comp.name, comp.version)].append(comp_ref)
+    if not refs_by_coordinates:
+        return {}
+    ref_groups = list(refs_by_coordinates.values())
+
+    def _lookup(refs: List[str]) -> Tuple[str, str, int]:
+        return _lookup_remote_metadata(
+            components[refs[0]], components, metadata_client, dependency_resolver, component_keys
+        )
+
+    workers = max(1, min(max_workers, len(ref_groups)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_lookup, ref_groups)
+        return {comp_ref: result for refs, result in zip(ref_groups, results) for comp_ref in refs}
+
+
 class OutputFormatter:
     """Base class for output formatters."""
 
+    __slots__ = ()
+
     def format(
         self,
         order: List[str],
@@ -165,7 +518,7 @@ class OutputFormatter:
         has_circular: bool,
         statistics: Optional[Dict] = None,
         include_metadata: bool = False,
-        graph: Optional["nx.DiGraph"] = None,
+        graph: Optional[nx.DiGraph] = None,
         pom_downloader: Optional[object] = None,
     ) -> str:
         """
@@ -186,9 +539,60 @@ class OutputFormatter:
         raise NotImplementedError
 
 
+def _text_entry_with_metadata(idx: int, comp_ref: str, comp: Optional[Component]) -> str:
+    """
+    Render one TextFormatter entry including component metadata.
+
+    Args:
+        idx: Position in the compilation order
+        comp_ref: Component reference identifier
+        comp: Component, or None if the reference is not in the SBOM
+
+    Returns:
+        The entry line, followed by PURL/Ref detail lines and a blank line when
+        the component is known
+    """
+    if not comp:
+        return f"{idx}. {comp_ref}"
+    entry = [f"{idx}. {comp.coordinates}"]
+    if comp.purl:
+        entry.append(f"   PURL: {comp.purl}")
+    if comp.ref and comp.ref != comp.identifier:
+        entry.append(f"   Ref: {comp.ref}")
+    entry.append("")
+    return "\n".join(entry)
+
+
+def _dumps_json(document: Dict) -> str:
+    """
+    Serialize a JSON document identically whether or not orjson is installed.
+
+    orjson writes non-ASCII characters raw while the stdlib escapes them, so
+    only pure-ASCII orjson output is used; anything else goes through the
+    stdlib, keeping the output ASCII-only and printable on any console.
+
+    Args:
+        document: JSON-serializable document
+
+    Returns:
+        JSON text indented by two spaces
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(document, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # Value orjson cannot serialize; let the stdlib handle it
+        else:
+            if data.isascii():
+                return data.decode("ascii")
+    return json.dumps(document, indent=2)
+
+
 class TextFormatter(OutputFormatter):
     """Text-based output formatter."""
 
+    __slots__ = ()
+
     def format(
         self,
         order: List[str],
@@ -196,7 +600,7 @@ class TextFormatter(OutputFormatter):
         has_circular: bool,
         statistics: Optional[Dict] = None,
         include_metadata: bool = False,
-        graph: Optional["nx.DiGraph"] = None,
+        graph: Optional[nx.DiGraph] = None,
         pom_downloader: Optional[object] = None,
     ) -> str:
         """
@@ -214,10 +618,7 @@ class TextFormatter(OutputFormatter):
         Returns:
             Formatted text string
         """
-        lines = []
-        lines.append("=" * 80)
-        lines.append("Compilation Order")
-        lines.append("=" * 80)
+        lines = list(_TEXT_BANNER)
 
         if has_circular:
             lines.append("")
@@ -237,24 +638,23 @@ class TextFormatter(OutputFormatter):
         lines.append("Order:")
         lines.append("")
 
-        for idx, comp_ref in enumerate(order, 1):
-            comp = components.get(comp_ref)
-            if comp:
-                if include_metadata:
-                    lines.append(
-                        f"{idx}. {comp.group}:{comp.name}:{comp.version}"
+        get_component = components.get
+        if include_metadata:
+            # One pre-joined string per component (entry, detail lines and the
+            # trailing blank line) instead of several appends per component
+            if order:
+                lines.append(
+                    "\n".join(
+                        _text_entry_with_metadata(idx, comp_ref, get_component(comp_ref))
+                        for idx, comp_ref in enumerate(order, 1)
                     )
-                    if comp.purl:
-                        lines.append(f"   PURL: {comp.purl}")
-                    if comp.ref and comp.ref != comp.get_identifier():
-                        lines.append(f"   Ref: {comp.ref}")
-                    lines.append("")
-                else:
-                    lines.append(
-                        f"{idx}. {comp.group}:{comp.name}:{comp.version}"
-                    )
-            else:
-                lines.append(f"{idx}. {comp_ref}")
+                )
+        else:
+            append = lines.append
+            format_entry = "{}. {}".format
+            for idx, comp_ref in enumerate(order, 1):
+                comp = get_component(comp_ref)
+                append(format_entry(idx, comp.coordinates if comp else comp_ref))
 
         return "\n".join(lines)
 
@@ -262,6 +662,8 @@ class TextFormatter(OutputFormatter):
 class JSONFormatter(OutputFormatter):
     """JSON-based output formatter."""
 
+    __slots__ = ()
+
     def format(
         self,
         order: List[str],
@@ -269,7 +671,7 @@ class JSONFormatter(OutputFormatter):
         has_circular: bool,
         statistics: Optional[Dict] = None,
         include_metadata: bool = False,
-        graph: Optional["nx.DiGraph"] = None,
+        graph: Optional[nx.DiGraph] = None,
         pom_downloader: Optional[object] = None,
     ) -> str:
         """
@@ -287,28 +689,89 @@ class JSONFormatter(OutputFormatter):
         Returns:
             Formatted JSON string
         """
+        output = self._build_output(order, components, has_circular, statistics, include_metadata)
+        return _dumps_json(output)
+
+    def format_to_stream(
+        self,
+        stream: TextIO,
+        order: List[str],
+        components: Dict[str, Component],
+        has_circular: bool,
+        statistics: Optional[Dict] = None,
+        include_metadata: bool = False,
+    ) -> None:
+        """
+        Format compilation order as JSON, writing it to a text stream.
+
+        Produces the same document as ``format``. Without orjson the stdlib
+        encoder writes it chunk by chunk, so the whole document is never held
+        in memory as one string.
+
+        Args:
+            stream: Writable text stream (e.g. an open file or sys.stdout)
+            order: List of component identifiers in compilation order
+            components: Dictionary of all components
+            has_circular: Whether circular dependencies were detected
+            statistics: Optional graph statistics
+            include_metadata: Whether to include component metadata
+        """
+        output = self._build_output(order, components, has_circular, statistics, include_metadata)
+
+        if orjson is not None:
+            stream.write(_dumps_json(output))
+            return
+        json.dump(output, stream, indent=2)
+
+    @staticmethod
+    def _build_output(
+        order: List[str],
+        components: Dict[str, Component],
+        has_circular: bool,
+        statistics: Optional[Dict],
+        include_metadata: bool,
+    ) -> Dict:
+        """
+        Build the JSON document for a compilation order.
+
+        Args:
+            order: List of component identifiers in compilation order
+            components: Dictionary of all components
+            has_circular: Whether circular dependencies were detected
+            statistics: Optional graph statistics
+            include_metadata: Whether to include component metadata
+
+        Returns:
+            Dictionary ready for JSON serialization
+        """
         compilation_order = []
+        append = compilation_order.append
+        fields = _JSON_COMPONENT_FIELDS
 
         for comp_ref in order:
             comp = components.get(comp_ref)
-            if comp:
-                comp_data = {
-                    "ref": comp.ref,
-                    "group": comp.group,
-                    "name": comp.name,
-                    "version": comp.version,
-                    "purl": comp.purl,
-                    "type": comp.type,
-                    "scope": comp.scope,
-                }
-                if not include_metadata:
-                    # Remove empty fields
-                    comp_data = {
-                        k: v for k, v in comp_data.items() if v
-                    }
-                compilation_order.append(comp_data)
+            if comp is None:
+                append({"ref": comp_ref})
+            elif include_metadata:
+                append({field: getattr(comp, field) for field in fields})
             else:
-                compilation_order.append({"ref": comp_ref})
+                # Omit empty fields without building a throwaway full dict first
+                comp_data = {}
+                if comp.ref:
+                    comp_data["ref"] = comp.ref
+                if comp.group:
+                    comp_data["group"] = comp.group
+                if comp.name:
+                    comp_data["name"] = comp.name
+                if comp.version:
+                    comp_data["version"] = comp.version
+                if comp.purl:
+                    comp_data["purl"] = comp.purl
+                if comp.type:
+                    comp_data["type"] = comp.type
+                if comp.scope:
+                    comp_data["scope"] = comp.scope
+                append(comp_data)
 
         output = {
             "compilation_order": compilation_order,
@@ -319,12 +782,14 @@ class JSONFormatter(OutputFormatter):
         if statistics:
             output["statistics"] = statistics
 
-        return json.dumps(output, indent=2)
+        return output
 
 
 class CSVFormatter(OutputFormatter):
     """CSV-based output formatter."""
 
+    __slots__ = ()
+
     def format(
         self,
         order: List[str],
@@ -332,7 +797,7 @@ class CSVFormatter(OutputFormatter):
         has_circular: bool,
         statistics: Optional[Dict] = None,
         include_metadata: bool = False,
-        graph: Optional["nx.DiGraph"] = None,
+        graph: Optional[nx.DiGraph] = None,
         pom_downloader: Optional[object] = None,
         metadata_client: Optional[PackageMetadataClient] = None,
         dependency_resolver: Optional[object] = None,
@@ -340,8 +805,8 @@ class CSVFormatter(OutputFormatter):
         """
         Format compilation order as CSV.
 
-        Columns: Order, Group ID, Package Name, Version/Tag, Provided URL, Repo URL,
-        Dependencies, POM, AUTH, Homepage URL, License Type
+        Produces the same columns as ``write``; callers writing to a file should
+        use ``write`` or ``format_incremental`` rather than building the string.
 
         Args:
             order: List of component identifiers in compilation order
@@ -358,39 +823,18 @@ class CSVFormatter(OutputFormatter):
             Formatted CSV string
         """
         output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(
-            [
-                "Order",
-                "Group ID",
-                "Package Name",
-                "Version/Tag",
-                "Provided URL",
-                "Repo URL",
-                "Dependencies",
-                "POM",
-                "AUTH",
-                "Homepage URL",
-                "License Type",
-                "External Dependency Count",
-            ]
+        self.write(
+            output,
+            order,
+            components,
+            has_circular,
+            statistics,
+            include_metadata,
+            graph,
+            pom_downloader,
+            metadata_client,
+            dependency_resolver,
         )
-
-        # Write data rows
-        for idx, comp_ref in enumerate(order, 1):
-            row = self._format_row(
-                idx,
-                comp_ref,
-                components,
-                graph,
-                pom_downloader,
-                metadata_client,
-                dependency_resolver,
-            )
-            writer.writerow(row)
-
         return output.getvalue()
 
     def format_incremental(
@@ -401,10 +845,11 @@ class CSVFormatter(OutputFormatter):
         has_circular: bool,
         statistics: Optional[Dict] = None,
         include_metadata: bool = False,
-        graph: Optional["nx.DiGraph"] = None,
+        graph: Optional[nx.DiGraph] = None,
         pom_downloader: Optional[object] = None,
         metadata_client: Optional[PackageMetadataClient] = None,
         dependency_resolver: Optional[object] = None,
+        fsync_every: int = 0,
     ) -> None:
         """
         Format compilation order as CSV, writing incrementally to file.
@@ -412,12 +857,65 @@ class CSVFormatter(OutputFormatter):
         Always overwrites existing file to ensure it contains exactly the same number
         of rows as components in the SBOM.
 
+        Args:
+            output_path: Path to output CSV file
+            order: List of component identifiers in compilation order
+            components: Dictionary of all components
+            has_circular: Whether circular dependencies were detected
+            statistics: Optional graph statistics (not used in CSV)
+            include_metadata: Whether to include component metadata (not used in CSV)
+            graph: Optional dependency graph for counting dependencies
+            pom_downloader: Optional POM downloader instance
+            metadata_client: Optional package metadata client
+            dependency_resolver: Optional dependency resolver for fetching metadata
+            fsync_every: If positive, flush and fsync after every this many rows so
+                partial output survives a crash; by default the file is synced once
+                when complete
+        """
+        # Always overwrite existing file to ensure it matches the SBOM exactly
+        # This file is written once and never modified again
+        with open(
+            output_path, "w", encoding="utf-8", newline="", buffering=1 << 20
+        ) as file:
+            self.write(
+                file,
+                order,
+                components,
+                has_circular,
+                statistics,
+                include_metadata,
+                graph,
+                pom_downloader,
+                metadata_client,
+                dependency_resolver,
+                fsync_every,
+            )
+            file.flush()
+            os.fsync(file.fileno())  # Force the completed file to disk once
+
+    def write(
+        self,
+        stream: TextIO,
+        order: List[str],
+        components: Dict[str, Component],
+        has_circular: bool,
+        statistics: Optional[Dict] = None,
+        include_metadata: bool = False,
+        graph: Optional[nx.DiGraph] = None,
+        pom_downloader: Optional[object] = None,
+        metadata_client: Optional[PackageMetadataClient] = None,
+        dependency_resolver: Optional[object] = None,
+        fsync_every: int = 0,
+    ) -> None:
+        """
+        Write compilation order as CSV rows straight to a text stream.
+
         Columns: Order, Group ID, Package Name, Version/Tag, PURL, Ref, Type, Scope,
         Provided URL, Repo URL, Dependencies, POM, AUTH, Homepage URL, License Type,
         External Dependency Count, Cyclical Dependencies
 
         Args:
-            output_path: Path to output CSV file
+            stream: Writable text stream (a file opened with newline="", or StringIO)
             order: List of component identifiers in compilation order
             components: Dictionary of all components
             has_circular: Whether circular dependencies were detected
@@ -427,62 +925,65 @@ class CSVFormatter(OutputFormatter):
             pom_downloader: Optional POM downloader instance
             metadata_client: Optional package metadata client
             dependency_resolver: Optional dependency resolver for fetching metadata
+            fsync_every: If positive, flush and fsync the stream (which must then be
+                a real file) after every this many rows
         """
-        # Always overwrite existing file to ensure it matches the SBOM exactly
-        with open(output_path, "w", encoding="utf-8", newline="") as file:
-            writer = csv.writer(file)
-
-            # Always write header
-            writer.writerow(
-                [
-                    "Order",
-                    "Group ID",
-                    "Package Name",
-                    "Version/Tag",
-                    "PURL",
-                    "Ref",
-                    "Type",
-                    "Scope",
-                    "Provided URL",
-                    "Repo URL",
-                    "Dependencies",
-                    "POM",
-                    "AUTH",
-                    "Homepage URL",
-                    "License Type",
-                    "External Dependency Count",
-                    "Cyclical Dependencies",
-                ]
-            )
+        writer = csv.writer(stream)
+        writer.writerow(_CSV_HEADER)
+
+        cycle_descriptions = _cycle_descriptions(graph, has_circular)
+        component_keys = _component_keys(components) if dependency_resolver else frozenset()
+        # Dependency counts for every node in one pass over the graph
+        in_degrees = dict(graph.in_degree()) if graph is not None else {}
+        # Remote lookups are network-bound: run them concurrently up front so the
+        # row loop below only formats (POM downloads stay serial)
+        remote_metadata = _prefetch_remote_metadata(
+            order, components, metadata_client, dependency_resolver, component_keys
+        )
 
-            # Write data rows incrementally - exactly one row per component in order
-            # This file is written once and never modified again
-            for idx, comp_ref in enumerate(order, 1):
-                row = self._format_row(
-                    idx,
-                    comp_ref,
-                    components,
-                    graph,
-                    pom_downloader,
-                    metadata_client,
-                    dependency_resolver,
-                    has_circular,
-                )
+        # Exactly one row per component in order
+        format_row = self._format_row
+        rows = (
+            format_row(
+                idx,
+                comp_ref,
+                components,
+                graph,
+                pom_downloader,
+                metadata_client,
+                dependency_resolver,
+                cycle_descriptions,
+                component_keys,
+                remote_metadata,
+                in_degrees,
+            )
+            for idx, comp_ref in enumerate(order, 1)
+        )
+        if fsync_every > 0:
+            for idx, row in enumerate(rows, 1):
                 writer.writerow(row)
-                file.flush()  # Ensure row is written immediately
-                os.fsync(file.fileno())  # Force write to disk
+                if idx % fsync_every == 0:
+                    stream.flush()
+                    os.fsync(stream.fileno())
+        else:
+            # No periodic syncs: csv.writer consumes the rows (and quotes the
+            # free-text URL and dependency fields) in one C-level loop
+            writer.writerows(rows)
 
     def _format_row(
         self,
         idx: int,
         comp_ref: str,
         components: Dict[str, Component],
-        graph: Optional["nx.DiGraph"],
+        graph: Optional[nx.DiGraph],
         pom_downloader: Optional[object],
         metadata_client: Optional[PackageMetadataClient] = None,
         dependency_resolver: Optional[object] = None,
-        has_circular: bool = False,
-    ) -> List:
+        cycle_descriptions: Optional[Dict[str, str]] = None,
+        component_keys: Optional[frozenset] = None,
+        remote_metadata: Optional[Dict[str, Tuple[str, str, int]]] = None,
+        in_degrees: Optional[Dict[str, int]] = None,
+    ) -> Tuple:
         """
         Format a single CSV row.
 
@@ -494,17 +995,30 @@ class CSVFormatter(OutputFormatter):
             pom_downloader: Optional POM downloader instance
             metadata_client: Optional package metadata client
             dependency_resolver: Optional dependency resolver for fetching metadata
+            cycle_descriptions: Optional per-node cycle descriptions
+                (see ``_cycle_descriptions``)
+            component_keys: Optional precomputed keys of all components
+                (see ``_component_keys``); built on demand if omitted
+            remote_metadata: Optional prefetched remote metadata per component
+                (see ``_prefetch_remote_metadata``); looked up on demand if omitted
+            in_degrees: Optional precomputed in-degree of every graph node;
+                counted from the graph on demand if omitted
 
         Returns:
-            List of values for the CSV row
+            Tuple of values for the CSV row
         """
+        # Count dependencies (incoming edges/predecessors) and look up the cycles
+        # the component takes part in; both apply whether or not it is in the SBOM
+        if in_degrees is not None:
+            dependency_count = in_degrees.get(comp_ref, 0)
+        else:
+            dependency_count = _get_dep_count(graph, comp_ref)
+        cyclical_dependencies = (cycle_descriptions or {}).get(comp_ref, "")
+
         comp = components.get(comp_ref)
         if comp:
             # Get Group ID (group:name format)
-            if comp.group:
-                group_id = f"{comp.group}:{comp.name}"
-            else:
-                group_id = comp.name
+            group_id = comp.group_id
 
             # Get package name (just the name part)
             package_name = comp.name
@@ -519,40 +1033,15 @@ class CSVFormatter(OutputFormatter):
             scope = comp.scope if comp.scope else ""
 
             # Get provided URL (original source URL)
-            provided_url = comp.source_url if hasattr(comp, "source_url") else ""
+            provided_url = comp.source_url
 
             # Extract repo URL (root git clone-able URL)
             # Leave empty for compile-order.csv - will be filled in enhanced.csv from POM file
             repo_url = ""
 
-            # Count dependencies (incoming edges/predecessors)
-            dependency_count = 0
-            if graph is not None and comp_ref in graph:
-                try:
-                    # Handle potential cycles gracefully - if graph has cycles,
-                    # NetworkX may raise errors during iteration
-                    predecessors = list(graph.predecessors(comp_ref))
-                    dependency_count = len(predecessors)
-                except (RuntimeError, ValueError) as graph_exc:
-                    # NetworkX can raise RuntimeError or ValueError if graph has cycles
-                    # or is modified during iteration
-                    if "cycle" in str(graph_exc).lower() or "iteration" in str(graph_exc).lower():
-                        # Graph has cycles - try to get count safely
-                        try:
-                            # Use in_degree as a safer alternative
-                            dependency_count = graph.in_degree(comp_ref)
-                        except Exception:  # pylint: disable=broad-exception-caught
-                            dependency_count = 0
-                    else:
-                        dependency_count = 0
-                except Exception:  # pylint: disable=broad-exception-caught
-                    # Any other error - default to 0
-                    dependency_count = 0
-
             # Determine package type
             package_type = extract_package_type(purl) if purl else None
             is_maven = package_type == "maven"
-            is_npm = package_type == "npm"
 
             # Download POM file if downloader is available (only for Maven packages)
             pom_filename = ""
@@ -567,94 +1056,16 @@ class CSVFormatter(OutputFormatter):
                     pom_filename = ""
                     auth_required = ""
 
-            # Fetch homepage URL and license type
-            homepage_url = ""
-            license_type = ""
-            external_dependency_count = 0
-
-            # Detect cyclical dependencies for this component
-            cyclical_dependencies = ""
-            if has_circular and graph is not None:
-                try:
-                    # Import DependencyGraph to use cycle detection methods
-                    # We need to create a temporary DependencyGraph instance to use its methods
-                    # Or we can detect cycles directly using NetworkX
-                    import networkx as nx
-                    if comp_ref in graph:
-                        # Get all simple cycles that include this component
-                        try:
-                            all_cycles = list(nx.simple_cycles(graph))
-                            component_cycles = [
-                                cycle for cycle in all_cycles if comp_ref in cycle
-                            ]
-                            
-                            if component_cycles:
-                                # Format cycles as: "comp1->comp2->comp3->comp1; comp4->comp5->comp4"
-                                cycle_strings = []
-                                for cycle in component_cycles:
-                                    cycle_str = "->".join(cycle)
-                                    # Close the cycle
-                                    if len(cycle) > 1:
-                                        cycle_str += f"->{cycle[0]}"
-                                    cycle_strings.append(cycle_str)
-                                
-                                cyclical_dependencies = "; ".join(cycle_strings)
-                                # Note: Cycle detection logging removed from stdout/stderr
-                                # All cycle information is logged in cli.py when cycles are detected
-                        except Exception as cycle_exc:  # pylint: disable=broad-exception-caught
-                            # If cycle detection fails, mark as having cycles but can't list them
-                            cyclical_dependencies = "Cycle detected (unable to list components)"
-                            # Note: Error logging removed from stdout/stderr
-                            # Errors are logged in cli.py when cycles are detected
-                except Exception:  # pylint: disable=broad-exception-caught
-                    pass
-            
-            # Try dependency resolver first (mvnrepository.com) - only for Maven packages
-            if is_maven and comp.group and comp.name and comp.version:
-                if dependency_resolver:
-                    try:
-                        license, homepage = dependency_resolver.get_license_and_homepage(
-                            comp.group, comp.name, comp.version
-                        )
-                        if homepage:
-                            homepage_url = homepage
-                        if license:
-                            license_type = license
-                        
-                        # Get external dependencies (dependencies not in original SBOM)
-                        dependencies = dependency_resolver.get_dependencies(
-                            comp.group, comp.name, comp.version
-                        )
-                        if dependencies:
-                            # Count dependencies that are not in the original components
-                            component_keys = {
-                                f"{c.group}:{c.name}:{c.version or ''}"
-                                for c in components.values()
-                                if c.group and c.name
-                            }
-                            external_deps = [
-                                dep
-                                for dep in dependencies
-                                if f"{dep[0]}:{dep[1]}:{dep[2]}" not in component_keys
-                            ]
-                            external_dependency_count = len(external_deps)
-                    except Exception:  # pylint: disable=broad-exception-caught
-                        pass
-
-            # Fall back to metadata client for both Maven and npm packages
-            if not homepage_url and metadata_client and comp.name:
-                # For npm packages, we only need name. For Maven, we need group and name.
-                if is_npm or (is_maven and comp.group):
-                    try:
-                        homepage, license = metadata_client.get_package_info(comp)
-                        if homepage:
-                            homepage_url = homepage
-                        if license and not license_type:
-                            license_type = license
-                    except Exception:  # pylint: disable=broad-exception-caught
-                        pass
+            # Homepage URL, license type and external dependency count, looked up
+            # ahead of time by write() or fetched here otherwise
+            if remote_metadata is not None and comp_ref in remote_metadata:
+                homepage_url, license_type, external_dependency_count = remote_metadata[comp_ref]
+            else:
+                homepage_url, license_type, external_dependency_count = _lookup_remote_metadata(
+                    comp, components, metadata_client, dependency_resolver, component_keys
+                )
 
-            return [
+            return (
                 idx,
                 group_id,
                 package_name,
@@ -672,57 +1083,10 @@ class CSVFormatter(OutputFormatter):
                 license_type,
                 external_dependency_count,
                 cyclical_dependencies,
-            ]
+            )
         else:
             # Component not found, use ref as group ID
-            dependency_count = 0
-            cyclical_dependencies = ""
-            if graph is not None and comp_ref in graph:
-                try:
-                    # Handle potential cycles gracefully - if graph has cycles,
-                    # NetworkX may raise errors during iteration
-                    predecessors = list(graph.predecessors(comp_ref))
-                    dependency_count = len(predecessors)
-                except (RuntimeError, ValueError) as graph_exc:
-                    # NetworkX can raise RuntimeError or ValueError if graph has cycles
-                    # or is modified during iteration
-                    if "cycle" in str(graph_exc).lower() or "iteration" in str(graph_exc).lower():
-                        # Graph has cycles - try to get count safely
-                        try:
-                            # Use in_degree as a safer alternative
-                            dependency_count = graph.in_degree(comp_ref)
-                        except Exception:  # pylint: disable=broad-exception-caught
-                            dependency_count = 0
-                    else:
-                        dependency_count = 0
-                except Exception:  # pylint: disable=broad-exception-caught
-                    # Any other error - default to 0
-                    dependency_count = 0
-
-            # Detect cyclical dependencies for missing component
-            if has_circular and graph is not None:
-                try:
-                    import networkx as nx
-                    if comp_ref in graph:
-                        try:
-                            all_cycles = list(nx.simple_cycles(graph))
-                            component_cycles = [
-                                cycle for cycle in all_cycles if comp_ref in cycle
-                            ]
-                            if component_cycles:
-                                cycle_strings = []
-                                for cycle in component_cycles:
-                                    cycle_str = "->".join(cycle)
-                                    if len(cycle) > 1:
-                                        cycle_str += f"->{cycle[0]}"
-                                    cycle_strings.append(cycle_str)
-                                cyclical_dependencies = "; ".join(cycle_strings)
-                        except Exception:  # pylint: disable=broad-exception-caught
-                            cyclical_dependencies = "Cycle detected (unable to list components)"
-                except Exception:  # pylint: disable=broad-exception-caught
-                    pass
-
-            return [
+            return (
                 idx,
                 comp_ref,
                 "",
@@ -740,7 +1104,7 @@ class CSVFormatter(OutputFormatter):
                 "",
                 0,  # External Dependency Count
                 cyclical_dependencies,
-            ]
+            )
 
 
 def write_dependencies_csv(
@@ -776,33 +1140,42 @@ def write_dependencies_csv(
             ]
         )
 
-        # Write data rows
-        for idx, (group, artifact, version, depth) in enumerate(dependency_list, 1):
-            homepage_url = ""
-            license_type = ""
+        def _rows() -> Iterator[Tuple]:
+            for idx, (group, artifact, version, depth) in enumerate(dependency_list, 1):
+                homepage_url = ""
+                license_type = ""
 
-            # Fetch metadata if resolver provided
-            if dependency_resolver and version:
-                try:
-                    license, homepage = dependency_resolver.get_license_and_homepage(
-                        group, artifact, version
-                    )
-                    if homepage:
-                        homepage_url = homepage
-                    if license:
-                        license_type = license
-                except Exception:  # pylint: disable=broad-exception-caught
-                    if verbose:
-                        print(
-                            f"Warning: Failed to fetch metadata for "
-                            f"{group}:{artifact}:{version}",
-                            file=__import__("sys").stderr,
+                # Fetch metadata if resolver provided
+                if dependency_resolver and version:
+                    try:
+                        license, homepage = dependency_resolver.get_license_and_homepage(
+                            group, artifact, version
                         )
+                        if homepage:
+                            homepage_url = homepage
+                        if license:
+                            license_type = license
+                    except Exception:  # pylint: disable=broad-exception-caught
+                        if verbose:
+                            print(
+                                f"Warning: Failed to fetch metadata for "
+                                f"{group}:{artifact}:{version}",
+                                file=sys.stderr,
+                            )
 
-            group_id = f"{group}:{artifact}"
-            writer.writerow(
-                [idx, group_id, artifact, version, depth, homepage_url, license_type]
-            )
+                group_id = f"{group}:{artifact}"
+                yield (idx, group_id, artifact, version, depth, homepage_url, license_type)
+
+        # Write data rows in a single writerows call
+        writer.writerows(_rows())
+
+
+# Formatters are stateless, so one shared instance per format is enough
+_FORMATTERS: Dict[str, OutputFormatter] = {
+    "text": TextFormatter(),
+    "json": JSONFormatter(),
+    "csv": CSVFormatter(),
+}
 
 
 def get_formatter(format_type: str) -> OutputFormatter:
@@ -818,16 +1191,10 @@ def get_formatter(format_type: str) -> OutputFormatter:
     Raises:
         ValueError: If format type is not supported
     """
-    formatters = {
-        "text": TextFormatter(),
-        "json": JSONFormatter(),
-        "csv": CSVFormatter(),
-    }
-
-    if format_type.lower() not in formatters:
+    formatter = _FORMATTERS.get(format_type.lower())
+    if formatter is None:
         raise ValueError(
             f"Unsupported format: {format_type}. "
-            f"Supported formats: {', '.join(formatters.keys())}"
+            f"Supported formats: {', '.join(_FORMATTERS)}"
         )
-
-    return formatters[format_type.lower()]
+    return formatter
@@ -4,25 +4,69 @@ Package (JAR) file downloader with caching support.
 Downloads JAR files from Maven Central and caches them locally.
 """
 
-import io
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
+from xml.sax.saxutils import escape
 
 from sbom_compile_order import __version__
-from sbom_compile_order.parser import Component, build_maven_central_url_from_purl
+from sbom_compile_order.parser import (
+    Component,
+    build_maven_central_url,
+    build_maven_central_url_from_purl,
+)
+from sbom_compile_order.response_cache import SQLiteResponseCache
+
+# urllib3 keeps connections to Maven Central and the fallback repository alive
+# across artifacts (install "sbom-compile-order[fast]"); without it every
+# download pays a fresh TCP and TLS handshake through urlopen.
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+# Every JAR/WAR starts with a ZIP local file header
+_ZIP_MAGIC = b"PK\x03\x04"
+
+# Chunk size used when streaming artifact downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Amount of Maven output kept for error classification and verbose logging
+_MAVEN_OUTPUT_TAIL_BYTES = 8 * 1024
+
+# Maven output that indicates the repository requires credentials
+_MAVEN_AUTH_RE = re.compile(r"401|403|unauthorized|authentication|credentials", re.IGNORECASE)
+
+# Artifacts larger than this are fetched as several concurrent byte ranges when
+# the server supports it; a single stream rarely saturates the link for them
+_PARALLEL_RANGE_THRESHOLD = 16 * 1024 * 1024
+_PARALLEL_RANGE_PARTS = 4
+
+# Connections kept per host in the urllib3 pool; download_packages never runs
+# more workers than this so threads do not queue for a socket.
+_HTTP_POOL_MAXSIZE = 16
 
 
 class PackageDownloader:
     """Downloads and caches JAR files from Maven Central."""
 
+    MISS_CACHE_FILENAME = "artifact-miss-cache.sqlite"
+    # Artifacts missing from both repositories are not re-requested for a week
+    MISS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
     def __init__(self, cache_dir: Path, verbose: bool = False, use_maven: Optional[bool] = None) -> None:
         """
         Initialize the package downloader.
@@ -36,7 +80,13 @@ class PackageDownloader:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.verbose = verbose
-        
+        self.log_file = self.cache_dir / "sbom-compile-order.log"
+        self._log_lock = threading.Lock()
+        self._log_fh: Optional[TextIO] = None
+        self._ensure_log_file()
+
+        self._maven_available: Optional[bool] = None  # Cache Maven availability check
+
         # Auto-detect Maven if not explicitly set
         if use_maven is None:
             self.use_maven = self._check_maven_available()
@@ -49,7 +99,22 @@ class PackageDownloader:
         
         self.jar_cache_dir = self.cache_dir / "jars"
         self.jar_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.log_file = self.cache_dir / "sbom-compile-order.log"
+        self._miss_cache = SQLiteResponseCache(self.cache_dir / self.MISS_CACHE_FILENAME)
+        self._part_locks: Dict[Path, threading.Lock] = {}
+        self._part_locks_guard = threading.Lock()
+        self._bulk_lock = threading.Lock()
+        self._http = (
+            urllib3.PoolManager(
+                num_pools=4,
+                maxsize=_HTTP_POOL_MAXSIZE,
+                headers={"User-Agent": f"sbom-compile-order/{__version__}"},
+                retries=urllib3.Retry(
+                    total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+                ),
+            )
+            if urllib3 is not None
+            else None
+        )
 
     def _check_maven_available(self) -> bool:
         """
@@ -58,21 +123,60 @@ class PackageDownloader:
         Returns:
             True if Maven is available, False otherwise
         """
+        if self._maven_available is not None:
+            return self._maven_available
+
         try:
             result = subprocess.run(
                 ["mvn", "--version"],
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10,
             )
-            return result.returncode == 0
+            self._maven_available = result.returncode == 0
         except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-            return False
+            self._maven_available = False
+        return self._maven_available
+
+    @staticmethod
+    def _run_maven(cmd: List[str], timeout: int) -> Tuple[int, str]:
+        """
+        Run a Maven command without holding its output in memory.
+
+        stdin is closed so Maven can never block on a prompt, and the combined
+        stdout/stderr goes to an anonymous temporary file instead of pipes.
+        Only the tail is read back: Maven prints its error summary (including
+        HTTP 401/403 causes) at the end.
+
+        Args:
+            cmd: Maven command line
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (exit code, last _MAVEN_OUTPUT_TAIL_BYTES of output)
+
+        Raises:
+            subprocess.TimeoutExpired: If Maven runs longer than timeout
+        """
+        with tempfile.TemporaryFile() as output:
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=output,
+                stderr=subprocess.STDOUT,
+                timeout=timeout,
+            )
+            output.seek(max(0, output.tell() - _MAVEN_OUTPUT_TAIL_BYTES))
+            return result.returncode, output.read().decode("utf-8", errors="replace")
 
     def _log(self, message: str) -> None:
         """
         Log a message to both stderr (if verbose) and log file.
 
+        The log file handle is opened once and kept line-buffered, so each
+        message costs a single write instead of stat/mkdir/open/close calls.
+
         Args:
             message: Message to log
         """
@@ -80,25 +184,71 @@ class PackageDownloader:
         log_entry = f"{timestamp} {message}"
         if self.verbose:
             print(log_entry, file=sys.stderr)
-        log_path = self._ensure_log_file()
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(f"{log_entry}\n")
+        with self._log_lock:
+            if self._log_fh is None:
+                self._log_fh = open(self.log_file, "a", encoding="utf-8", buffering=1)
+            self._log_fh.write(f"{log_entry}\n")
 
     def _ensure_log_file(self) -> Path:
         """
-        Ensure the downloader has a log file path and that the file exists.
+        Ensure the log file's directory and the file itself exist.
+
+        Called once from ``__init__``; ``_log`` relies on it having run.
 
         Returns:
             Path to the log file.
         """
-        if not hasattr(self, "log_file") or not self.log_file:
-            self.log_file = self.cache_dir / "sbom-compile-order.log"
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
-        if not self.log_file.exists():
-            # touch to ensure the file is present
-            self.log_file.touch()
+        self.log_file.touch(exist_ok=True)
         return self.log_file
 
+    def close(self) -> None:
+        """Close the log file handle. Later log calls transparently reopen it."""
+        with self._log_lock:
+            if self._log_fh is not None:
+                self._log_fh.close()
+                self._log_fh = None
+
+    @contextmanager
+    def _open_artifact_url(self, url: str, headers: Optional[Dict[str, str]] = None) -> Iterator:
+        """
+        Open an artifact URL, reusing pooled connections when urllib3 is available.
+
+        Both code paths yield a response exposing ``status``, ``headers`` and
+        ``read()`` and raise HTTPError for 4xx/5xx responses, so callers handle
+        them alike.
+
+        Args:
+            url: Artifact URL to fetch
+            headers: Optional extra request headers (e.g. Range)
+
+        Yields:
+            HTTP response object
+        """
+        if self._http is None:
+            req = Request(url)
+            req.add_header("User-Agent", f"sbom-compile-order/{__version__}")
+            for name, value in (headers or {}).items():
+                req.add_header(name, value)
+            with urlopen(req, timeout=30) as response:
+                yield response
+            return
+
+        response = self._http.request(
+            "GET",
+            url,
+            # Per-request headers replace the pool's defaults, so merge them
+            headers={**self._http.headers, **headers} if headers else None,
+            timeout=urllib3.Timeout(connect=5, read=30),
+            preload_content=False,
+        )
+        try:
+            if response.status >= 400:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            yield response
+        finally:
+            response.release_conn()
+
     def _get_maven_central_artifact_url(self, component: Component, artifact_type: str) -> str:
         """
         Construct the Maven Central direct artifact download URL from component PURL.
@@ -114,12 +264,25 @@ class PackageDownloader:
         if component.purl:
             return build_maven_central_url_from_purl(component.purl, file_type=file_type)
         elif component.group and component.name and component.version:
-            from sbom_compile_order.parser import build_maven_central_url
             return build_maven_central_url(
                 component.group, component.name, component.version, file_type
             )
         return ""
 
+    def _cached_artifact_path(self, component: Component, artifact_type: str) -> Path:
+        """
+        Get the cache path of a component's artifact.
+
+        Args:
+            component: Component the artifact belongs to
+            artifact_type: Lower-case artifact type (jar, war, etc.)
+
+        Returns:
+            Path of the artifact in the JAR cache directory
+        """
+        cache_key = component.get_cache_key()
+        return self.jar_cache_dir / f"{cache_key}.{artifact_type}"
+
     def download_package(
         self, component: Component, artifact_type: str = "jar"
     ) -> Tuple[Optional[str], bool]:
@@ -135,19 +298,8 @@ class PackageDownloader:
         if not component.group or not component.name or not component.version:
             return None, False
 
-        # Create a cache key based on component identifier
-        # Clean up the identifier by removing query parameters and URL fragments
-        identifier = component.get_identifier()
-        # Remove query parameters (everything after ?)
-        if "?" in identifier:
-            identifier = identifier.split("?")[0]
-        # Remove URL fragments (everything after #)
-        if "#" in identifier:
-            identifier = identifier.split("#")[0]
-        # Replace problematic characters for filename
-        cache_key = identifier.replace("/", "_").replace(":", "_").replace("@", "_")
         artifact_type = artifact_type.lower()
-        cached_artifact = self.jar_cache_dir / f"{cache_key}.{artifact_type}"
+        cached_artifact = self._cached_artifact_path(component, artifact_type)
         artifact_label = artifact_type.upper()
 
         # Check if already cached
@@ -170,6 +322,12 @@ class PackageDownloader:
                 return None, True
             # Fall through to HTTP download if Maven fails (but not due to auth)
 
+        # Skip artifacts that both repositories recently answered 404 for
+        miss_key = f"{component.group}:{component.name}:{component.version}:{artifact_type}"
+        if self._is_known_missing(miss_key):
+            self._log(f"Skipping {artifact_label} known to be missing: {miss_key}")
+            return None, False
+
         # Download from Maven Central via HTTP (fallback or if Maven not enabled)
         artifact_url = self._get_maven_central_artifact_url(component, artifact_type)
         if not artifact_url:
@@ -179,68 +337,12 @@ class PackageDownloader:
         self._log(f"Downloading {artifact_label} from Maven Central: {artifact_url}")
 
         try:
-            req = Request(artifact_url)
-            req.add_header("User-Agent", f"sbom-compile-order/{__version__}")
-            with urlopen(req, timeout=30) as response:
-                if response.getcode() == 200:
-                    artifact_content = response.read()
-                    artifact_size = len(artifact_content)
-                    
-                    # Check if content is empty
-                    if artifact_size == 0:
-                        self._log(
-                            f"[{artifact_label} DOWNLOAD] ERROR: Downloaded empty file from Maven Central: "
-                            f"{component.group}:{component.name}:{component.version}"
-                        )
-                        return None, False
-                    
-                    # Validate artifact using zipfile module (Java-like validation)
-                    is_valid, validation_error = self._validate_artifact_content(artifact_content)
-                    if is_valid:
-                        # Ensure parent directory exists
-                        cached_artifact.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        try:
-                            self._log(f"[{artifact_label} SAVE] Writing file to: {cached_artifact}")
-                            with open(cached_artifact, "wb") as f:
-                                bytes_written = f.write(artifact_content)
-                                f.flush()
-                                os.fsync(f.fileno())
-                            self._log(f"[{artifact_label} SAVE] Wrote {bytes_written} bytes to {cached_artifact}")
-                            
-                            # Verify file was written
-                            if cached_artifact.exists():
-                                file_size = cached_artifact.stat().st_size
-                                if file_size == artifact_size:
-                                    self._log(
-                                        f"[{artifact_label} SAVE] SUCCESS: File verified on disk: {cached_artifact} ({file_size} bytes)"
-                                    )
-                                    self._log(
-                                        f"Cached {artifact_label} from Maven Central: {cached_artifact.name} "
-                                        f"({component.group}:{component.name}:{component.version})"
-                                    )
-                                    return cached_artifact.name, False
-                                else:
-                                    self._log(
-                                        f"[{artifact_label} SAVE] ERROR: File size mismatch - expected {artifact_size} bytes, "
-                                        f"got {file_size} bytes: {cached_artifact}"
-                                    )
-                            else:
-                                self._log(
-                                    f"[{artifact_label} SAVE] ERROR: File was not written to disk: {cached_artifact}"
-                                )
-                        except Exception as write_exc:  # pylint: disable=broad-exception-caught
-                            self._log(
-                                f"[{artifact_label} SAVE] ERROR: Failed to write file: {write_exc} "
-                                f"for {component.group}:{component.name}:{component.version}"
-                            )
-                            return None, False
-                    else:
-                        self._log(
-                            f"[{artifact_label} DOWNLOAD] ERROR: Downloaded file is not a valid {artifact_label}: {validation_error} "
-                            f"for {component.group}:{component.name}:{component.version} "
-                            f"(size: {artifact_size} bytes)"
-                        )
+            return (
+                self._stream_artifact_to_cache(
+                    artifact_url, cached_artifact, component, artifact_label, "Maven Central"
+                ),
+                False,
+            )
         except HTTPError as exc:
             if exc.code in [401, 403]:
                 return None, True  # Auth required
@@ -254,70 +356,20 @@ class PackageDownloader:
                 if fallback_url:
                     self._log(f"[URL USING TO DOWNLOAD] {fallback_url}")
                     try:
-                        fallback_req = Request(fallback_url)
-                        fallback_req.add_header("User-Agent", f"sbom-compile-order/{__version__}")
-                        with urlopen(fallback_req, timeout=30) as fallback_response:
-                            if fallback_response.getcode() == 200:
-                                artifact_content = fallback_response.read()
-                                artifact_size = len(artifact_content)
-                                
-                                # Check if content is empty
-                                if artifact_size == 0:
-                                    self._log(
-                                        f"[{artifact_label} DOWNLOAD] ERROR: Downloaded empty file from fallback repository: "
-                                        f"{component.group}:{component.name}:{component.version}"
-                                    )
-                                    return None, False
-                                
-                                # Validate artifact using zipfile module (Java-like validation)
-                                is_valid, validation_error = self._validate_artifact_content(artifact_content)
-                                if is_valid:
-                                    # Ensure parent directory exists
-                                    cached_artifact.parent.mkdir(parents=True, exist_ok=True)
-                                    
-                                    try:
-                                        self._log(f"[{artifact_label} SAVE] Writing file to: {cached_artifact}")
-                                        with open(cached_artifact, "wb") as f:
-                                            bytes_written = f.write(artifact_content)
-                                            f.flush()
-                                            os.fsync(f.fileno())
-                                        self._log(f"[{artifact_label} SAVE] Wrote {bytes_written} bytes to {cached_artifact}")
-                                        
-                                        # Verify file was written
-                                        if cached_artifact.exists():
-                                            file_size = cached_artifact.stat().st_size
-                                            if file_size == artifact_size:
-                                                self._log(
-                                                    f"[{artifact_label} SAVE] SUCCESS: File verified on disk: {cached_artifact} ({file_size} bytes)"
-                                                )
-                                                self._log(
-                                                    f"Cached {artifact_label} from fallback repository (mvnrepository.com/repos/central): "
-                                                    f"{cached_artifact.name} ({component.group}:{component.name}:{component.version})"
-                                                )
-                                                return cached_artifact.name, False
-                                            else:
-                                                self._log(
-                                                    f"[{artifact_label} SAVE] ERROR: File size mismatch - expected {artifact_size} bytes, "
-                                                    f"got {file_size} bytes: {cached_artifact}"
-                                                )
-                                        else:
-                                            self._log(
-                                                f"[{artifact_label} SAVE] ERROR: File was not written to disk: {cached_artifact}"
-                                            )
-                                    except Exception as write_exc:  # pylint: disable=broad-exception-caught
-                                        self._log(
-                                            f"[{artifact_label} SAVE] ERROR: Failed to write file from fallback: {write_exc} "
-                                            f"for {component.group}:{component.name}:{component.version}"
-                                        )
-                                else:
-                                    self._log(
-                                        f"[{artifact_label} DOWNLOAD] ERROR: Downloaded file from fallback is not a valid {artifact_label}: "
-                                        f"{validation_error} for {component.group}:{component.name}:{component.version} "
-                                        f"(size: {artifact_size} bytes)"
-                                    )
+                        fallback_result = self._stream_artifact_to_cache(
+                            fallback_url,
+                            cached_artifact,
+                            component,
+                            artifact_label,
+                            "fallback repository (mvnrepository.com/repos/central)",
+                        )
+                        if fallback_result:
+                            return fallback_result, False
                     except HTTPError as fallback_exc:
                         if fallback_exc.code in [401, 403]:
                             return None, True  # Auth required
+                        if fallback_exc.code == 404:
+                            self._miss_cache.set(miss_key, {"missing_at": int(time.time())})
                         self._log(
                             f"Fallback repository also failed (HTTP {fallback_exc.code}): "
                             f"{component.group}:{component.name}:{component.version}"
@@ -340,45 +392,512 @@ class PackageDownloader:
                 )
         return None, False
 
-    def _validate_artifact_content(self, artifact_content: bytes) -> Tuple[bool, Optional[str]]:
+    def _is_known_missing(self, miss_key: str) -> bool:
+        """
+        Check whether an artifact was recently missing from both repositories.
+
+        Args:
+            miss_key: "group:name:version:type" key of the artifact
+
+        Returns:
+            True if a 404 was recorded within MISS_CACHE_TTL_SECONDS
+        """
+        entry = self._miss_cache.get(miss_key)
+        if not entry:
+            return False
+        return time.time() - entry.get("missing_at", 0) < self.MISS_CACHE_TTL_SECONDS
+
+    @contextmanager
+    def _part_file_lock(self, part_path: Path) -> Iterator[None]:
+        """
+        Serialize downloads that share a partial file.
+
+        The background downloader and the enhanced CSV pass may fetch the same
+        artifact at the same time; only one of them may append to its ".part".
+
+        Args:
+            part_path: Partial download file to lock
+        """
+        with self._part_locks_guard:
+            lock = self._part_locks.setdefault(part_path, threading.Lock())
+        with lock:
+            yield
+
+    def _download_to_part_file(self, url: str, part_path: Path) -> Optional[int]:
+        """
+        Download an artifact into its ".part" file, resuming a previous attempt.
+
+        If the file already holds bytes, only the remainder is requested with
+        a Range header. A 206 reply is appended; a 200 reply (server ignored
+        the range) overwrites the file from the start. If the transfer breaks
+        off, the bytes received so far stay on disk for the next attempt.
+
+        A fresh body that does not start with the ZIP magic bytes (typically
+        an HTML error page) is not downloaded further: only its first bytes
+        are written, so validation rejects it without fetching the rest.
+
+        Args:
+            url: Artifact URL to download
+            part_path: Partial download file
+
+        Returns:
+            Size of the complete file in bytes, or None if the response was unusable
+
+        Raises:
+            HTTPError: If the repository responds with a 4xx/5xx status
         """
-        Validate artifact content using zipfile module (Java-like validation).
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        with self._open_artifact_url(url, headers) as response:
+            if response.status == 206 and offset:
+                content_range = response.headers.get("Content-Range", "")
+                if not content_range.startswith(f"bytes {offset}-"):
+                    part_path.unlink(missing_ok=True)
+                    return None
+                self._log(f"Resuming download of {url} from byte {offset}")
+                mode = "ab"
+            elif response.status == 200:
+                head = response.read(len(_ZIP_MAGIC))
+                if head != _ZIP_MAGIC:
+                    response.close()
+                    part_path.write_bytes(head)
+                    return len(head)
+                size = self._parallel_range_size(response)
+                if size:
+                    return self._download_ranges_in_parallel(
+                        url, response, part_path, size, head
+                    )
+                mode = "wb"
+            else:
+                return None
+            with open(part_path, mode) as part_file:
+                if mode == "wb":
+                    part_file.write(head)
+                shutil.copyfileobj(response, part_file, _DOWNLOAD_CHUNK_SIZE)
+                return part_file.tell()
 
-        Validates that the content is a proper ZIP-based archive by attempting to open it.
-        This is more robust than just checking magic bytes.
+    @staticmethod
+    def _parallel_range_size(response) -> int:
+        """
+        Get the size of a response worth downloading as parallel byte ranges.
 
         Args:
-            artifact_content: Artifact file content as bytes
+            response: Open 200 response for the artifact
+
+        Returns:
+            Content length if it exceeds the threshold and the server accepts
+            byte ranges on the raw (unencoded) body, otherwise 0
+        """
+        headers = response.headers
+        if headers.get("Accept-Ranges") != "bytes" or headers.get("Content-Encoding"):
+            return 0
+        try:
+            size = int(headers.get("Content-Length") or 0)
+        except ValueError:
+            return 0
+        return size if size > _PARALLEL_RANGE_THRESHOLD else 0
+
+    def _download_ranges_in_parallel(
+        self, url: str, response, part_path: Path, size: int, head: bytes
+    ) -> int:
+        """
+        Download a large artifact as several concurrent byte ranges.
+
+        The part file is preallocated to the full size. The already open
+        response supplies the first range while the remaining ranges are
+        fetched on a thread pool and written at their offsets. If any range
+        fails the part file is removed, so the next attempt starts cleanly
+        instead of resuming from a file with holes.
+
+        Args:
+            url: Artifact URL
+            response: Open 200 response for the whole artifact
+            part_path: Partial download file
+            size: Artifact size in bytes
+            head: Bytes already read from the start of the response
+
+        Returns:
+            Size of the complete file in bytes
+        """
+        range_size = -(-size // _PARALLEL_RANGE_PARTS)
+        ranges = [
+            (start, min(start + range_size, size) - 1)
+            for start in range(range_size, size, range_size)
+        ]
+        self._log(f"Downloading {url} as {len(ranges) + 1} parallel ranges ({size} bytes)")
+        with open(part_path, "wb") as part_file:
+            part_file.write(head)
+            part_file.truncate(size)
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(self._download_range, url, part_path, start, end)
+                    for start, end in ranges
+                ]
+                self._copy_range(response, part_path, len(head), range_size - len(head))
+                # Drop the rest of the first response instead of reading it
+                response.close()
+                for future in futures:
+                    future.result()
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        return size
+
+    def _download_range(self, url: str, part_path: Path, start: int, end: int) -> None:
+        """
+        Download one byte range of an artifact into its part file.
+
+        Args:
+            url: Artifact URL
+            part_path: Preallocated partial download file
+            start: First byte of the range
+            end: Last byte of the range (inclusive)
+
+        Raises:
+            ValueError: If the server does not return exactly the requested range
+        """
+        with self._open_artifact_url(url, {"Range": f"bytes={start}-{end}"}) as response:
+            content_range = response.headers.get("Content-Range", "")
+            if response.status != 206 or not content_range.startswith(f"bytes {start}-{end}/"):
+                raise ValueError(f"Server did not honour range {start}-{end} for {url}")
+            self._copy_range(response, part_path, start, end - start + 1)
+
+    @staticmethod
+    def _copy_range(source, part_path: Path, offset: int, length: int) -> None:
+        """
+        Copy exactly ``length`` bytes from a response to an offset in the part file.
+
+        Args:
+            source: Response to read from
+            part_path: Preallocated partial download file
+            offset: File offset to write at
+            length: Number of bytes to copy
+
+        Raises:
+            ConnectionError: If the response ends early
+        """
+        with open(part_path, "r+b") as part_file:
+            part_file.seek(offset)
+            remaining = length
+            while remaining:
+                data = source.read(min(_DOWNLOAD_CHUNK_SIZE, remaining))
+                if not data:
+                    raise ConnectionError(f"Response ended {remaining} bytes short of the range")
+                part_file.write(data)
+                remaining -= len(data)
+
+    def _stream_artifact_to_cache(
+        self,
+        url: str,
+        cached_artifact: Path,
+        component: Component,
+        artifact_label: str,
+        source: str,
+    ) -> Optional[str]:
+        """
+        Stream an artifact into the cache, validating it before it becomes visible.
+
+        The response body is copied in chunks to a ".part" file next to the
+        cache entry, so large JARs are never held in memory, and an interrupted
+        download resumes from that file next time. The file is renamed into
+        place only once it is a non-empty, valid archive, so a failed download
+        never leaves a corrupt cache entry.
+
+        Args:
+            url: Artifact URL to download
+            cached_artifact: Final path of the cached artifact
+            component: Component the artifact belongs to (for logging)
+            artifact_label: Upper-case artifact type used in log messages
+            source: Human-readable repository name used in log messages
+
+        Returns:
+            Cached artifact filename, or None if the download was unusable
+
+        Raises:
+            HTTPError: If the repository responds with a 4xx/5xx status
+        """
+        coordinates = f"{component.group}:{component.name}:{component.version}"
+        part_path = cached_artifact.with_name(f"{cached_artifact.name}.part")
+        with self._part_file_lock(part_path):
+            if cached_artifact.exists():
+                # Another thread finished this artifact while we waited
+                return cached_artifact.name
+            cached_artifact.parent.mkdir(parents=True, exist_ok=True)
+            self._log(f"[{artifact_label} SAVE] Writing file to: {cached_artifact}")
+            try:
+                artifact_size = self._download_to_part_file(url, part_path)
+            except HTTPError as exc:
+                if exc.code != 416:
+                    raise
+                # The partial file cannot be extended (e.g. the artifact
+                # changed size); start over
+                part_path.unlink(missing_ok=True)
+                artifact_size = self._download_to_part_file(url, part_path)
+            if artifact_size is None:
+                return None
+
+            try:
+                if artifact_size == 0:
+                    self._log(
+                        f"[{artifact_label} DOWNLOAD] ERROR: Downloaded empty file from {source}: "
+                        f"{coordinates}"
+                    )
+                    return None
+
+                # Validate artifact using zipfile module (Java-like validation)
+                is_valid, validation_error = self._validate_artifact_file(part_path)
+                if not is_valid:
+                    self._log(
+                        f"[{artifact_label} DOWNLOAD] ERROR: Downloaded file from {source} is not "
+                        f"a valid {artifact_label}: {validation_error} for {coordinates} "
+                        f"(size: {artifact_size} bytes)"
+                    )
+                    return None
+
+                os.replace(part_path, cached_artifact)
+            finally:
+                part_path.unlink(missing_ok=True)
+
+        self._log(f"[{artifact_label} SAVE] Wrote {artifact_size} bytes to {cached_artifact}")
+        self._log(f"Cached {artifact_label} from {source}: {cached_artifact.name} ({coordinates})")
+        return cached_artifact.name
+
+    def download_packages(
+        self, items: List[Tuple[Component, str]], max_workers: int = 8
+    ) -> Dict[Tuple[str, str], Tuple[Optional[str], bool]]:
+        """
+        Download several artifacts concurrently.
+
+        Downloads are network-bound, so overlapping them on a thread pool hides
+        per-request latency. Workers share this downloader's connection pool and
+        the worker count is capped at the pool size.
+
+        Args:
+            items: (component, artifact_type) pairs to download
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Dictionary mapping (component identifier, artifact type) to the
+            (filename, auth_required) result of download_package
+        """
+        results: Dict[Tuple[str, str], Tuple[Optional[str], bool]] = {}
+        if not items:
+            return results
+
+        # One Maven run fetches what it can; download_package then finds those
+        # artifacts cached and only handles the rest individually
+        if self.use_maven:
+            self.bulk_download_with_maven(items)
+
+        workers = max(1, min(max_workers, _HTTP_POOL_MAXSIZE, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_key = {
+                executor.submit(self.download_package, comp, artifact_type): (
+                    comp.get_identifier(),
+                    artifact_type,
+                )
+                for comp, artifact_type in items
+            }
+            for future in as_completed(future_to_key):
+                key = future_to_key[future]
+                try:
+                    results[key] = future.result()
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    self._log(f"Artifact download failed for {key[0]} ({key[1]}): {exc}")
+                    results[key] = (None, False)
+        return results
+
+    def bulk_download_with_maven(
+        self, items: List[Tuple[Component, str]]
+    ) -> Dict[Tuple[str, str], str]:
+        """
+        Download many artifacts with a single Maven invocation.
+
+        Every `mvn dependency:get` call starts a new JVM. This writes a throwaway
+        POM that declares all uncached artifacts as direct dependencies and
+        runs dependency:copy-dependencies once, so JVM startup and Maven's
+        repository connections are shared by the whole batch. Artifacts Maven
+        cannot produce are left for download_package to fetch one by one.
+
+        Args:
+            items: (component, artifact_type) pairs to download
+
+        Returns:
+            Dictionary mapping (component identifier, artifact type) to the
+            cached filename, for artifacts this call placed in the cache
+        """
+        # Batches requested concurrently (the background downloader and
+        # enhanced.csv) run one at a time; a later batch then finds the
+        # artifacts an earlier one fetched in the cache and skips them.
+        with self._bulk_lock:
+            return self._bulk_download_with_maven_locked(items)
+
+    def _bulk_download_with_maven_locked(
+        self, items: List[Tuple[Component, str]]
+    ) -> Dict[Tuple[str, str], str]:
+        """
+        Run one Maven batch; the caller holds _bulk_lock.
+
+        Args:
+            items: (component, artifact_type) pairs to download
+
+        Returns:
+            Dictionary mapping (component identifier, artifact type) to the
+            cached filename, for artifacts this call placed in the cache
+        """
+        results: Dict[Tuple[str, str], str] = {}
+        pending: Dict[Tuple[str, str, str, str], List[Tuple[Tuple[str, str], Path]]] = {}
+        for comp, artifact_type in items:
+            if not comp.group or not comp.name or not comp.version:
+                continue
+            artifact_type = artifact_type.lower()
+            cached_artifact = self._cached_artifact_path(comp, artifact_type)
+            if cached_artifact.exists():
+                continue
+            coordinates = (comp.group, comp.name, comp.version, artifact_type)
+            pending.setdefault(coordinates, []).append(
+                ((comp.get_identifier(), artifact_type), cached_artifact)
+            )
+        if not pending or not self._check_maven_available():
+            return results
+
+        cached_count = 0
+
+        dependencies = "".join(
+            f"""
+        <dependency>
+            <groupId>{escape(group)}</groupId>
+            <artifactId>{escape(name)}</artifactId>
+            <version>{escape(version)}</version>
+            <type>{escape(artifact_type)}</type>
+        </dependency>"""
+            for group, name, version, artifact_type in pending
+        )
+        bulk_pom = f"""<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0"
+         xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+         xsi:schemaLocation="http://maven.apache.org/POM/4.0.0
+         http://maven.apache.org/xsd/maven-4.0.0.xsd">
+    <modelVersion>4.0.0</modelVersion>
+    <groupId>sbom-compile-order</groupId>
+    <artifactId>bulk-download</artifactId>
+    <version>1</version>
+    <packaging>pom</packaging>
+    <dependencies>{dependencies}
+    </dependencies>
+</project>"""
+
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_path = Path(temp_dir)
+                work_pom = temp_path / "pom.xml"
+                work_pom.write_text(bulk_pom, encoding="utf-8")
+                output_dir = temp_path / "artifacts"
+                cmd = [
+                    "mvn",
+                    "-f",
+                    str(work_pom),
+                    "dependency:copy-dependencies",
+                    f"-DoutputDirectory={output_dir}",
+                    "-Dmdep.useRepositoryLayout=true",
+                    "-DexcludeTransitive=true",
+                ]
+                if not self.verbose:
+                    cmd.append("-q")
+
+                self._log(
+                    f"[MAVEN BULK DOWNLOAD] Resolving {len(pending)} artifacts with one Maven run"
+                )
+                returncode, output_tail = self._run_maven(cmd, timeout=120 + 5 * len(pending))
+                if returncode != 0:
+                    self._log(
+                        f"[MAVEN BULK DOWNLOAD] Maven exited with code {returncode}; "
+                        f"remaining artifacts will be downloaded individually"
+                    )
+                    if self.verbose:
+                        self._log(f"[MAVEN BULK DOWNLOAD] Maven output (tail): {output_tail}")
+
+                local_repo = Path.home() / ".m2" / "repository"
+                for (group, name, version, artifact_type), targets in pending.items():
+                    relative_path = Path(
+                        *group.split("."), name, version, f"{name}-{version}.{artifact_type}"
+                    )
+                    downloaded = output_dir / relative_path
+                    if not downloaded.exists():
+                        # One unresolvable artifact fails the whole run, but the
+                        # ones Maven did resolve are in the local repository
+                        downloaded = local_repo / relative_path
+                        if not downloaded.exists():
+                            continue
+                    is_valid, validation_error = self._validate_artifact_file(downloaded)
+                    if not is_valid:
+                        self._log(
+                            f"[MAVEN BULK DOWNLOAD] ERROR: Maven downloaded invalid "
+                            f"{artifact_type.upper()}: {validation_error} "
+                            f"for {group}:{name}:{version}"
+                        )
+                        continue
+                    for key, cached_artifact in targets:
+                        cached_artifact.parent.mkdir(parents=True, exist_ok=True)
+                        part_path = cached_artifact.with_name(
+                            f"{cached_artifact.name}.{os.getpid()}.{threading.get_ident()}.part"
+                        )
+                        shutil.copyfile(downloaded, part_path)
+                        os.replace(part_path, cached_artifact)
+                        results[key] = cached_artifact.name
+                    cached_count += 1
+        except subprocess.TimeoutExpired:
+            self._log("[MAVEN BULK DOWNLOAD] Maven run timed out")
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._log(f"[MAVEN BULK DOWNLOAD] Error executing Maven command: {exc}")
+
+        self._log(f"[MAVEN BULK DOWNLOAD] Cached {cached_count} of {len(pending)} artifacts")
+        return results
+
+    def _validate_artifact_file(self, artifact_path: Path) -> Tuple[bool, Optional[str]]:
+        """
+        Validate an artifact file using zipfile module (Java-like validation).
+
+        Validates that the file is a proper ZIP-based archive by attempting to open it.
+        This is more robust than just checking magic bytes. Only the ZIP
+        directory is read, not the whole archive.
+
+        Args:
+            artifact_path: Path to the artifact file
 
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not artifact_content:
-            return False, "Artifact content is empty"
-        
-        if len(artifact_content) < 4:
-            return False, f"Artifact content too small ({len(artifact_content)} bytes)"
-        
-        # Check ZIP magic bytes first (quick check)
-        if artifact_content[:4] != b"PK\x03\x04":
-            return False, f"Invalid ZIP magic bytes: {artifact_content[:4]}"
-        
-        # Validate using zipfile module (proper ZIP structure validation)
         try:
-            with zipfile.ZipFile(io.BytesIO(artifact_content), 'r') as jar_file:
+            artifact_size = artifact_path.stat().st_size
+            if not artifact_size:
+                return False, "Artifact content is empty"
+
+            if artifact_size < 4:
+                return False, f"Artifact content too small ({artifact_size} bytes)"
+
+            # Check ZIP magic bytes first (quick check)
+            with open(artifact_path, "rb") as f:
+                magic = f.read(len(_ZIP_MAGIC))
+            if magic != _ZIP_MAGIC:
+                return False, f"Invalid ZIP magic bytes: {magic}"
+
+            # Validate using zipfile module (proper ZIP structure validation)
+            with zipfile.ZipFile(artifact_path, "r") as jar_file:
                 # Test that we can read the file list (validates ZIP structure)
                 file_list = jar_file.namelist()
-                
+
                 # Check for MANIFEST.MF (standard JAR/WAR file should have this)
-                has_manifest = 'META-INF/MANIFEST.MF' in file_list
-                
+                has_manifest = "META-INF/MANIFEST.MF" in file_list
+
                 # Log some metadata if verbose
                 if self.verbose:
                     self._log(
                         f"[ARTIFACT VALIDATION] Valid artifact archive with {len(file_list)} entries, "
                         f"has MANIFEST.MF: {has_manifest}"
                     )
-                
+
                 return True, None
         except zipfile.BadZipFile as exc:
             return False, f"Invalid ZIP/JAR structure: {exc}"
@@ -409,28 +928,12 @@ class PackageDownloader:
         if not component.group or not component.name or not component.version:
             return None, False
 
-        # Check if Maven is available
-        try:
-            result = subprocess.run(
-                ["mvn", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                self._log(f"[{artifact_label} DOWNLOAD] Maven not available, falling back to HTTP download")
-                return None, False
-        except FileNotFoundError:
-            self._log(f"[{artifact_label} DOWNLOAD] Maven command not found, falling back to HTTP download")
-            return None, False
-        except subprocess.TimeoutExpired:
+        # Availability is checked once per downloader; spawning `mvn --version`
+        # for every artifact would start a JVM per download
+        if not self._check_maven_available():
             self._log(
-                f"[{artifact_label} DOWNLOAD] Maven version check timed out, falling back to HTTP download"
-            )
-            return None, False
-        except Exception as exc:  # pylint: disable=broad-exception-caught
-            self._log(
-                f"[{artifact_label} DOWNLOAD] Error checking Maven availability: {exc}, falling back to HTTP download"
+                f"[{artifact_label} DOWNLOAD] Maven not available, "
+                f"falling back to HTTP download"
             )
             return None, False
 
@@ -460,23 +963,18 @@ class PackageDownloader:
 
             self._log(f"[{artifact_label} DOWNLOAD] Executing Maven command: {' '.join(cmd)}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            returncode, output_tail = self._run_maven(cmd, timeout=120)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 if not cached_artifact.exists():
                     self._try_copy_from_maven_local_repo(component, cached_artifact, artifact_type)
                 if cached_artifact.exists():
                     file_size = cached_artifact.stat().st_size
                     if file_size > 0:
                         try:
-                            with open(cached_artifact, "rb") as f:
-                                artifact_content = f.read()
-                            is_valid, validation_error = self._validate_artifact_content(artifact_content)
+                            is_valid, validation_error = self._validate_artifact_file(
+                                cached_artifact
+                            )
                             if is_valid:
                                 self._log(
                                     f"[{artifact_label} DOWNLOAD] SUCCESS: Maven downloaded {artifact_label}: {cached_artifact.name} "
@@ -504,23 +1002,18 @@ class PackageDownloader:
                     f"[{artifact_label} DOWNLOAD] ERROR: Maven command succeeded but file not found: {cached_artifact}"
                 )
                 return None, False
-            error_output = result.stderr + result.stdout
-            if any(
-                auth_indicator in error_output.lower()
-                for auth_indicator in ["401", "403", "unauthorized", "authentication", "credentials"]
-            ):
+            if _MAVEN_AUTH_RE.search(output_tail):
                 self._log(
                     f"[{artifact_label} DOWNLOAD] Authentication required for Maven download: "
                     f"{component.group}:{component.name}:{component.version}"
                 )
                 return None, True
             self._log(
-                f"[{artifact_label} DOWNLOAD] Maven download failed (exit code {result.returncode}): "
+                f"[{artifact_label} DOWNLOAD] Maven download failed (exit code {returncode}): "
                 f"{component.group}:{component.name}:{component.version}"
             )
             if self.verbose:
-                self._log(f"[{artifact_label} DOWNLOAD] Maven stderr: {result.stderr}")
-                self._log(f"[{artifact_label} DOWNLOAD] Maven stdout: {result.stdout}")
+                self._log(f"[{artifact_label} DOWNLOAD] Maven output (tail): {output_tail}")
             return None, False
 
         except subprocess.TimeoutExpired:
@@ -548,7 +1041,6 @@ class PackageDownloader:
             URL string for downloading the artifact from fallback repository
         """
         if component.group and component.name and component.version:
-            from sbom_compile_order.parser import build_maven_central_url
             fallback_base_url = "https://mvnrepository.com/repos/central"
             return build_maven_central_url(
                 component.group, component.name, component.version, artifact_type, base_url=fallback_base_url
@@ -560,6 +1052,11 @@ class PackageDownloader:
     ) -> None:
         """
         When Maven downloads succeed but dest file isn't written, copy from Maven local repo.
+
+        The cache entry is hard-linked to the local repository file when both
+        live on the same filesystem, so no bytes are copied; otherwise the file
+        is copied with shutil.copyfile, which uses the kernel's zero-copy path
+        where available.
         """
         if not component.group or not component.name or not component.version:
             return
@@ -570,7 +1067,11 @@ class PackageDownloader:
         if local_repo_path.exists():
             try:
                 cached_artifact.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(local_repo_path, cached_artifact)
+                try:
+                    os.link(local_repo_path, cached_artifact)
+                except OSError:
+                    # Different filesystem, or links unsupported
+                    shutil.copyfile(local_repo_path, cached_artifact)
                 self._log(
                     f"[{artifact_type.upper()} DOWNLOAD] Copied {artifact_filename} from local Maven repo to cache"
                 )
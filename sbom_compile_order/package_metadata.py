@@ -2,6 +2,7 @@
 Unified package metadata lookup that supports both Maven and npm registries.
 """
 
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from sbom_compile_order.maven_central import MavenCentralClient
@@ -12,14 +13,36 @@ from sbom_compile_order.parser import Component, extract_package_type
 class PackageMetadataClient:
     """Wraps registry-specific clients so callers can request metadata generically."""
 
-    def __init__(self, verbose: bool = False) -> None:
+    MAVEN_CACHE_FILENAME = "maven-central-cache.sqlite"
+    NPM_CACHE_FILENAME = "npm-registry-cache.sqlite"
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        cache_dir: Optional[Path] = None,
+        npm_client: Optional[NpmRegistryClient] = None,
+    ) -> None:
         """
         Args:
             verbose: If True, enables verbose logging for downstream clients.
+            cache_dir: Optional working directory for persistent metadata caches.
+                Clients sharing a cache_dir (across threads or processes) share lookups.
+            npm_client: Optional npm registry client to share (it is thread-safe),
+                so several metadata clients reuse one npm cache and rate limiter.
         """
         self._verbose = verbose
-        self._maven_client = MavenCentralClient(verbose=verbose)
-        self._npm_client = NpmRegistryClient(verbose=verbose)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        maven_cache_path = self.cache_dir / self.MAVEN_CACHE_FILENAME if self.cache_dir else None
+        self._maven_client = MavenCentralClient(verbose=verbose, cache_path=maven_cache_path)
+        npm_cache_path = self.cache_dir / self.NPM_CACHE_FILENAME if self.cache_dir else None
+        self._npm_client = npm_client or NpmRegistryClient(
+            verbose=verbose, cache_path=npm_cache_path
+        )
+
+    @property
+    def npm_client(self) -> NpmRegistryClient:
+        """The npm registry client used for npm lookups."""
+        return self._npm_client
 
     def _is_npm_package(self, component: Component) -> bool:
         """Check if a component is an npm package."""
@@ -33,12 +56,34 @@ class PackageMetadataClient:
         Returns homepage URL and license for the given package.
 
         Delegates to Maven Central for Maven packages and to the npm registry
-        for npm packages.
+        for npm packages. Other ecosystems are skipped without a lookup.
         """
         if self._is_npm_package(component):
             return self._npm_client.get_package_info(component)
+        if not MavenCentralClient.is_maven_candidate(component):
+            return None, None
         return self._maven_client.get_package_info(component)
 
+    def prefetch_npm_metadata(self, components: List[Component]) -> int:
+        """
+        Concurrently fetch npm registry metadata for the npm components given.
+
+        Later per-component lookups are then served from the npm client's cache.
+
+        Args:
+            components: Components to prefetch; non-npm components are skipped
+
+        Returns:
+            Number of packages fetched successfully
+        """
+        package_names = [
+            component.name
+            for component in components
+            if component.name and self._is_npm_package(component)
+        ]
+        results = self._npm_client.fetch_many(package_names)
+        return sum(1 for metadata in results.values() if metadata)
+
     def get_comprehensive_npm_data(self, component: Component) -> Optional[Dict]:
         """
         Get comprehensive npm package data including dependencies, author, etc.
@@ -195,6 +195,21 @@ class ParallelDownloader:
             self._log(f"[PARALLEL DOWNLOAD] ERROR downloading {artifact_label} for {component_id}: {exc}")
         return component_id, False, artifact_type
 
+    def _prefetch_artifacts_with_maven(self, items: List[Tuple[Component, str]]) -> None:
+        """
+        Resolve all requested artifacts with a single Maven run.
+
+        Args:
+            items: (component, artifact_type) pairs that will be downloaded
+        """
+        try:
+            cached = self.artifact_downloader.bulk_download_with_maven(items)
+            self._log(
+                f"[PARALLEL DOWNLOAD] Maven batch cached {len(cached)} of {len(items)} artifacts"
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._log(f"[PARALLEL DOWNLOAD] ERROR in Maven batch download: {exc}")
+
     def _download_npm_package(self, component: Component) -> Tuple[str, bool, str]:
         """
         Download npm package tarball for a component.
@@ -283,15 +298,26 @@ class ParallelDownloader:
             success_count = 0
             fail_count = 0
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all tasks
+                # Submit POM and npm tasks first so they run while Maven resolves artifacts
                 future_to_task = {}
+                artifact_tasks = []
                 for file_type, comp in download_tasks:
                     if file_type == "pom":
                         future = executor.submit(self._download_pom, comp)
                     elif file_type == "npm":
                         future = executor.submit(self._download_npm_package, comp)
                     else:
-                        future = executor.submit(self._download_artifact, comp, file_type)
+                        artifact_tasks.append((comp, file_type))
+                        continue
+                    future_to_task[future] = (file_type, comp)
+
+                # One Maven run fetches the whole batch; the per-artifact tasks then find
+                # those artifacts cached and only fetch the rest individually
+                if artifact_tasks and self.artifact_downloader.use_maven:
+                    self._prefetch_artifacts_with_maven(artifact_tasks)
+
+                for comp, file_type in artifact_tasks:
+                    future = executor.submit(self._download_artifact, comp, file_type)
                     future_to_task[future] = (file_type, comp)
 
                 # Process completed downloads
@@ -6,14 +6,39 @@ Parses CycloneDX SBOM JSON files and extracts component and dependency informati
 
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import unquote
 
 
+# Characters of a component identifier that cannot appear in a cache file name
+_CACHE_KEY_TABLE = str.maketrans({"/": "_", ":": "_", "@": "_"})
+
+
+def _intern(value: object) -> object:
+    """Intern string values (SBOM refs used as dict keys); pass others through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class Component:
     """Represents a component from the SBOM."""
 
+    __slots__ = (
+        "ref",
+        "group",
+        "name",
+        "version",
+        "purl",
+        "type",
+        "scope",
+        "raw_data",
+        "source_url",
+        "coordinates",
+        "group_id",
+        "identifier",
+    )
+
     def __init__(self, component_data: Dict) -> None:
         """
         Initialize a Component from SBOM component data.
@@ -21,8 +46,12 @@ class Component:
         Args:
             component_data: Dictionary containing component information from SBOM
         """
-        self.ref = component_data.get("bom-ref", "")
-        self.group = component_data.get("group", "")
+        # bom-refs are used as dict keys and graph nodes throughout; interning
+        # lets equal refs compare by identity
+        self.ref = _intern(component_data.get("bom-ref", ""))
+        # Many components share a group (e.g. org.apache.commons); intern it so
+        # each distinct group is stored once
+        self.group = _intern(component_data.get("group", ""))
         self.name = component_data.get("name", "")
         self.version = component_data.get("version", "")
         self.purl = component_data.get("purl", "")
@@ -30,6 +59,11 @@ class Component:
         self.scope = component_data.get("scope", "required")
         self.raw_data = component_data
         self.source_url = self._extract_source_url(component_data)
+        # Display strings used by every output format, built once per component
+        self.coordinates = f"{self.group}:{self.name}:{self.version}"
+        self.group_id = _intern(f"{self.group}:{self.name}") if self.group else self.name
+        # Used as the graph node, dict key, hash and equality key of the component
+        self.identifier = self.ref or self.purl or self.coordinates
 
     def _extract_source_url(self, component_data: Dict) -> str:
         """
@@ -69,25 +103,31 @@ class Component:
         Returns:
             String identifier (prefers ref, falls back to purl or group:name:version)
         """
-        if self.ref:
-            return self.ref
-        if self.purl:
-            return self.purl
-        return f"{self.group}:{self.name}:{self.version}"
+        return self.identifier
+
+    def get_cache_key(self) -> str:
+        """
+        Get the file name stem used for this component's cached POM/JAR/tarball.
+
+        Returns:
+            Identifier without query parameters or URL fragment, with "/", ":"
+            and "@" replaced by "_"
+        """
+        return self.identifier.partition("?")[0].partition("#")[0].translate(_CACHE_KEY_TABLE)
 
     def __repr__(self) -> str:
         """Return string representation of component."""
-        return f"Component({self.group}:{self.name}:{self.version})"
+        return f"Component({self.coordinates})"
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on identifier."""
         if not isinstance(other, Component):
             return False
-        return self.get_identifier() == other.get_identifier()
+        return self.identifier == other.identifier
 
     def __hash__(self) -> int:
         """Hash based on identifier."""
-        return hash(self.get_identifier())
+        return hash(self.identifier)
 
 
 def clean_artifact_name(artifact: str, version: Optional[str] = None) -> str:
@@ -335,7 +375,7 @@ class SBOMParser:
         components_list = self.sbom_data.get("components", [])
         for comp_data in components_list:
             component = Component(comp_data)
-            identifier = component.get_identifier()
+            identifier = _intern(component.get_identifier())
             self.components[identifier] = component
 
         # Parse dependencies
@@ -345,7 +385,8 @@ class SBOMParser:
             if not dep_ref:
                 continue
 
-            depends_on = dep_data.get("dependsOn", [])
+            dep_ref = _intern(dep_ref)
+            depends_on = [_intern(ref) for ref in dep_data.get("dependsOn", [])]
             if dep_ref not in self.dependencies:
                 self.dependencies[dep_ref] = []
             self.dependencies[dep_ref].extend(depends_on)
@@ -579,12 +579,7 @@ class POMDependencyExtractor:
                     )
 
                     # Check if POM already exists
-                    identifier = component.get_identifier()
-                    if "?" in identifier:
-                        identifier = identifier.split("?")[0]
-                    if "#" in identifier:
-                        identifier = identifier.split("#")[0]
-                    cache_key = identifier.replace("/", "_").replace(":", "_").replace("@", "_")
+                    cache_key = component.get_cache_key()
                     cached_pom = self.pom_cache_dir / f"{cache_key}.pom"
 
                     if cached_pom.exists():
@@ -669,12 +664,7 @@ class POMDependencyExtractor:
                         )
 
                         # Generate expected POM filename
-                        identifier = dep_component.get_identifier()
-                        if "?" in identifier:
-                            identifier = identifier.split("?")[0]
-                        if "#" in identifier:
-                            identifier = identifier.split("#")[0]
-                        cache_key = identifier.replace("/", "_").replace(":", "_").replace("@", "_")
+                        cache_key = dep_component.get_cache_key()
                         expected_pom = self.pom_cache_dir / f"{cache_key}.pom"
 
                         # If POM doesn't exist and we haven't processed it, add to queue
@@ -879,12 +869,7 @@ class POMDependencyExtractor:
                         "scope": current_dep.scope,
                     }
                 )
-                identifier = component.get_identifier()
-                if "?" in identifier:
-                    identifier = identifier.split("?")[0]
-                if "#" in identifier:
-                    identifier = identifier.split("#")[0]
-                cache_key = identifier.replace("/", "_").replace(":", "_").replace("@", "_")
+                cache_key = component.get_cache_key()
                 cached_pom = self.pom_cache_dir / f"{cache_key}.pom"
 
                 if cached_pom.exists():
@@ -937,12 +922,7 @@ class POMDependencyExtractor:
                             "scope": dep.scope,
                         }
                     )
-                    identifier = component.get_identifier()
-                    if "?" in identifier:
-                        identifier = identifier.split("?")[0]
-                    if "#" in identifier:
-                        identifier = identifier.split("#")[0]
-                    cache_key = identifier.replace("/", "_").replace(":", "_").replace("@", "_")
+                    cache_key = component.get_cache_key()
                     expected_pom = self.pom_cache_dir / f"{cache_key}.pom"
                     if expected_pom.exists():
                         pom_filename = expected_pom.name
@@ -11,6 +11,7 @@ import shutil
 import ssl
 import subprocess
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
@@ -19,7 +20,20 @@ from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
 from sbom_compile_order import __version__
-from sbom_compile_order.parser import Component, build_maven_central_url_from_purl
+from sbom_compile_order.parser import (
+    Component,
+    build_maven_central_url,
+    build_maven_central_url_from_purl,
+)
+
+# Leading /<user>/<repo> of a GitHub, GitLab or Bitbucket repository path
+_USER_REPO_PATH_RE = re.compile(r"^/([^/]+)/([^/]+)")
+
+# Maven output that indicates the repository requires credentials
+_MAVEN_AUTH_RE = re.compile(r"401|403|unauthorized|authentication|credentials", re.IGNORECASE)
+
+# Characters not allowed in a cached repository directory name
+_UNSAFE_REPO_NAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]")
 
 
 class POMDownloader:
@@ -50,6 +64,8 @@ class POMDownloader:
         self.clone_repos = clone_repos
         self.download_from_maven_central = download_from_maven_central
         
+        self._maven_available: Optional[bool] = None  # Cache Maven availability check
+
         # Auto-detect Maven if not explicitly set
         if use_maven is None:
             self.use_maven = self._check_maven_available()
@@ -72,6 +88,9 @@ class POMDownloader:
         Returns:
             True if Maven is available, False otherwise
         """
+        if self._maven_available is not None:
+            return self._maven_available
+
         try:
             result = subprocess.run(
                 ["mvn", "--version"],
@@ -79,9 +98,10 @@ class POMDownloader:
                 text=True,
                 timeout=10,
             )
-            return result.returncode == 0
+            self._maven_available = result.returncode == 0
         except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-            return False
+            self._maven_available = False
+        return self._maven_available
 
     def _log(self, message: str) -> None:
         """
@@ -119,7 +139,7 @@ class POMDownloader:
         repo_name = repo_name.rstrip("/").removesuffix(".git")
 
         # Replace invalid characters with underscores
-        repo_name = re.sub(r"[^a-zA-Z0-9._-]", "_", repo_name)
+        repo_name = _UNSAFE_REPO_NAME_CHARS_RE.sub("_", repo_name)
         return repo_name
 
     def _is_auth_required(self, error_output: str) -> bool:
@@ -348,13 +368,14 @@ class POMDownloader:
         """
         urls = []
         parsed = urlparse(repo_url)
+        netloc_lower = parsed.netloc.lower()
 
         # Common branches to try
         branches = ["master", "main", "develop", "trunk"]
 
         # GitHub
-        if "github.com" in parsed.netloc.lower():
-            match = re.match(r"^/([^/]+)/([^/]+)", parsed.path)
+        if "github.com" in netloc_lower:
+            match = _USER_REPO_PATH_RE.match(parsed.path)
             if match:
                 user = match.group(1)
                 repo = match.group(2).removesuffix(".git")
@@ -370,8 +391,8 @@ class POMDownloader:
                         urls.append(f"https://raw.githubusercontent.com/{user}/{repo}/{branch}/{group_path}/{package_name}/pom.xml")
 
         # GitLab
-        elif "gitlab.com" in parsed.netloc.lower() or "gitlab" in parsed.netloc.lower():
-            match = re.match(r"^/([^/]+)/([^/]+)", parsed.path)
+        elif "gitlab" in netloc_lower:  # gitlab.com or a self-hosted GitLab
+            match = _USER_REPO_PATH_RE.match(parsed.path)
             if match:
                 user = match.group(1)
                 repo = match.group(2).removesuffix(".git")
@@ -380,8 +401,8 @@ class POMDownloader:
                     urls.append(f"https://{parsed.netloc}/{user}/{repo}/-/raw/{branch}/{package_name}/pom.xml")
 
         # Bitbucket
-        elif "bitbucket.org" in parsed.netloc.lower():
-            match = re.match(r"^/([^/]+)/([^/]+)", parsed.path)
+        elif "bitbucket.org" in netloc_lower:
+            match = _USER_REPO_PATH_RE.match(parsed.path)
             if match:
                 user = match.group(1)
                 repo = match.group(2).removesuffix(".git")
@@ -411,25 +432,10 @@ class POMDownloader:
         if not component.group or not component.name or not component.version:
             return None, False
 
-        # Check if Maven is available
-        try:
-            result = subprocess.run(
-                ["mvn", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                self._log("[POM DOWNLOAD] Maven not available, falling back to HTTP download")
-                return None, False
-        except FileNotFoundError:
-            self._log("[POM DOWNLOAD] Maven command not found, falling back to HTTP download")
-            return None, False
-        except subprocess.TimeoutExpired:
-            self._log("[POM DOWNLOAD] Maven version check timed out, falling back to HTTP download")
-            return None, False
-        except Exception as exc:  # pylint: disable=broad-exception-caught
-            self._log(f"[POM DOWNLOAD] Error checking Maven availability: {exc}, falling back to HTTP download")
+        # Availability is checked once per downloader; spawning `mvn --version`
+        # for every artifact would start a JVM per download
+        if not self._check_maven_available():
+            self._log("[POM DOWNLOAD] Maven not available, falling back to HTTP download")
             return None, False
 
         # Ensure parent directory exists
@@ -515,11 +521,7 @@ class POMDownloader:
                     return None, False
             else:
                 # Check if authentication is required
-                error_output = result.stderr + result.stdout
-                if any(
-                    auth_indicator in error_output.lower()
-                    for auth_indicator in ["401", "403", "unauthorized", "authentication", "credentials"]
-                ):
+                if _MAVEN_AUTH_RE.search(result.stderr) or _MAVEN_AUTH_RE.search(result.stdout):
                     self._log(
                         f"[POM DOWNLOAD] Authentication required for Maven download: "
                         f"{component.group}:{component.name}:{component.version}"
@@ -562,7 +564,6 @@ class POMDownloader:
         if not component.group or not component.name or not component.version:
             return None
         
-        from sbom_compile_order.parser import build_maven_central_url
         fallback_base_url = "https://mvnrepository.com/repos/central"
         return build_maven_central_url(
             component.group, component.name, component.version, file_type, base_url=fallback_base_url
@@ -596,7 +597,6 @@ class POMDownloader:
                 pom_url = build_maven_central_url_from_purl(component.purl, file_type="pom")
             else:
                 # Fallback: build URL from coordinates if PURL not available
-                from sbom_compile_order.parser import build_maven_central_url
                 pom_url = build_maven_central_url(component.group, component.name, component.version, "pom")
             
             if not pom_url:
@@ -876,17 +876,7 @@ class POMDownloader:
         component_id = f"{component.group}:{component.name}:{component.version}" if component.group and component.name and component.version else component.get_identifier()
         self._log(f"[start] Package: {component_id}")
         
-        # Create a cache key based on component identifier
-        # Clean up the identifier by removing query parameters and URL fragments
-        identifier = component.get_identifier()
-        # Remove query parameters (everything after ?)
-        if "?" in identifier:
-            identifier = identifier.split("?")[0]
-        # Remove URL fragments (everything after #)
-        if "#" in identifier:
-            identifier = identifier.split("#")[0]
-        # Replace problematic characters for filename
-        cache_key = identifier.replace("/", "_").replace(":", "_").replace("@", "_")
+        cache_key = component.get_cache_key()
         cached_pom = self.pom_cache_dir / f"{cache_key}.pom"
 
         # Check if already cached
@@ -989,10 +979,14 @@ class POMDownloader:
                     self._log(f"[POM SAVE] Writing POM file to: {cached_pom}")
                     # Ensure parent directory exists
                     cached_pom.parent.mkdir(parents=True, exist_ok=True)
-                    with open(cached_pom, "wb") as f:
+                    # Write beside the cache entry and rename it into place: a crash
+                    # never leaves a truncated POM, without an fsync per file
+                    part_path = cached_pom.with_name(
+                        f"{cached_pom.name}.{os.getpid()}.{threading.get_ident()}.part"
+                    )
+                    with open(part_path, "wb") as f:
                         bytes_written = f.write(pom_content)
-                        f.flush()
-                        os.fsync(f.fileno())
+                    os.replace(part_path, cached_pom)
                     self._log(f"[POM SAVE] Wrote {bytes_written} bytes to {cached_pom}")
                     
                     # Verify file was written
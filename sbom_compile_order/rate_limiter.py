@@ -0,0 +1,194 @@
+"""
+Rate limiting and retry helpers for registry clients.
+
+Each registry client owns its own limiter so that throttling against one host
+(e.g. Maven Central) never consumes the request budget of another (e.g. npm).
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+from urllib.error import HTTPError, URLError
+
+T = TypeVar("T")
+
+# Status codes where the server is asking us to slow down rather than failing outright
+THROTTLE_STATUS_CODES = (429, 503)
+# Upper bound on a server-provided Retry-After so a bad header cannot stall a run
+MAX_RETRY_AFTER = 60.0
+# Fraction of the configured rate restored per successful request after throttling
+RATE_RECOVERY_FRACTION = 0.05
+
+
+class LeakyBucket:
+    """
+    Thread-safe, adaptive leaky-bucket rate limiter.
+
+    Requests fill the bucket by one unit each and the bucket drains at
+    ``rate_per_sec``. Up to ``capacity`` requests may be admitted back-to-back
+    (burst); once the bucket is full, callers sleep until enough has leaked
+    out to admit them, which caps the sustained rate at ``rate_per_sec``.
+
+    The drain rate adapts to server feedback (AIMD): each throttling response
+    halves it, down to ``min_rate_per_sec``, and each success restores a
+    fixed fraction of the configured rate.
+    """
+
+    def __init__(
+        self, rate_per_sec: float, capacity: float, min_rate_per_sec: Optional[float] = None
+    ) -> None:
+        """
+        Initialize the bucket.
+
+        Args:
+            rate_per_sec: Configured (maximum) sustained leak rate in requests per second
+            capacity: Maximum burst size (bucket depth)
+            min_rate_per_sec: Floor for the rate after throttling; defaults to
+                1/16 of ``rate_per_sec``
+        """
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.max_rate_per_sec = float(rate_per_sec)
+        self.min_rate_per_sec = min(
+            float(min_rate_per_sec or rate_per_sec / 16), self.max_rate_per_sec
+        )
+        self.rate_per_sec = self.max_rate_per_sec
+        self.capacity = float(capacity)
+        self._queue_depth = 0.0
+        self._last_leak = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict:
+        """Pickle the configuration only; a fresh, empty bucket is built on load."""
+        return {
+            "rate_per_sec": self.max_rate_per_sec,
+            "capacity": self.capacity,
+            "min_rate_per_sec": self.min_rate_per_sec,
+        }
+
+    def __setstate__(self, state: Dict) -> None:
+        """Rebuild the bucket (and its lock) in the unpickling process."""
+        self.__init__(state["rate_per_sec"], state["capacity"], state.get("min_rate_per_sec"))
+
+    def _leak(self, now: float) -> None:
+        """Drain the bucket for the time elapsed since the last leak."""
+        elapsed = now - self._last_leak
+        self._last_leak = now
+        if elapsed > 0:
+            self._queue_depth = max(0.0, self._queue_depth - elapsed * self.rate_per_sec)
+
+    def acquire(self) -> float:
+        """
+        Admit one request, sleeping if the bucket is full.
+
+        The slot is reserved while holding the lock and the sleep happens
+        outside it, so concurrent callers queue up behind each other instead
+        of all waking at the same instant.
+
+        Returns:
+            Number of seconds the caller slept
+        """
+        with self._lock:
+            self._leak(time.monotonic())
+            overflow = self._queue_depth + 1 - self.capacity
+            wait = overflow / self.rate_per_sec if overflow > 0 else 0.0
+            self._queue_depth += 1
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self) -> None:
+        """
+        Back off after the server signalled throttling (HTTP 429/503).
+
+        Fills the bucket, so subsequent callers wait a full drain period, and
+        halves the drain rate (multiplicative decrease).
+        """
+        with self._lock:
+            self._leak(time.monotonic())
+            self._queue_depth = max(self._queue_depth, self.capacity)
+            self.rate_per_sec = max(self.min_rate_per_sec, self.rate_per_sec / 2)
+
+    def record_success(self) -> None:
+        """Raise the drain rate back toward its configured value (additive increase)."""
+        if self.rate_per_sec >= self.max_rate_per_sec:
+            return
+        with self._lock:
+            self._leak(time.monotonic())
+            self.rate_per_sec = min(
+                self.max_rate_per_sec,
+                self.rate_per_sec + self.max_rate_per_sec * RATE_RECOVERY_FRACTION,
+            )
+
+
+def _retry_after_seconds(exc: HTTPError) -> Optional[float]:
+    """
+    Parse a numeric Retry-After header from an HTTP error.
+
+    Args:
+        exc: HTTP error raised by urlopen
+
+    Returns:
+        Seconds to wait (capped at MAX_RETRY_AFTER), or None if absent/unparseable
+    """
+    headers = getattr(exc, "headers", None)
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_with_backoff(
+    request_fn: Callable[[], T],
+    bucket: Optional[LeakyBucket] = None,
+    tries: int = 4,
+) -> T:
+    """
+    Call ``request_fn`` retrying transient HTTP failures with exponential backoff.
+
+    HTTP 429/503 honour the server's Retry-After header and penalize ``bucket``,
+    while successful calls let it recover its rate; other 5xx responses and
+    connection-level errors back off exponentially with jitter. Client errors
+    (4xx other than 429) are raised immediately, as is the last error once
+    ``tries`` attempts are exhausted.
+
+    Args:
+        request_fn: Zero-argument callable performing the request
+        bucket: Optional rate limiter to penalize when the server throttles us
+        tries: Maximum number of attempts
+
+    Returns:
+        Whatever ``request_fn`` returns
+    """
+    for attempt in range(tries):
+        try:
+            result = request_fn()
+        except HTTPError as exc:
+            if attempt == tries - 1:
+                raise
+            if exc.code in THROTTLE_STATUS_CODES:
+                if bucket is not None:
+                    bucket.penalize()
+                delay = _retry_after_seconds(exc)
+                if delay is None:
+                    delay = float(2**attempt)
+            elif exc.code >= 500:
+                delay = float(2**attempt)
+            else:
+                raise
+        except (URLError, ConnectionError, TimeoutError):
+            if attempt == tries - 1:
+                raise
+            delay = float(2**attempt)
+        else:
+            if bucket is not None:
+                bucket.record_success()
+            return result
+        time.sleep(delay + random.random())
+    raise RuntimeError("retry_with_backoff called with tries < 1")
@@ -0,0 +1,133 @@
+"""
+Persistent cache for registry API responses.
+
+Stores JSON responses in a SQLite database in WAL mode so that several
+processes (e.g. a ProcessPoolExecutor scanning many SBOMs) and threads can
+read and write the same cache file concurrently.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+# Cached registry documents can be megabytes each; orjson encodes and decodes them
+# several times faster than stdlib json. Use it when installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(value: Dict) -> str:
+    """Serialize a response to JSON text, preferring orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass  # Value orjson cannot serialize (e.g. non-str keys); use the stdlib
+    return json.dumps(value)
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+class SQLiteResponseCache:
+    """
+    Key/value cache of JSON responses backed by a SQLite database.
+
+    Each thread lazily opens its own connection. Only the database path is
+    pickled, so instances can be handed to worker processes. Database errors
+    are swallowed: the cache is an optimization and must never fail a lookup.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._connection()
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Get (or open) the calling thread's database connection.
+
+        Returns:
+            SQLite connection, or None if the database cannot be opened
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            conn.commit()
+        except sqlite3.Error:
+            return None
+        self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None if not cached
+        """
+        conn = self._connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            return _json_loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response
+        """
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                    (key, _json_dumps(value)),
+                )
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __getstate__(self) -> Dict:
+        """Pickle only the database path; connections are per-process."""
+        return {"db_path": self.db_path}
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore from a pickled path, reopening lazily in the new process."""
+        self.db_path = state["db_path"]
+        self._local = threading.local()
@@ -0,0 +1,32 @@
+"""
+End-to-end tests for the command-line interface.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("networkx")
+
+from sbom_compile_order import cli  # pylint: disable=wrong-import-position
+
+_EXAMPLE_SBOM = Path(__file__).resolve().parent.parent / "examples" / "example_sbom.json"
+
+
+def test_csv_format_on_stdout_includes_dependency_counts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["sbom-compile-order", str(_EXAMPLE_SBOM), "-f", "csv"])
+
+    cli.main()
+
+    rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    dependencies = {row["Package Name"]: row["Dependencies"] for row in rows}
+    assert dependencies["base"] == "0"
+    assert dependencies["api"] == "2"
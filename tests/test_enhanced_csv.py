@@ -0,0 +1,44 @@
+"""
+Unit tests for enhanced.csv generation helpers.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("networkx")
+
+from sbom_compile_order.enhanced_csv import (  # pylint: disable=wrong-import-position
+    _prefetch_maven_artifacts,
+)
+
+
+class _FakePackageDownloader:
+    def __init__(self) -> None:
+        self.items: list[tuple[str, str, str, str]] = []
+
+    def download_packages(self, items: list) -> dict:
+        self.items = [(comp.group, comp.name, comp.version, kind) for comp, kind in items]
+        return {
+            (comp.get_identifier(), kind): (
+                None if comp.name == "gone" else f"{comp.name}.jar",
+                False,
+            )
+            for comp, kind in items
+        }
+
+
+def test_prefetch_maven_artifacts_downloads_jars_for_maven_rows_in_one_batch() -> None:
+    rows = [
+        ["1", "org.example:lib", "lib", "1.0", "pkg:maven/org.example/lib@1.0"],
+        ["2", "org.example", "gone", "2.0", "pkg:maven/org.example/gone@2.0"],
+        ["3", "", "left-pad", "1.3.0", "pkg:npm/left-pad@1.3.0"],
+        ["4", "org.example:short"],
+    ]
+    downloader = _FakePackageDownloader()
+
+    assert _prefetch_maven_artifacts(rows, downloader) == 1
+    assert downloader.items == [
+        ("org.example", "lib", "1.0", "jar"),
+        ("org.example", "gone", "2.0", "jar"),
+    ]
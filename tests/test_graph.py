@@ -0,0 +1,38 @@
+"""
+Unit tests for the dependency graph.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("networkx")
+
+from sbom_compile_order.graph import DependencyGraph  # pylint: disable=wrong-import-position
+
+
+def _cyclic_graph() -> DependencyGraph:
+    graph = DependencyGraph()
+    graph.add_dependency("a", "b")
+    graph.add_dependency("b", "a")
+    graph.add_dependency("c", "b")
+    return graph
+
+
+def test_cycles_for_component_lists_only_cycles_through_the_node() -> None:
+    graph = _cyclic_graph()
+
+    assert sorted(graph.get_cycles_for_component("a")[0]) == ["a", "b"]
+    assert graph.get_cycles_for_component("c") == []
+    assert graph.get_cycles_for_component("unknown") == []
+    assert graph.format_cycles_for_component("a") in ("a->b->a", "b->a->b")
+    assert graph.format_cycles_for_component("c") == ""
+
+
+def test_cycle_index_is_rebuilt_after_the_graph_changes() -> None:
+    graph = _cyclic_graph()
+    assert graph.format_cycles_for_component("c") == ""
+
+    graph.add_dependency("b", "c")
+
+    assert graph.format_cycles_for_component("c") in ("b->c->b", "c->b->c")
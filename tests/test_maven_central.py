@@ -0,0 +1,37 @@
+"""
+Unit tests for the Maven Central client's in-memory cache.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sbom_compile_order.maven_central import MavenCentralClient
+
+
+def test_lru_cache_evicts_least_recently_used_entry() -> None:
+    client = MavenCentralClient()
+    client.CACHE_MAX_ENTRIES = 2
+
+    client._cache_put("a", {"id": "a"})
+    client._cache_put("b", {"id": "b"})
+    assert client._cache_get("a") == {"id": "a"}
+    client._cache_put("c", {"id": "c"})
+
+    assert client._cache_get("b") is None
+    assert list(client._cache) == ["a", "c"]
+
+
+def test_concurrent_lookups_keep_the_lru_consistent(tmp_path: Path) -> None:
+    client = MavenCentralClient(cache_path=tmp_path / "maven.sqlite")
+    client.CACHE_MAX_ENTRIES = 4
+    queries = [f"g:org.example AND a:lib{i}" for i in range(64)]
+    for query in queries:
+        client._persistent_cache.set(f"{query}:False", {"query": query})
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(client._make_request, queries * 4))
+
+    assert results == [{"query": query} for query in queries * 4]
+    assert len(client._cache) == 4
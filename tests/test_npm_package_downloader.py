@@ -0,0 +1,43 @@
+"""
+Unit tests for npm tarball validation in NpmPackageDownloader.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import os
+import tarfile
+from pathlib import Path
+
+from sbom_compile_order.npm_package_downloader import NpmPackageDownloader
+
+
+def _make_tarball(payload: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        info = tarfile.TarInfo("package/package.json")
+        info.size = len(payload)
+        tar.addfile(info, io.BytesIO(payload))
+    return buffer.getvalue()
+
+
+def test_validate_tarball_accepts_npm_tarball(tmp_path: Path) -> None:
+    downloader = NpmPackageDownloader(tmp_path)
+    assert downloader._validate_tarball(_make_tarball(os.urandom(4096))) == (True, None)
+    downloader.close()
+
+
+def test_validate_tarball_rejects_non_gzip_content(tmp_path: Path) -> None:
+    downloader = NpmPackageDownloader(tmp_path)
+    is_valid, error = downloader._validate_tarball(b"PK\x03\x04" + os.urandom(200))
+    assert not is_valid
+    assert "gzip magic" in error
+    downloader.close()
+
+
+def test_validate_tarball_rejects_gzip_without_tar_header(tmp_path: Path) -> None:
+    downloader = NpmPackageDownloader(tmp_path)
+    is_valid, _ = downloader._validate_tarball(gzip.compress(os.urandom(4096)))
+    assert not is_valid
+    downloader.close()
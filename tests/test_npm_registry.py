@@ -0,0 +1,280 @@
+"""
+Unit tests for NpmRegistryClient metadata handling.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import pickle
+import time
+from email.message import Message
+from pathlib import Path
+from urllib.error import HTTPError
+
+import pytest
+
+from sbom_compile_order import npm_registry
+from sbom_compile_order.npm_registry import (
+    NpmRegistryClient,
+    _encode_package_name,
+    _project_metadata,
+)
+from sbom_compile_order.parser import Component
+
+_DOCUMENT = {
+    "name": "left-pad",
+    "readme": "x" * 10_000,
+    "time": {"1.3.0": "2016-03-23T00:00:00.000Z"},
+    "dist-tags": {"latest": "1.3.0"},
+    "repository": {"type": "git", "url": "git+https://github.com/stevemao/left-pad.git"},
+    "versions": {
+        "1.3.0": {
+            "name": "left-pad",
+            "version": "1.3.0",
+            "license": "WTFPL",
+            "scripts": {"test": "node test"},
+            "dist": {"tarball": "https://registry.npmjs.org/left-pad/-/left-pad-1.3.0.tgz"},
+        }
+    },
+}
+
+
+def test_project_metadata_drops_unused_fields() -> None:
+    projected = _project_metadata(_DOCUMENT)
+    assert "readme" not in projected
+    assert "time" not in projected
+    assert "scripts" not in projected["versions"]["1.3.0"]
+    assert projected["versions"]["1.3.0"]["license"] == "WTFPL"
+
+
+def test_get_package_info_reads_projected_metadata() -> None:
+    client = NpmRegistryClient()
+    client._cache["left-pad"] = _project_metadata(_DOCUMENT)
+    component = Component(
+        {"name": "left-pad", "version": "1.3.0", "purl": "pkg:npm/left-pad@1.3.0"}
+    )
+
+    homepage, license_type = client.get_package_info(component)
+
+    assert homepage == "https://github.com/stevemao/left-pad"
+    assert license_type == "WTFPL"
+
+
+def test_fetch_many_downloads_each_package_once(monkeypatch) -> None:
+    client = NpmRegistryClient()
+    calls = []
+
+    def fake_download(package_name: str, abbreviated: bool = False):
+        calls.append(package_name)
+        return {"name": package_name} if package_name != "missing" else None
+
+    monkeypatch.setattr(client, "_download_package_data", fake_download)
+
+    results = client.fetch_many(["left-pad", "missing", "left-pad", "is-odd"], max_workers=4)
+
+    assert sorted(calls) == ["is-odd", "left-pad", "missing"]
+    assert results == {
+        "left-pad": {"name": "left-pad"},
+        "missing": None,
+        "is-odd": {"name": "is-odd"},
+    }
+    assert client.fetch_many(["left-pad"]) == {"left-pad": {"name": "left-pad"}}
+    assert sorted(calls) == ["is-odd", "left-pad", "missing"]
+
+
+def test_fresh_persistent_entry_skips_the_network(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(npm_registry, "urllib3", None)
+    cache_path = tmp_path / "npm.sqlite"
+    NpmRegistryClient(cache_path=cache_path)._store_persistent(
+        "left-pad", {"name": "left-pad"}, '"abc"'
+    )
+
+    def fail_urlopen(*_args, **_kwargs):
+        raise AssertionError("unexpected network request")
+
+    monkeypatch.setattr(npm_registry, "urlopen", fail_urlopen)
+
+    assert NpmRegistryClient(cache_path=cache_path)._fetch_package_data("left-pad") == {
+        "name": "left-pad"
+    }
+
+
+def test_stale_persistent_entry_is_revalidated_with_etag(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(npm_registry, "urllib3", None)
+    client = NpmRegistryClient(cache_path=tmp_path / "npm.sqlite", cache_ttl=60)
+    client._persistent_cache.set(
+        "left-pad",
+        {"etag": '"abc"', "fetched_at": time.time() - 120, "data": {"name": "left-pad"}},
+    )
+    sent_etags = []
+
+    def not_modified(request, timeout=None):
+        sent_etags.append(request.get_header("If-none-match"))
+        raise HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+
+    monkeypatch.setattr(npm_registry, "urlopen", not_modified)
+
+    assert client._fetch_package_data("left-pad") == {"name": "left-pad"}
+    assert sent_etags == ['"abc"']
+    assert time.time() - client._persistent_cache.get("left-pad")["fetched_at"] < 60
+
+
+def test_get_dependencies_requests_abbreviated_document(monkeypatch) -> None:
+    client = NpmRegistryClient()
+    requested = []
+
+    def fake_download(package_name: str, abbreviated: bool = False):
+        requested.append((package_name, abbreviated))
+        return {
+            "dist-tags": {"latest": "1.0.0"},
+            "versions": {"1.0.0": {"dependencies": {"is-odd": "^3.0.0"}}},
+        }
+
+    monkeypatch.setattr(client, "_download_package_data", fake_download)
+    component = Component({"name": "is-even", "version": "1.0.0"})
+
+    assert client.get_dependencies(component) == [("is-odd", "^3.0.0")]
+    assert requested == [("is-even", True)]
+
+
+def test_get_dependencies_reuses_cached_full_document(monkeypatch) -> None:
+    client = NpmRegistryClient()
+    client._cache["left-pad"] = _project_metadata(_DOCUMENT)
+    monkeypatch.setattr(client, "_download_package_data", None)
+
+    component = Component({"name": "left-pad", "version": "1.3.0"})
+    assert client.get_dependencies(component) == []
+
+
+def test_get_package_info_fetches_single_version_manifest(monkeypatch) -> None:
+    client = NpmRegistryClient()
+    urls = []
+
+    def fake_download(cache_key, url, project, accept=None):
+        urls.append(url)
+        return project(_DOCUMENT["versions"]["1.3.0"] | {"homepage": "https://example.org"})
+
+    monkeypatch.setattr(client, "_download", fake_download)
+    component = Component({"name": "left-pad", "version": "1.3.0"})
+
+    assert client.get_package_info(component) == ("https://example.org", "WTFPL")
+    assert urls == ["https://registry.npmjs.org/left-pad/1.3.0"]
+
+
+def test_encode_package_name_escapes_only_what_is_needed() -> None:
+    assert _encode_package_name("left-pad") == "left-pad"
+    assert _encode_package_name("@types/node") == "@types%2Fnode"
+    assert _encode_package_name("Bad Name") == "Bad%20Name"
+
+
+def test_gzip_encoded_response_is_decoded(monkeypatch) -> None:
+    monkeypatch.setattr(npm_registry, "urllib3", None)
+    client = NpmRegistryClient()
+    captured = {}
+
+    class FakeResponse(io.BytesIO):
+        headers = {"Content-Encoding": "gzip"}
+
+    def fake_urlopen(request, timeout=None):
+        captured["accept_encoding"] = request.get_header("Accept-encoding")
+        return FakeResponse(gzip.compress(json.dumps(_DOCUMENT).encode("utf-8")))
+
+    monkeypatch.setattr(npm_registry, "urlopen", fake_urlopen)
+
+    metadata = client._fetch_package_data("left-pad")
+
+    assert "gzip" in captured["accept_encoding"]
+    assert metadata["versions"]["1.3.0"]["license"] == "WTFPL"
+
+
+def test_stream_project_metadata_matches_full_projection() -> None:
+    pytest.importorskip("ijson")
+    body = io.BytesIO(json.dumps(_DOCUMENT).encode("utf-8"))
+
+    assert npm_registry._stream_project_metadata(body) == _project_metadata(_DOCUMENT)
+
+
+class _FakePoolResponse:
+    def __init__(self, status: int, body: bytes = b"", headers: dict | None = None) -> None:
+        self.status = status
+        self.reason = "reason"
+        self.headers = headers or {}
+        self.body = body
+        self.released = False
+
+    def read(self) -> bytes:
+        return self.body
+
+    def drain_conn(self) -> None:
+        self.body = b""
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+class _FakePool:
+    def __init__(self, response: _FakePoolResponse) -> None:
+        self.response = response
+        self.requests: list[tuple[str, dict]] = []
+
+    def request(self, method: str, url: str, **kwargs: object) -> _FakePoolResponse:
+        assert method == "GET"
+        self.requests.append((url, kwargs))
+        return self.response
+
+
+def _pooled_client(response: _FakePoolResponse, **kwargs: object) -> NpmRegistryClient:
+    if npm_registry.urllib3 is None:
+        pytest.skip("urllib3 not installed")
+    client = NpmRegistryClient(**kwargs)
+    client._http = _FakePool(response)
+    return client
+
+
+def test_pooled_requests_leave_body_decoding_to_the_client() -> None:
+    response = _FakePoolResponse(
+        200,
+        gzip.compress(json.dumps(_DOCUMENT).encode("utf-8")),
+        {"Content-Encoding": "gzip", "ETag": '"abc"'},
+    )
+    client = _pooled_client(response)
+
+    metadata = client._fetch_package_data("left-pad")
+    client._fetch_package_data("is-odd")
+
+    assert metadata["versions"]["1.3.0"]["license"] == "WTFPL"
+    assert [url for url, _ in client._http.requests] == [
+        "https://registry.npmjs.org/left-pad",
+        "https://registry.npmjs.org/is-odd",
+    ]
+    _, kwargs = client._http.requests[0]
+    assert kwargs["decode_content"] is False
+    assert "gzip" in kwargs["headers"]["Accept-Encoding"]
+    assert response.released
+
+
+def test_pooled_not_modified_response_reuses_persistent_entry(tmp_path: Path) -> None:
+    response = _FakePoolResponse(304)
+    client = _pooled_client(response, cache_path=tmp_path / "npm.sqlite", cache_ttl=60)
+    client._persistent_cache.set(
+        "left-pad",
+        {"etag": '"abc"', "fetched_at": time.time() - 120, "data": {"name": "left-pad"}},
+    )
+
+    assert client._fetch_package_data("left-pad") == {"name": "left-pad"}
+    _, kwargs = client._http.requests[0]
+    assert kwargs["headers"]["If-None-Match"] == '"abc"'
+    assert response.released
+
+
+def test_pickled_client_gets_a_fresh_connection_pool() -> None:
+    if npm_registry.urllib3 is None:
+        pytest.skip("urllib3 not installed")
+    client = NpmRegistryClient()
+
+    restored = pickle.loads(pickle.dumps(client))
+
+    assert restored._http is not None
+    assert restored._http is not client._http
@@ -0,0 +1,287 @@
+"""
+Unit tests for the compilation order output formatters.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+import pytest
+
+pytest.importorskip("networkx")
+
+from sbom_compile_order import output as output_module  # pylint: disable=wrong-import-position
+from sbom_compile_order.output import (  # pylint: disable=wrong-import-position
+    CSVFormatter,
+    JSONFormatter,
+    TextFormatter,
+    extract_repo_url,
+    get_formatter,
+    write_dependencies_csv,
+)
+from sbom_compile_order.parser import Component  # pylint: disable=wrong-import-position
+
+
+def _components() -> dict:
+    return {
+        "org.example:base:1.0": Component(
+            {
+                "bom-ref": "org.example:base:1.0",
+                "group": "org.example",
+                "name": "base",
+                "version": "1.0",
+                "purl": "pkg:maven/org.example/base@1.0",
+                "scope": "",
+            }
+        )
+    }
+
+
+def test_json_formatter_omits_empty_fields_without_metadata() -> None:
+    output = json.loads(
+        JSONFormatter().format(["org.example:base:1.0", "missing"], _components(), False)
+    )
+
+    assert output["compilation_order"] == [
+        {
+            "ref": "org.example:base:1.0",
+            "group": "org.example",
+            "name": "base",
+            "version": "1.0",
+            "purl": "pkg:maven/org.example/base@1.0",
+            "type": "library",
+        },
+        {"ref": "missing"},
+    ]
+    assert output["total_components"] == 2
+    assert output["has_circular_dependencies"] is False
+
+
+def test_json_formatter_keeps_all_fields_with_metadata() -> None:
+    text = JSONFormatter().format(
+        ["org.example:base:1.0"], _components(), True, {"total_components": 1}, True
+    )
+
+    assert json.loads(text)["compilation_order"][0]["scope"] == ""
+    assert json.loads(text)["statistics"] == {"total_components": 1}
+    assert text.startswith('{\n  "compilation_order": [\n')
+
+
+def test_json_formatter_escapes_non_ascii_with_or_without_orjson(monkeypatch) -> None:
+    components = {
+        "café": Component({"bom-ref": "café", "name": "café", "version": "1.0"}),
+        "org.example:base:1.0": _components()["org.example:base:1.0"],
+    }
+    order = ["café", "org.example:base:1.0"]
+
+    outputs = []
+    for module in (output_module.orjson, None):
+        monkeypatch.setattr(output_module, "orjson", module)
+        stream = io.StringIO()
+        JSONFormatter().format_to_stream(stream, order, components, False)
+        outputs.extend([JSONFormatter().format(order, components, False), stream.getvalue()])
+
+    assert '"caf\\u00e9"' in outputs[0]
+    assert outputs[0].isascii()
+    assert len(set(outputs)) == 1
+
+
+def test_json_formatter_format_to_stream_matches_format() -> None:
+    order = ["org.example:base:1.0", "missing"]
+    stream = io.StringIO()
+
+    JSONFormatter().format_to_stream(stream, order, _components(), True, {"total_components": 2})
+
+    assert json.loads(stream.getvalue()) == json.loads(
+        JSONFormatter().format(order, _components(), True, {"total_components": 2})
+    )
+
+
+def test_text_formatter_lists_components_in_order() -> None:
+    text = TextFormatter().format(["org.example:base:1.0", "missing"], _components(), False)
+
+    assert text.splitlines()[:3] == ["=" * 80, "Compilation Order", "=" * 80]
+    assert text.splitlines()[-2:] == ["1. org.example:base:1.0", "2. missing"]
+
+
+def test_text_formatter_includes_metadata_lines() -> None:
+    text = TextFormatter().format(
+        ["org.example:base:1.0", "missing"], _components(), False, include_metadata=True
+    )
+
+    assert text.split("Order:\n\n", 1)[1] == (
+        "1. org.example:base:1.0\n   PURL: pkg:maven/org.example/base@1.0\n\n2. missing"
+    )
+
+
+def test_get_formatter_returns_shared_instances() -> None:
+    assert get_formatter("JSON") is get_formatter("json")
+    assert isinstance(get_formatter("csv"), CSVFormatter)
+    with pytest.raises(ValueError, match="Unsupported format: xml"):
+        get_formatter("xml")
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://github.com/user/repo/tree/master/sub", "https://github.com/user/repo.git"),
+        ("http://bitbucket.org/u/r.git", "https://bitbucket.org/u/r.git"),
+        ("https://gitlab.com/group/proj/-/tree/main", "https://gitlab.com/group/proj.git"),
+        (
+            "https://git-wip-us.apache.org/repos/asf?p=commons-lang.git",
+            "https://git-wip-us.apache.org/repos/asf/commons-lang.git",
+        ),
+        (
+            "http://git.eclipse.org/c/jetty/org.eclipse.jetty.project.git/tree",
+            "http://git.eclipse.org/c/jetty/org.eclipse.jetty.project.git",
+        ),
+        ("https://example.com/path/repo.git/tree/x", "https://example.com/path/repo.git"),
+        ("https://gitee.com/u/r/", "https://gitee.com/u/r.git"),
+        ("https://svn.apache.org/repos/asf/commons", ""),
+        ("https://example.com/a/b", ""),
+        ("git+https://github.com/user/repo.git", "git+https://github.com/user/repo.git"),
+        ("HTTPS://github.com/a/b", "https://github.com/a/b.git"),
+        ("N/A", ""),
+        ("pkg:maven/a/b@1", ""),
+        ("/local/path/repo.git", ""),
+        ("https://github.com/a/b\x00", ""),
+        ("https://github.com/a/" + "b" * 3000, ""),
+        ("", ""),
+    ],
+)
+def test_extract_repo_url(url: str, expected: str) -> None:
+    assert extract_repo_url(url) == expected
+
+
+def test_csv_format_incremental_writes_one_row_per_component(tmp_path) -> None:
+    output_path = tmp_path / "compile-order.csv"
+
+    CSVFormatter().format_incremental(
+        output_path, ["org.example:base:1.0", "missing"], _components(), False
+    )
+
+    rows = list(csv.reader(output_path.open(encoding="utf-8")))
+    assert len(rows) == 3
+    assert rows[1][:4] == ["1", "org.example:base", "base", "1.0"]
+    assert rows[2][:2] == ["2", "missing"]
+
+
+def test_csv_format_incremental_periodic_fsync_writes_same_rows(tmp_path) -> None:
+    batched = tmp_path / "batched.csv"
+    synced = tmp_path / "synced.csv"
+    order = ["org.example:base:1.0", "missing"]
+
+    CSVFormatter().format_incremental(batched, order, _components(), False)
+    CSVFormatter().format_incremental(synced, order, _components(), False, fsync_every=1)
+
+    assert synced.read_text(encoding="utf-8") == batched.read_text(encoding="utf-8")
+
+
+def test_csv_format_incremental_lists_cycles_per_component(tmp_path) -> None:
+    import networkx as nx  # pylint: disable=import-outside-toplevel
+
+    graph = nx.DiGraph([("a", "b"), ("b", "a"), ("b", "c")])
+    output_path = tmp_path / "compile-order.csv"
+
+    CSVFormatter().format_incremental(output_path, ["a", "b", "c"], {}, True, graph=graph)
+
+    rows = list(csv.reader(output_path.open(encoding="utf-8")))
+    cycles = {row[1]: row[-1] for row in rows[1:]}
+    assert cycles["a"] in ("a->b->a", "b->a->b")
+    assert cycles["b"] == cycles["a"]
+    assert cycles["c"] == ""
+
+
+class _FakeResolver:
+    """Dependency resolver stand-in returning canned mvnrepository.com data."""
+
+    def __init__(self) -> None:
+        self.lookups: list[tuple] = []
+
+    def get_license_and_homepage(self, group: str, artifact: str, version: str) -> tuple:
+        self.lookups.append((group, artifact, version))
+        return "Apache-2.0", f"https://example.org/{group}/{artifact}/{version}"
+
+    def get_dependencies(self, group: str, artifact: str, version: str) -> list:
+        return [("org.example", "base", "1.0"), ("org.other", "extra", "2.0")]
+
+
+def test_csv_format_incremental_prefetches_remote_metadata(tmp_path) -> None:
+    output_path = tmp_path / "compile-order.csv"
+
+    CSVFormatter().format_incremental(
+        output_path,
+        ["org.example:base:1.0", "missing"],
+        _components(),
+        False,
+        dependency_resolver=_FakeResolver(),
+    )
+
+    rows = list(csv.reader(output_path.open(encoding="utf-8")))
+    assert rows[1][13:16] == [
+        "https://example.org/org.example/base/1.0",
+        "Apache-2.0",
+        "1",
+    ]
+    assert rows[2][13:16] == ["", "", "0"]
+
+
+def test_csv_format_incremental_looks_up_shared_coordinates_once(tmp_path) -> None:
+    components = _components()
+    data = dict(components["org.example:base:1.0"].raw_data, **{"bom-ref": "base-test"})
+    components["base-test"] = Component(data)
+    resolver = _FakeResolver()
+
+    CSVFormatter().format_incremental(
+        tmp_path / "compile-order.csv",
+        ["org.example:base:1.0", "base-test"],
+        components,
+        False,
+        dependency_resolver=resolver,
+    )
+
+    assert resolver.lookups == [("org.example", "base", "1.0")]
+
+
+def test_csv_dependency_counts_match_graph_in_degree(tmp_path) -> None:
+    import networkx as nx  # pylint: disable=import-outside-toplevel
+
+    graph = nx.DiGraph([("a", "c"), ("b", "c"), ("a", "b")])
+    output_path = tmp_path / "compile-order.csv"
+
+    CSVFormatter().format_incremental(output_path, ["a", "b", "c", "d"], {}, False, graph=graph)
+    csv_text = CSVFormatter().format(["a", "b", "c", "d"], {}, False, graph=graph)
+
+    for rows in (
+        list(csv.reader(output_path.open(encoding="utf-8"))),
+        list(csv.reader(io.StringIO(csv_text))),
+    ):
+        counts = {row[1]: row[10] for row in rows[1:]}
+        assert counts == {"a": "0", "b": "1", "c": "2", "d": "0"}
+
+
+def test_csv_format_matches_incremental_file(tmp_path) -> None:
+    output_path = tmp_path / "compile-order.csv"
+    order = ["org.example:base:1.0", "missing"]
+
+    CSVFormatter().format_incremental(output_path, order, _components(), False)
+    csv_text = CSVFormatter().format(order, _components(), False)
+
+    with output_path.open(encoding="utf-8", newline="") as file:
+        assert csv_text == file.read()
+    rows = list(csv.reader(io.StringIO(csv_text)))
+    assert {len(row) for row in rows} == {17}
+
+
+def test_write_dependencies_csv_writes_one_row_per_dependency(tmp_path) -> None:
+    output_path = tmp_path / "deps" / "dependencies.csv"
+
+    write_dependencies_csv(output_path, [("org.a", "one", "1.0", 1), ("org.b", "two", "", 2)])
+
+    rows = list(csv.reader(output_path.open(encoding="utf-8")))
+    assert rows[1:] == [
+        ["1", "org.a:one", "one", "1.0", "1", "", ""],
+        ["2", "org.b:two", "two", "", "2", "", ""],
+    ]
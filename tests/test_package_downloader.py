@@ -0,0 +1,556 @@
+"""
+Unit tests for HTTP artifact fetching in PackageDownloader.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import threading
+import time
+import zipfile
+from pathlib import Path
+from urllib.error import HTTPError
+
+import pytest
+
+from sbom_compile_order import package_downloader
+from sbom_compile_order.package_downloader import PackageDownloader
+from sbom_compile_order.parser import Component
+
+
+class _FakeResponse:
+    def __init__(self, status: int, body: bytes = b"") -> None:
+        self.status = status
+        self.reason = "reason"
+        self.headers = {}
+        self.body = body
+        self.released = False
+
+    def read(self) -> bytes:
+        return self.body
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+class _FakePool:
+    def __init__(self, response: _FakeResponse) -> None:
+        self.response = response
+        self.urls: list[str] = []
+
+    def request(self, method: str, url: str, **_kwargs: object) -> _FakeResponse:
+        assert method == "GET"
+        self.urls.append(url)
+        return self.response
+
+
+def _downloader(tmp_path: Path, response: _FakeResponse) -> PackageDownloader:
+    if package_downloader.urllib3 is None:
+        pytest.skip("urllib3 not installed")
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+    downloader._http = _FakePool(response)
+    return downloader
+
+
+def test_open_artifact_url_reuses_pool_and_releases_connection(tmp_path: Path) -> None:
+    response = _FakeResponse(200, b"PK\x03\x04")
+    downloader = _downloader(tmp_path, response)
+
+    with downloader._open_artifact_url("https://repo1.maven.org/a.jar") as opened:
+        assert opened.read() == b"PK\x03\x04"
+    with downloader._open_artifact_url("https://repo1.maven.org/b.jar"):
+        pass
+
+    assert downloader._http.urls == [
+        "https://repo1.maven.org/a.jar",
+        "https://repo1.maven.org/b.jar",
+    ]
+    assert response.released
+
+
+def test_open_artifact_url_raises_http_error_for_missing_artifact(tmp_path: Path) -> None:
+    response = _FakeResponse(404)
+    downloader = _downloader(tmp_path, response)
+
+    with pytest.raises(HTTPError) as excinfo:
+        with downloader._open_artifact_url("https://repo1.maven.org/missing.jar"):
+            pass
+
+    assert excinfo.value.code == 404
+    assert response.released
+
+
+def test_open_artifact_url_falls_back_to_urlopen(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requests = []
+
+    class _Opened:
+        status = 200
+
+        def __enter__(self) -> "_Opened":
+            return self
+
+        def __exit__(self, *_exc: object) -> None:
+            return None
+
+    def fake_urlopen(req, timeout: int) -> _Opened:
+        requests.append((req.full_url, req.get_header("User-agent"), timeout))
+        return _Opened()
+
+    monkeypatch.setattr(package_downloader, "urlopen", fake_urlopen)
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+    downloader._http = None
+
+    with downloader._open_artifact_url("https://repo1.maven.org/a.jar") as opened:
+        assert opened.status == 200
+
+    assert requests[0][0] == "https://repo1.maven.org/a.jar"
+    assert requests[0][1].startswith("sbom-compile-order/")
+    assert requests[0][2] == 30
+
+
+def test_download_packages_returns_result_per_component_and_type(tmp_path: Path) -> None:
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+    components = [
+        Component(
+            {
+                "bom-ref": f"pkg:maven/org.example/lib{i}@1.0",
+                "group": "org.example",
+                "name": f"lib{i}",
+                "version": "1.0",
+            }
+        )
+        for i in range(3)
+    ]
+
+    def fake_download(component, artifact_type: str = "jar"):
+        if component.name == "lib1":
+            raise RuntimeError("boom")
+        return f"{component.name}.{artifact_type}", False
+
+    downloader.download_package = fake_download
+    results = downloader.download_packages(
+        [(comp, "jar") for comp in components] + [(components[0], "war")], max_workers=4
+    )
+
+    assert results == {
+        ("pkg:maven/org.example/lib0@1.0", "jar"): ("lib0.jar", False),
+        ("pkg:maven/org.example/lib1@1.0", "jar"): (None, False),
+        ("pkg:maven/org.example/lib2@1.0", "jar"): ("lib2.jar", False),
+        ("pkg:maven/org.example/lib0@1.0", "war"): ("lib0.war", False),
+    }
+
+
+class _StreamedResponse(io.BytesIO):
+    def __init__(self, body: bytes, status: int = 200, headers: dict | None = None) -> None:
+        super().__init__(body)
+        self.status = status
+        self.headers = headers or {}
+
+
+def _jar_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as jar:
+        jar.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+    return buffer.getvalue()
+
+
+def _streaming_downloader(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, body: bytes
+) -> PackageDownloader:
+    monkeypatch.setattr(
+        package_downloader, "urlopen", lambda _req, timeout: _StreamedResponse(body)
+    )
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+    downloader._http = None
+    return downloader
+
+
+def test_download_package_streams_valid_jar_into_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    body = _jar_bytes()
+    downloader = _streaming_downloader(tmp_path, monkeypatch, body)
+    component = Component(
+        {"bom-ref": "org.example:lib:1.0", "group": "org.example", "name": "lib", "version": "1.0"}
+    )
+
+    filename, auth_required = downloader.download_package(component)
+
+    assert (filename, auth_required) == ("org.example_lib_1.0.jar", False)
+    assert (downloader.jar_cache_dir / filename).read_bytes() == body
+    assert not list(downloader.jar_cache_dir.glob("*.part"))
+
+
+def test_download_package_discards_invalid_jar(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    downloader = _streaming_downloader(tmp_path, monkeypatch, b"<html>not a jar</html>")
+    component = Component(
+        {"bom-ref": "org.example:lib:1.0", "group": "org.example", "name": "lib", "version": "1.0"}
+    )
+
+    assert downloader.download_package(component) == (None, False)
+    assert not list(downloader.jar_cache_dir.iterdir())
+
+
+def test_maven_availability_is_checked_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    commands = []
+
+    class _Completed:
+        returncode = 1
+        stdout = ""
+        stderr = ""
+
+    def fake_run(cmd, **_kwargs: object) -> _Completed:
+        commands.append(cmd)
+        return _Completed()
+
+    monkeypatch.setattr(package_downloader.subprocess, "run", fake_run)
+    downloader = PackageDownloader(tmp_path, use_maven=True)
+    component = Component(
+        {"bom-ref": "org.example:lib:1.0", "group": "org.example", "name": "lib", "version": "1.0"}
+    )
+
+    for _ in range(3):
+        result = downloader._download_artifact_with_maven(
+            component, downloader.jar_cache_dir / "lib.jar", "jar"
+        )
+        assert result == (None, False)
+
+    assert commands == [["mvn", "--version"]]
+
+
+def test_download_package_remembers_artifacts_missing_from_both_repositories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requested = []
+
+    def fake_urlopen(req, timeout: int) -> None:
+        requested.append(req.full_url)
+        raise HTTPError(req.full_url, 404, "Not Found", {}, None)
+
+    monkeypatch.setattr(package_downloader, "urlopen", fake_urlopen)
+    component = Component(
+        {
+            "bom-ref": "org.example:gone:1.0",
+            "group": "org.example",
+            "name": "gone",
+            "version": "1.0",
+        }
+    )
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+    downloader._http = None
+
+    assert downloader.download_package(component) == (None, False)
+    assert len(requested) == 2
+
+    assert downloader.download_package(component) == (None, False)
+    restarted = PackageDownloader(tmp_path, use_maven=False)
+    restarted._http = None
+    assert restarted.download_package(component) == (None, False)
+    assert len(requested) == 2
+    assert restarted.download_package(component, artifact_type="war") == (None, False)
+    assert len(requested) == 4
+
+
+def test_bulk_download_with_maven_uses_one_maven_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    commands = []
+
+    class _Completed:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    def fake_run(cmd, **_kwargs: object) -> _Completed:
+        commands.append(cmd)
+        if "dependency:copy-dependencies" in cmd:
+            pom = Path(cmd[cmd.index("-f") + 1]).read_text(encoding="utf-8")
+            assert pom.count("<dependency>") == 2
+            output_dir = Path(
+                next(arg for arg in cmd if arg.startswith("-DoutputDirectory=")).split("=", 1)[1]
+            )
+            jar = output_dir / "org" / "example" / "lib" / "1.0" / "lib-1.0.jar"
+            jar.parent.mkdir(parents=True)
+            jar.write_bytes(_jar_bytes())
+        return _Completed()
+
+    monkeypatch.setattr(package_downloader.subprocess, "run", fake_run)
+    downloader = PackageDownloader(tmp_path, use_maven=True)
+    found = Component(
+        {"bom-ref": "org.example:lib:1.0", "group": "org.example", "name": "lib", "version": "1.0"}
+    )
+    missing = Component(
+        {
+            "bom-ref": "org.example:gone:1.0",
+            "group": "org.example",
+            "name": "gone",
+            "version": "1.0",
+        }
+    )
+
+    results = downloader.bulk_download_with_maven([(found, "jar"), (missing, "jar")])
+
+    assert results == {("org.example:lib:1.0", "jar"): "org.example_lib_1.0.jar"}
+    assert (downloader.jar_cache_dir / "org.example_lib_1.0.jar").read_bytes() == _jar_bytes()
+    assert sum("dependency:copy-dependencies" in cmd for cmd in commands) == 1
+    assert downloader.bulk_download_with_maven([(found, "jar")]) == {}
+
+
+def test_bulk_download_with_maven_keeps_artifacts_resolved_before_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _Failed:
+        returncode = 1
+        stdout = ""
+        stderr = ""
+
+    home = tmp_path / "home"
+    jar = home / ".m2" / "repository" / "org" / "example" / "lib" / "1.0" / "lib-1.0.jar"
+    jar.parent.mkdir(parents=True)
+    jar.write_bytes(_jar_bytes())
+    monkeypatch.setattr(package_downloader.Path, "home", lambda: home)
+    monkeypatch.setattr(package_downloader.subprocess, "run", lambda _cmd, **_kwargs: _Failed())
+    downloader = PackageDownloader(tmp_path / "cache", use_maven=True)
+    downloader._maven_available = True
+    missing = Component(
+        {
+            "bom-ref": "org.example:gone:1.0",
+            "group": "org.example",
+            "name": "gone",
+            "version": "1.0",
+        }
+    )
+
+    results = downloader.bulk_download_with_maven([(_lib_component(), "jar"), (missing, "jar")])
+
+    assert results == {("org.example:lib:1.0", "jar"): "org.example_lib_1.0.jar"}
+    assert (downloader.jar_cache_dir / "org.example_lib_1.0.jar").read_bytes() == _jar_bytes()
+
+
+def test_concurrent_bulk_downloads_share_one_maven_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    commands = []
+
+    class _Completed:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    def fake_run(cmd, **_kwargs: object) -> _Completed:
+        commands.append(cmd)
+        if "dependency:copy-dependencies" in cmd:
+            time.sleep(0.05)
+            output_dir = Path(
+                next(arg for arg in cmd if arg.startswith("-DoutputDirectory=")).split("=", 1)[1]
+            )
+            jar = output_dir / "org" / "example" / "lib" / "1.0" / "lib-1.0.jar"
+            jar.parent.mkdir(parents=True)
+            jar.write_bytes(_jar_bytes())
+        return _Completed()
+
+    monkeypatch.setattr(package_downloader.subprocess, "run", fake_run)
+    downloader = PackageDownloader(tmp_path, use_maven=True)
+    items = [(_lib_component(), "jar")]
+
+    threads = [
+        threading.Thread(target=downloader.bulk_download_with_maven, args=(items,))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum("dependency:copy-dependencies" in cmd for cmd in commands) == 1
+    assert (downloader.jar_cache_dir / "org.example_lib_1.0.jar").exists()
+
+
+def test_log_keeps_one_handle_and_reopens_after_close(tmp_path: Path) -> None:
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+
+    downloader._log("first")
+    handle = downloader._log_fh
+    downloader._log("second")
+    assert downloader._log_fh is handle
+
+    downloader.close()
+    downloader._log("third")
+    downloader.close()
+
+    lines = downloader.log_file.read_text(encoding="utf-8").splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["first", "second", "third"]
+
+
+def _lib_component() -> Component:
+    return Component(
+        {"bom-ref": "org.example:lib:1.0", "group": "org.example", "name": "lib", "version": "1.0"}
+    )
+
+
+def test_download_package_resumes_partial_download_with_range(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    body = _jar_bytes()
+    ranges = []
+
+    def fake_urlopen(req, timeout: int) -> _StreamedResponse:
+        ranges.append(req.get_header("Range"))
+        return _StreamedResponse(
+            body[10:],
+            status=206,
+            headers={"Content-Range": f"bytes 10-{len(body) - 1}/{len(body)}"},
+        )
+
+    monkeypatch.setattr(package_downloader, "urlopen", fake_urlopen)
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+    downloader._http = None
+    (downloader.jar_cache_dir / "org.example_lib_1.0.jar.part").write_bytes(body[:10])
+
+    assert downloader.download_package(_lib_component()) == ("org.example_lib_1.0.jar", False)
+    assert ranges == ["bytes=10-"]
+    assert (downloader.jar_cache_dir / "org.example_lib_1.0.jar").read_bytes() == body
+    assert not list(downloader.jar_cache_dir.glob("*.part"))
+
+
+def test_download_package_restarts_when_server_ignores_range(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    body = _jar_bytes()
+    downloader = _streaming_downloader(tmp_path, monkeypatch, body)
+    (downloader.jar_cache_dir / "org.example_lib_1.0.jar.part").write_bytes(b"stale bytes")
+
+    assert downloader.download_package(_lib_component()) == ("org.example_lib_1.0.jar", False)
+    assert (downloader.jar_cache_dir / "org.example_lib_1.0.jar").read_bytes() == body
+
+
+def test_download_package_keeps_partial_file_when_transfer_breaks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _BrokenResponse(_StreamedResponse):
+        def read(self, size: int = -1) -> bytes:
+            if self.tell() >= 16:
+                raise ConnectionResetError("connection reset")
+            return super().read(16 - self.tell() if size < 0 else min(size, 16 - self.tell()))
+
+    monkeypatch.setattr(
+        package_downloader, "urlopen", lambda _req, timeout: _BrokenResponse(_jar_bytes())
+    )
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+    downloader._http = None
+
+    assert downloader.download_package(_lib_component()) == (None, False)
+    assert (downloader.jar_cache_dir / "org.example_lib_1.0.jar.part").read_bytes() == (
+        _jar_bytes()[:16]
+    )
+
+
+def test_download_package_fetches_large_artifact_as_parallel_ranges(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as jar:
+        jar.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+        jar.writestr("data.bin", os.urandom(64 * 1024))
+    body = buffer.getvalue()
+    ranges = []
+
+    def fake_urlopen(req, timeout: int) -> _StreamedResponse:
+        requested = req.get_header("Range")
+        ranges.append(requested)
+        if requested is None:
+            return _StreamedResponse(
+                body, headers={"Accept-Ranges": "bytes", "Content-Length": str(len(body))}
+            )
+        start, end = (int(bound) for bound in requested.removeprefix("bytes=").split("-"))
+        return _StreamedResponse(
+            body[start : end + 1],
+            status=206,
+            headers={"Content-Range": f"bytes {start}-{end}/{len(body)}"},
+        )
+
+    monkeypatch.setattr(package_downloader, "_PARALLEL_RANGE_THRESHOLD", 1024)
+    monkeypatch.setattr(package_downloader, "urlopen", fake_urlopen)
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+    downloader._http = None
+
+    assert downloader.download_package(_lib_component()) == ("org.example_lib_1.0.jar", False)
+    assert (downloader.jar_cache_dir / "org.example_lib_1.0.jar").read_bytes() == body
+    assert ranges[0] is None
+    assert len(ranges) == package_downloader._PARALLEL_RANGE_PARTS
+
+
+def test_copy_from_maven_local_repo_links_or_copies_artifact(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    home = tmp_path / "home"
+    local_jar = home / ".m2" / "repository" / "org" / "example" / "lib" / "1.0" / "lib-1.0.jar"
+    local_jar.parent.mkdir(parents=True)
+    local_jar.write_bytes(_jar_bytes())
+    monkeypatch.setattr(package_downloader.Path, "home", lambda: home)
+    downloader = PackageDownloader(tmp_path / "cache", use_maven=False)
+    cached = downloader.jar_cache_dir / "org.example_lib_1.0.jar"
+
+    downloader._try_copy_from_maven_local_repo(_lib_component(), cached, "jar")
+    assert cached.read_bytes() == _jar_bytes()
+
+    def no_links(*_args: object) -> None:
+        raise OSError("cross-device link")
+
+    cached.unlink()
+    monkeypatch.setattr(package_downloader.os, "link", no_links)
+    downloader._try_copy_from_maven_local_repo(_lib_component(), cached, "jar")
+    assert cached.read_bytes() == _jar_bytes()
+
+
+def test_download_package_stops_reading_non_zip_body(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    response = _StreamedResponse(b"<html>" + b"x" * 100_000 + b"</html>")
+    monkeypatch.setattr(package_downloader, "urlopen", lambda _req, timeout: response)
+    downloader = PackageDownloader(tmp_path, use_maven=False)
+    downloader._http = None
+
+    assert downloader.download_package(_lib_component()) == (None, False)
+    assert response.closed
+    assert "Invalid ZIP magic bytes" in downloader.log_file.read_text(encoding="utf-8")
+    assert not list(downloader.jar_cache_dir.iterdir())
+
+
+def test_run_maven_returns_exit_code_and_output_tail() -> None:
+    script = (
+        "import sys; print('x' * 20000); "
+        "print('status code: 401', file=sys.stderr); sys.exit(1)"
+    )
+
+    returncode, tail = PackageDownloader._run_maven([sys.executable, "-c", script], timeout=30)
+
+    assert returncode == 1
+    assert "status code: 401" in tail
+    assert len(tail) <= package_downloader._MAVEN_OUTPUT_TAIL_BYTES
+
+
+def test_download_artifact_with_maven_reports_authentication_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    downloader = PackageDownloader(tmp_path)
+    downloader._maven_available = True
+    monkeypatch.setattr(
+        PackageDownloader,
+        "_run_maven",
+        staticmethod(lambda _cmd, timeout: (1, "status code: 401, reason phrase: Unauthorized")),
+    )
+
+    result = downloader._download_artifact_with_maven(
+        _lib_component(), downloader.jar_cache_dir / "lib.jar", "jar"
+    )
+
+    assert result == (None, True)
@@ -0,0 +1,74 @@
+"""
+Unit tests for the background parallel downloader.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from sbom_compile_order.parallel_downloader import ParallelDownloader
+from sbom_compile_order.parser import Component
+
+
+class _FakeArtifactDownloader:
+    use_maven = True
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    def bulk_download_with_maven(self, items: list[tuple[Component, str]]) -> dict:
+        self.calls.append(("bulk", [(comp.name, artifact_type) for comp, artifact_type in items]))
+        return {}
+
+    def download_package(self, component: Component, artifact_type: str) -> tuple:
+        self.calls.append(("single", component.name, artifact_type))
+        return f"{component.name}.{artifact_type}", False
+
+
+def _write_compile_order(path: Path) -> None:
+    path.write_text(
+        "Order,Group ID,Package Name,Version/Tag,PURL\n"
+        "1,org.example:base,base,1.0,pkg:maven/org.example/base@1.0\n"
+        "2,org.example:core,core,2.0,pkg:maven/org.example/core@2.0\n"
+        "3,,left-pad,1.3.0,pkg:npm/left-pad@1.3.0\n",
+        encoding="utf-8",
+    )
+
+
+def test_artifacts_are_resolved_with_one_maven_batch_first(tmp_path: Path) -> None:
+    compile_order = tmp_path / "compile-order.csv"
+    _write_compile_order(compile_order)
+    artifact_downloader = _FakeArtifactDownloader()
+    downloader = ParallelDownloader(
+        compile_order,
+        artifact_downloader=artifact_downloader,
+        artifact_types=["jar", "war"],
+    )
+
+    downloader.start_background_downloads().join(timeout=10)
+
+    assert artifact_downloader.calls[0] == (
+        "bulk",
+        [("base", "jar"), ("base", "war"), ("core", "jar"), ("core", "war")],
+    )
+    assert sorted(artifact_downloader.calls[1:]) == [
+        ("single", "base", "jar"),
+        ("single", "base", "war"),
+        ("single", "core", "jar"),
+        ("single", "core", "war"),
+    ]
+
+
+def test_artifacts_skip_maven_batch_when_maven_is_disabled(tmp_path: Path) -> None:
+    compile_order = tmp_path / "compile-order.csv"
+    _write_compile_order(compile_order)
+    artifact_downloader = _FakeArtifactDownloader()
+    artifact_downloader.use_maven = False
+    downloader = ParallelDownloader(compile_order, artifact_downloader=artifact_downloader)
+
+    downloader.start_background_downloads().join(timeout=10)
+
+    assert sorted(artifact_downloader.calls) == [
+        ("single", "base", "jar"),
+        ("single", "core", "jar"),
+    ]
@@ -10,6 +10,7 @@ from pathlib import Path
 import pytest
 
 from sbom_compile_order.parser import (
+    Component,
     SBOMParser,
     build_maven_central_url,
     build_maven_central_url_from_purl,
@@ -137,3 +138,32 @@ def test_sbom_parser_requires_file_exists(tmp_path: Path) -> None:
     parser = SBOMParser(tmp_path / "missing.json")
     with pytest.raises(FileNotFoundError):
         parser.parse()
+
+
+def test_component_precomputes_display_strings() -> None:
+    maven = Component({"group": "org.example", "name": "base", "version": "1.0"})
+    npm = Component({"name": "left-pad", "version": "1.3.0"})
+
+    assert maven.coordinates == "org.example:base:1.0"
+    assert maven.group_id == "org.example:base"
+    assert maven.get_identifier() == "org.example:base:1.0"
+    assert npm.group_id == "left-pad"
+    assert Component({"bom-ref": "ref-1", "purl": "pkg:npm/x@1"}).get_identifier() == "ref-1"
+    assert Component({"purl": "pkg:npm/x@1"}).get_identifier() == "pkg:npm/x@1"
+
+
+def test_components_share_interned_group_strings() -> None:
+    first = Component({"group": "".join(["org.", "example"]), "name": "base", "version": "1.0"})
+    second = Component({"group": "".join(["org.exam", "ple"]), "name": "base", "version": "2.0"})
+
+    assert first.group is second.group
+    assert first.group_id is second.group_id
+
+
+def test_component_cache_key_strips_query_and_unsafe_characters() -> None:
+    maven = Component({"bom-ref": "pkg:maven/org.example/base@1.0?type=jar#src"})
+    scoped = Component({"purl": "pkg:npm/%40scope/pkg@2.0"})
+
+    assert maven.get_cache_key() == "pkg_maven_org.example_base_1.0"
+    assert scoped.get_cache_key() == "pkg_npm_%40scope_pkg_2.0"
+    assert Component({"group": "g", "name": "a", "version": "1"}).get_cache_key() == "g_a_1"
@@ -0,0 +1,94 @@
+"""
+Unit tests for the per-host leaky-bucket rate limiter.
+"""
+
+from __future__ import annotations
+
+from email.message import Message
+from urllib.error import HTTPError
+
+import pytest
+
+from sbom_compile_order import rate_limiter
+from sbom_compile_order.rate_limiter import LeakyBucket, retry_with_backoff
+
+
+def _http_error(code: int, retry_after: str | None = None) -> HTTPError:
+    headers = Message()
+    if retry_after is not None:
+        headers["Retry-After"] = retry_after
+    return HTTPError("https://example.invalid", code, "error", headers, None)
+
+
+def test_leaky_bucket_admits_burst_without_sleeping(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleeps.append)
+    bucket = LeakyBucket(rate_per_sec=1.0, capacity=3)
+
+    for _ in range(3):
+        assert bucket.acquire() == 0.0
+
+    assert sleeps == []
+
+
+def test_leaky_bucket_throttles_once_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleeps.append)
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: 100.0)
+    bucket = LeakyBucket(rate_per_sec=2.0, capacity=1)
+
+    bucket.acquire()
+    bucket.acquire()
+
+    assert sleeps == [pytest.approx(0.5)]
+
+
+def test_leaky_bucket_rejects_invalid_rate() -> None:
+    with pytest.raises(ValueError):
+        LeakyBucket(rate_per_sec=0, capacity=1)
+
+
+def test_retry_with_backoff_honours_retry_after_and_penalizes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleeps.append)
+    monkeypatch.setattr(rate_limiter.random, "random", lambda: 0.0)
+    bucket = LeakyBucket(rate_per_sec=1.0, capacity=5)
+    responses = [_http_error(429, retry_after="7"), "ok"]
+
+    def request() -> str:
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert retry_with_backoff(request, bucket) == "ok"
+    assert sleeps == [7.0]
+    assert bucket.acquire() > 0
+
+
+def test_retry_with_backoff_does_not_retry_client_errors() -> None:
+    calls = []
+
+    def request() -> None:
+        calls.append(1)
+        raise _http_error(404)
+
+    with pytest.raises(HTTPError):
+        retry_with_backoff(request)
+    assert len(calls) == 1
+
+
+def test_leaky_bucket_halves_rate_on_throttle_and_recovers_on_success() -> None:
+    bucket = LeakyBucket(rate_per_sec=20.0, capacity=5, min_rate_per_sec=4.0)
+
+    bucket.penalize()
+    assert bucket.rate_per_sec == 10.0
+    bucket.penalize()
+    bucket.penalize()
+    assert bucket.rate_per_sec == 4.0
+
+    for _ in range(100):
+        bucket.record_success()
+    assert bucket.rate_per_sec == 20.0
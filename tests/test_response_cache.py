@@ -0,0 +1,32 @@
+"""
+Unit tests for the SQLite-backed registry response cache.
+"""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+from sbom_compile_order.maven_central import MavenCentralClient
+from sbom_compile_order.response_cache import SQLiteResponseCache
+
+
+def test_response_cache_round_trips_across_instances(tmp_path: Path) -> None:
+    db_path = tmp_path / "cache.sqlite"
+    SQLiteResponseCache(db_path).set("g:org.example AND a:base:False", {"response": {"docs": []}})
+
+    assert SQLiteResponseCache(db_path).get("g:org.example AND a:base:False") == {
+        "response": {"docs": []}
+    }
+    assert SQLiteResponseCache(db_path).get("missing") is None
+
+
+def test_maven_central_client_is_picklable_with_shared_cache(tmp_path: Path) -> None:
+    client = MavenCentralClient(cache_path=tmp_path / "maven.sqlite")
+    client._persistent_cache.set("query:True", {"response": {"docs": [{"id": "a:b:1"}]}})
+
+    clone = pickle.loads(pickle.dumps(client))
+
+    assert clone._make_request("query", use_gav_core=True) == {
+        "response": {"docs": [{"id": "a:b:1"}]}
+    }